@@ -0,0 +1,82 @@
+"""Micro-benchmark for converting response keys to snake case.
+
+Compares the memoized, iterative `camel_to_snake_dict` with the previous
+recursive version that ran the regex for every key, on payloads recorded
+in the test cassettes. Every payload here is still converted with
+`camel_to_snake_dict` by its class's `get`; responses decoded with
+`loads(snake_case=True)`, such as sleep and heart rate, are covered by
+`decode.py`.
+
+    python benchmarks/camel_to_snake.py
+"""
+
+import timeit
+from typing import Any
+
+from cassettes import load
+
+from garth.utils import CAMEL_TO_SNAKE, camel_to_snake_dict
+
+
+# DailySummary.get, Activity.get and TrainingReadinessData.get
+PAYLOADS = {
+    "dailySummary": (
+        "test_daily_summary_get.yaml",
+        "/usersummary-service/usersummary/daily/",
+    ),
+    "activity": ("test_activity_get.yaml", "/activity-service/activity/"),
+    "trainingReadiness": (
+        "test_training_readiness_data_get.yaml",
+        "/metrics-service/metrics/trainingreadiness/2025-07-07",
+    ),
+}
+
+
+def uncached_camel_to_snake(camel_str: str) -> str:
+    return CAMEL_TO_SNAKE.sub(r"_\1", camel_str).lower()
+
+
+def recursive_camel_to_snake_dict(
+    camel_dict: dict[str, Any],
+) -> dict[str, Any]:
+    snake_dict: dict[str, Any] = {}
+    for k, v in camel_dict.items():
+        new_key = uncached_camel_to_snake(k)
+        if isinstance(v, dict):
+            snake_dict[new_key] = recursive_camel_to_snake_dict(v)
+        elif isinstance(v, list):
+            snake_dict[new_key] = [
+                recursive_camel_to_snake_dict(i) if isinstance(i, dict) else i
+                for i in v
+            ]
+        else:
+            snake_dict[new_key] = v
+    return snake_dict
+
+
+def main():
+    for name, (cassette, path) in PAYLOADS.items():
+        payload = load(cassette, path)
+        if isinstance(payload, list):
+            # TrainingReadinessData converts each entry
+            payload = payload[0]
+        assert camel_to_snake_dict(payload) == recursive_camel_to_snake_dict(
+            payload
+        )
+        number = 2000
+        before = min(
+            timeit.repeat(
+                lambda: recursive_camel_to_snake_dict(payload), number=number
+            )
+        )
+        after = min(
+            timeit.repeat(lambda: camel_to_snake_dict(payload), number=number)
+        )
+        print(
+            f"{name}: {before / number * 1e6:.1f} us -> "
+            f"{after / number * 1e6:.1f} us ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
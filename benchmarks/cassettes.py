@@ -0,0 +1,26 @@
+"""Recorded responses from the test cassettes, for benchmarks."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+CASSETTES = Path(__file__).parent.parent / "tests" / "data" / "cassettes"
+
+
+def load(cassette: str, path: str) -> Any:
+    """Decoded body of the first response in `cassette` for a URI
+    containing `path`."""
+    return json.loads(body(cassette, path))
+
+
+def body(cassette: str, path: str) -> bytes:
+    """Raw body of the first response in `cassette` for a URI containing
+    `path`."""
+    interactions = yaml.safe_load((CASSETTES / cassette).read_text())
+    for interaction in interactions["interactions"]:
+        if path in interaction["request"]["uri"]:
+            return interaction["response"]["body"]["string"].encode()
+    raise LookupError(f"No response for {path} in {cassette}")
@@ -0,0 +1,63 @@
+"""Micro-benchmark for building data classes from recorded payloads, with
+pydantic validation and in trusted mode (`Data.list(validate=False)`).
+
+    python benchmarks/construction.py
+"""
+
+import timeit
+
+from cassettes import load
+
+from garth import (
+    Activity,
+    DailyBodyBatteryStress,
+    DailyHeartRate,
+    DailySleepData,
+    HRVData,
+    SleepData,
+    WeightData,
+)
+from garth.utils import (
+    build,
+    camel_to_snake_dict,
+    remove_dto_suffix_from_dict,
+    trusted,
+)
+
+
+PAYLOADS = {
+    DailyHeartRate: ("test_daily_heart_rate_get.yaml", "/dailyHeartRate"),
+    DailyBodyBatteryStress: (
+        "test_daily_body_battery_stress_get.yaml",
+        "/dailyStress",
+    ),
+    SleepData: ("test_sleep_data_get.yaml", "/dailySleepData"),
+    DailySleepData: ("test_daily_sleep_data_get.yaml", "/dailySleepData"),
+    HRVData: ("test_hrv_data_get.yaml", "/hrv-service/hrv/"),
+    WeightData: ("test_get_daily_weight_data.yaml", "/weight-service/"),
+    Activity: ("test_activity_get.yaml", "/activity-service/activity/"),
+}
+
+
+def main():
+    for cls, (cassette, path) in PAYLOADS.items():
+        data = load(cassette, path)
+        if cls is WeightData:
+            data = data["dateWeightList"][0]
+        data = camel_to_snake_dict(data)
+        if cls is Activity:
+            data = remove_dto_suffix_from_dict(data)
+        with trusted():
+            assert build(cls, data) == cls(**data)
+        number = 1000
+        validated = min(timeit.repeat(lambda: build(cls, data), number=number))
+        with trusted():
+            fast = min(timeit.repeat(lambda: build(cls, data), number=number))
+        print(
+            f"{cls.__name__}: {number / validated:,.0f}/s validated, "
+            f"{number / fast:,.0f}/s trusted ({validated / fast:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
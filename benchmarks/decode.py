@@ -0,0 +1,56 @@
+"""Micro-benchmark for decoding connectapi responses with snake_case keys.
+
+Compares `json.loads` followed by `camel_to_snake_dict`, which parsers
+used before `connectapi(snake_case=True)`, with `loads(snake_case=True)`
+with and without orjson, on payloads recorded in the test cassettes.
+
+    python benchmarks/decode.py
+"""
+
+import json
+import timeit
+from unittest import mock
+
+from cassettes import body
+
+import garth.utils
+from garth.utils import camel_to_snake_dict, loads
+
+
+PAYLOADS = {
+    "dailyHeartRate": ("test_daily_heart_rate_get.yaml", "/dailyHeartRate"),
+    "dailyStress": (
+        "test_daily_body_battery_stress_get.yaml",
+        "/dailyStress",
+    ),
+    "dailySleepData": (
+        "test_daily_sleep_data_get.yaml",
+        "/sleep-service/sleep/dailySleepData",
+    ),
+}
+
+
+def main():
+    for name, (cassette, path) in PAYLOADS.items():
+        content = body(cassette, path)
+        expected = camel_to_snake_dict(json.loads(content))
+        assert loads(content, snake_case=True) == expected
+        number = 500
+
+        def timed(fn):
+            return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+        before = timed(lambda: camel_to_snake_dict(json.loads(content)))
+        with mock.patch.object(garth.utils, "orjson", None):
+            assert loads(content, snake_case=True) == expected
+            stdlib = timed(lambda: loads(content, snake_case=True))
+        fast = timed(lambda: loads(content, snake_case=True))
+        print(
+            f"{name}: {before * 1e6:.1f} us -> json {stdlib * 1e6:.1f} us "
+            f"({before / stdlib:.1f}x), orjson {fast * 1e6:.1f} us "
+            f"({before / fast:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
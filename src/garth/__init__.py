@@ -15,7 +15,8 @@ from .data import (
     TrainingReadinessData,
     WeightData,
 )
-from .http import Client, client
+from .http import AsyncClient, Client, client
+from .pool import ClientPool
 from .stats import (
     DailyHRV,
     DailyHydration,
@@ -44,8 +45,10 @@ warnings.warn(
 
 __all__ = [
     "Activity",
+    "AsyncClient",
     "BodyBatteryData",
     "Client",
+    "ClientPool",
     "DailyBodyBatteryStress",
     "DailyHeartRate",
     "DailyHRV",
@@ -0,0 +1,214 @@
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from .utils import connect_sqlite
+
+
+# Wellness data for a day rarely changes once the day is a few days old.
+# TTLs apply to recent days; settled days are governed by `settled_ttl`.
+DEFAULT_TTLS: dict[str, float] = {
+    r"^/wellness-service/wellness/dailyHeartRate": 300,
+    r"^/wellness-service/wellness/dailySleepData": 300,
+    r"^/wellness-service/wellness/dailyStress": 300,
+    r"^/hrv-service/hrv/": 300,
+    r"^/sleep-service/sleep/dailySleepData": 300,
+    r"^/usersummary-service/usersummary/daily": 300,
+    r"^/usersummary-service/stats/": 300,
+    r"^/userprofile-service/socialProfile": 3600,
+    r"^/userprofile-service/userprofile/user-settings": 3600,
+}
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def request_day(
+    path: str, params: dict[str, Any] | None = None
+) -> date | None:
+    """Latest date in a request's path or params, if any."""
+    text = " ".join([path, *(str(v) for v in (params or {}).values())])
+    days = []
+    for match in _DATE.findall(text):
+        try:
+            days.append(date.fromisoformat(match))
+        except ValueError:
+            continue
+    return max(days) if days else None
+
+
+@dataclass
+class CachePolicy:
+    """Decides how long a GET response may be served from cache.
+
+    Args:
+        ttls: Seconds to cache responses for paths matching each regex.
+            Paths that don't match aren't cached.
+        settle_days: Days after which a day's data is considered final.
+        settled_ttl: Seconds to cache responses for settled days, or
+            None to keep them until evicted.
+    """
+
+    ttls: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+    settle_days: int = 3
+    settled_ttl: float | None = None
+
+    def ttl(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        today: date | None = None,
+    ) -> float | None:
+        """TTL in seconds for a request, 0 to skip caching, None for no
+        expiry."""
+        for pattern, ttl in self.ttls.items():
+            if re.search(pattern, path):
+                break
+        else:
+            return 0
+        day = request_day(path, params)
+        today = today or date.today()
+        if day is not None and (today - day).days > self.settle_days:
+            return self.settled_ttl
+        return ttl
+
+
+class ResponseCache(ABC):
+    """Storage for raw connectapi response bodies.
+
+    Subclasses implement `_get` and `_set`; hit and miss counts are kept
+    here.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None):
+        """Store `value`, expiring after `ttl` seconds (None: never)."""
+        expires_at = None if ttl is None else time.time() + ttl
+        self._set(key, value, expires_at)
+
+    @abstractmethod
+    def _get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, expires_at: float | None): ...
+
+    @abstractmethod
+    def clear(self): ...
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU response cache bounded by total body size.
+
+    The least recently used entries are evicted once the cached bodies
+    exceed `max_bytes`; expired entries are dropped when read.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: bytes, expires_at: float | None):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, expires_at)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SQLiteCache(ResponseCache):
+    """Response cache persisted in a SQLite database.
+
+    Safe to share between threads and across runs, which makes it a good
+    fit for backfills that revisit the same historical days.
+    """
+
+    def __init__(self, path: str = "~/.garth/cache.sqlite"):
+        super().__init__()
+        self.path, self._conn = connect_sqlite(path)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return value
+
+    def _set(self, key: str, value: bytes, expires_at: float | None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -13,10 +13,12 @@ __all__ = [
     "MorningTrainingReadinessData",
     "SleepData",
     "StressReading",
+    "TimeSeries",
     "TrainingReadinessData",
     "WeightData",
 ]
 
+from ._series import TimeSeries
 from .activity import Activity
 from .body_battery import (
     BodyBatteryData,
@@ -1,19 +1,49 @@
+import asyncio
 import builtins
+import inspect
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-from datetime import date
-from itertools import chain
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from functools import cache
+from itertools import chain, islice
+from typing import Any, ClassVar
 
 from typing_extensions import Self
 
 from .. import http
-from ..utils import date_range, format_end_date
+from ..utils import (
+    _snake_case_keys,
+    bounded_map,
+    client_executor,
+    date_range,
+    deferred,
+    format_end_date,
+    trusted,
+)
+from ..warehouse import Warehouse
 
 
+# Days fetched at once for clients without a `max_workers` setting
 MAX_WORKERS = 10
 
 
 class Data(ABC):
+    # Subclasses whose API returns a date range in one response set this
+    # to the most days to request at once and implement `_get_range`.
+    # Otherwise `list` fetches one day per request.
+    _range_days: ClassVar[int | None] = None
+    # `_get_range(start, end, *, client)`: every day from `start` to `end`
+    # in a single request
+    _get_range: ClassVar[Callable[..., builtins.list[Any]]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._range_days and not hasattr(cls, "_get_range"):
+            raise TypeError(
+                f"{cls.__name__} sets _range_days but doesn't implement "
+                "_get_range"
+            )
+
     @classmethod
     @abstractmethod
     def get(
@@ -30,22 +60,188 @@ class Data(ABC):
         days: int = 1,
         *,
         client: http.Client | None = None,
-        max_workers: int = MAX_WORKERS,
+        max_workers: int | None = None,
+        validate: bool = True,
+        lazy: bool = False,
+        warehouse: Warehouse | None = None,
     ) -> builtins.list[Self]:
+        """Fetch `days` days ending on `end` using the client's worker pool.
+
+        `max_workers` limits how many of those days are fetched at once;
+        it defaults to the client's `max_workers`. With `validate=False`,
+        responses are trusted and built without validation (see
+        `utils.trusted`), which is faster for large backfills. With
+        `lazy=True`, nested objects and lists are built the first time
+        they're read (see `utils.deferred`). With a `warehouse`, days
+        already stored are read from it and only missing days are fetched.
+        """
         client = client or http.client
         end = format_end_date(end)
+        if warehouse is not None:
+            return warehouse.list(
+                cls,
+                end,
+                days,
+                client=client,
+                max_workers=max_workers,
+                validate=validate,
+                lazy=lazy,
+            )
+
+        def fetch_span(span):
+            with trusted(not validate), deferred(lazy):
+                return cls._get_span(*span, client=client)
+
+        with client_executor(client, max_workers, MAX_WORKERS) as (
+            executor,
+            limit,
+        ):
+            data = list(
+                bounded_map(executor, fetch_span, cls._spans(end, days), limit)
+            )
+        return cls._flatten(data)
+
+    @classmethod
+    def stream(
+        cls,
+        end: date | str | None = None,
+        days: int = 1,
+        *,
+        client: http.Client | None = None,
+        max_workers: int | None = None,
+        ordered: bool = True,
+        validate: bool = True,
+        lazy: bool = False,
+        newest_first: bool = False,
+    ) -> Iterator[Self]:
+        """Yield parsed days as they're fetched instead of building a list.
+
+        With `ordered` (the default), days are yielded oldest first, or
+        newest first with `newest_first`; set `ordered` to false to yield
+        each day as soon as it completes. At most `max_workers` days are
+        held in memory at once.
+        """
+        client = client or http.client
+        end = format_end_date(end)
+        spans = cls._spans(end, days)
+
+        def fetch_span(span):
+            with trusted(not validate), deferred(lazy):
+                return cls._flatten([cls._get_span(*span, client=client)])
+
+        with client_executor(client, max_workers, MAX_WORKERS) as (
+            executor,
+            limit,
+        ):
+            for span in bounded_map(
+                executor,
+                fetch_span,
+                spans if newest_first else reversed(spans),
+                limit,
+                ordered=ordered,
+            ):
+                yield from reversed(span) if newest_first else span
+
+    @classmethod
+    async def aget(
+        cls,
+        day: date | str | None = None,
+        *,
+        client: http.AsyncClient,
+        **kwargs,
+    ) -> Self | builtins.list[Self] | None:
+        """Async variant of `get`."""
+        return await client.run(lambda c: cls.get(day, client=c, **kwargs))
+
+    @classmethod
+    async def alist(
+        cls,
+        end: date | str | None = None,
+        days: int = 1,
+        *,
+        client: http.AsyncClient,
+        validate: bool = True,
+        lazy: bool = False,
+    ) -> builtins.list[Self]:
+        """Async variant of `list`.
+
+        All days are requested at once; concurrency is bounded by the
+        client's `max_connections`. `validate` and `lazy` work as in
+        `list`.
+        """
+        end = format_end_date(end)
+
+        def fetch_span(span, c):
+            with trusted(not validate), deferred(lazy):
+                return cls._get_span(*span, client=c)
 
-        def fetch_date(date_):
-            if day := cls.get(date_, client=client):
-                return day
+        data = await asyncio.gather(
+            *(
+                client.run(lambda c, span=span: fetch_span(span, c))
+                for span in cls._spans(end, days)
+            )
+        )
+        return cls._flatten(data)
 
-        dates = date_range(end, days)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            data = list(executor.map(fetch_date, dates))
-            data = [day for day in data if day is not None]
+    @classmethod
+    def _spans(cls, end: date, days: int) -> builtins.list[tuple[date, date]]:
+        """`(start, end)` date ranges covering `days` days ending on `end`,
+        newest first: one per request."""
+        step = cls._range_days or 1
+        first = end - timedelta(days=days - 1)
+        return [
+            (max(last - timedelta(days=step - 1), first), last)
+            for last in islice(date_range(end, days), 0, None, step)
+        ]
 
-        return list(
-            chain.from_iterable(
-                day if isinstance(day, list) else [day] for day in data
+    @classmethod
+    def _get_span(
+        cls, start: date, end: date, *, client: http.Client
+    ) -> Self | builtins.list[Self] | None:
+        if cls._range_days:
+            return cls._get_range(start, end, client=client)
+        return cls.get(end, client=client)
+
+    @classmethod
+    def _flatten(cls, data) -> builtins.list[Self]:
+        data = [day for day in data if day]
+        return cls._sorted(
+            list(
+                chain.from_iterable(
+                    day if isinstance(day, list) else [day] for day in data
+                )
             )
         )
+
+    @classmethod
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
+        """Order the results of `list`. Override in subclasses."""
+        return data
+
+    @classmethod
+    def _calendar_date(cls, item: Self) -> date | None:
+        """Day an entry belongs to. Override in subclasses without a
+        `calendar_date` field."""
+        return getattr(item, "calendar_date", None)
+
+
+def connectapi_snake_case(client: http.Client, path: str, **kwargs) -> Any:
+    """`client.connectapi(path)` with keys in snake case.
+
+    Clients whose `connectapi` takes `snake_case` convert keys while
+    decoding. Any other client, such as a duck-typed one or a subclass
+    that overrides `connectapi` without it, is called as before and keys
+    are converted afterwards.
+    """
+    if _takes_snake_case(type(client)):
+        return client.connectapi(path, snake_case=True, **kwargs)
+    return _snake_case_keys(client.connectapi(path, **kwargs))
+
+
+@cache
+def _takes_snake_case(cls: type) -> bool:
+    try:
+        parameters = inspect.signature(cls.connectapi).parameters  # type: ignore[attr-defined]
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return "snake_case" in parameters
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Any, Literal
+
+from ..exc import GarthException
+
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+    NUMPY_AVAILABLE = False
+
+
+Aggregate = Literal["mean", "min", "max"]
+
+
+class TimeSeries:
+    """Samples stored as two compact arrays instead of a list of lists.
+
+    `timestamps` holds milliseconds since the epoch (UTC) as int64 and
+    `values` holds one value per timestamp, as int16 by default. That's 10
+    bytes a sample, so a year of 2-minute heart rate readings takes about
+    2.5 MB. Samples are kept in time order. Aggregations use NumPy when
+    it's installed.
+
+    Columns are `array`s, or `memoryview`s of them for a series returned
+    by `window`, which shares memory with the series it was taken from.
+    """
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(
+        self, timestamps: array | memoryview, values: array | memoryview
+    ):
+        assert len(timestamps) == len(values), "Column lengths differ"
+        self.timestamps = timestamps
+        self.values = values
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        column: int = 1,
+        typecode: str = "h",
+        min_value: float | None = None,
+    ) -> TimeSeries:
+        """Build a series from `[timestamp, value, ...]` rows.
+
+        Rows that are too short or missing the timestamp or value are
+        skipped, as are values below `min_value`. Rows are sorted by
+        timestamp if they aren't already.
+        """
+        timestamps, values = array("q"), array(typecode)
+        ordered = True
+        for row in rows:
+            if len(row) <= column:
+                continue
+            ts, value = row[0], row[column]
+            if ts is None or value is None:
+                continue
+            if min_value is not None and value < min_value:
+                continue
+            if timestamps and ts < timestamps[-1]:
+                ordered = False
+            timestamps.append(ts)
+            values.append(value)
+        if not ordered:
+            pairs = sorted(zip(timestamps, values))
+            timestamps = array("q", (ts for ts, _ in pairs))
+            values = array(typecode, (value for _, value in pairs))
+        return cls(timestamps, values)
+
+    @classmethod
+    def concat(cls, series: Iterable[TimeSeries]) -> TimeSeries:
+        """Join series end to end, such as the days returned by `list`."""
+        series = list(series)
+        typecode = _typecode(series[0].values) if series else "h"
+        timestamps, values = array("q"), array(typecode)
+        for s in series:
+            timestamps.extend(s.timestamps)
+            values.extend(s.values)
+        return cls(timestamps, values)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[tuple[datetime, int | float]]:
+        for ts, value in zip(self.timestamps, self.values):
+            yield datetime.fromtimestamp(ts / 1000, tz=timezone.utc), value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TimeSeries):
+            return NotImplemented
+        return (
+            self.timestamps == other.timestamps and self.values == other.values
+        )
+
+    def __repr__(self) -> str:
+        return f"TimeSeries({len(self)} samples)"
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.timestamps) * self.timestamps.itemsize
+            + len(self.values) * self.values.itemsize
+        )
+
+    def window(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> TimeSeries:
+        """Samples from `start` up to, but not including, `end`.
+
+        The result is a view that shares memory with this series. Naive
+        datetimes are taken as UTC.
+        """
+        lo = 0 if start is None else bisect_left(self.timestamps, _ms(start))
+        hi = (
+            len(self)
+            if end is None
+            else bisect_left(self.timestamps, _ms(end), lo)
+        )
+        return TimeSeries(
+            memoryview(self.timestamps)[lo:hi],
+            memoryview(self.values)[lo:hi],
+        )
+
+    def min(self) -> int | float | None:
+        return min(self.values) if len(self) else None
+
+    def max(self) -> int | float | None:
+        return max(self.values) if len(self) else None
+
+    def first(self) -> int | float | None:
+        return self.values[0] if len(self) else None
+
+    def last(self) -> int | float | None:
+        return self.values[-1] if len(self) else None
+
+    def change(self) -> int | float | None:
+        """Difference between the last and first values, if there are at
+        least two."""
+        if len(self) < 2:
+            return None
+        return self.values[-1] - self.values[0]
+
+    def mean(self) -> float | None:
+        if not len(self):
+            return None
+        if np is not None:
+            return float(self._numpy_values().mean())
+        return sum(self.values) / len(self)
+
+    def resample(
+        self, interval: timedelta, how: Aggregate = "mean"
+    ) -> TimeSeries:
+        """Aggregate samples into buckets of `interval`, aligned to the
+        epoch and labeled by their start time. Mean values are floats."""
+        step = int(interval.total_seconds() * 1000)
+        assert step > 0, "interval must be positive"
+        typecode = "d" if how == "mean" else _typecode(self.values)
+        if not len(self):
+            return TimeSeries(array("q"), array(typecode))
+        if np is not None:
+            ts = np.frombuffer(self.timestamps, dtype=np.int64)
+            values = self._numpy_values()
+            buckets = ts - ts % step
+            # Start of each run of samples in the same bucket
+            starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+            if how == "mean":
+                counts = np.diff(np.append(starts, len(values)))
+                result = np.add.reduceat(values, starts, dtype=np.float64)
+                result = result / counts
+            elif how == "min":
+                result = np.minimum.reduceat(values, starts)
+            else:
+                result = np.maximum.reduceat(values, starts)
+            return TimeSeries(
+                array("q", buckets[starts].tobytes()),
+                array(typecode, result.tobytes()),
+            )
+        aggregate = {
+            "mean": lambda v: sum(v) / len(v),
+            "min": min,
+            "max": max,
+        }[how]
+        timestamps, values = array("q"), array(typecode)
+        for bucket, samples in groupby(
+            zip(self.timestamps, self.values), key=lambda s: s[0] - s[0] % step
+        ):
+            timestamps.append(bucket)
+            values.append(aggregate([value for _, value in samples]))
+        return TimeSeries(timestamps, values)
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """Timestamps as `datetime64[ms]` and values as NumPy arrays,
+        sharing memory with the series."""
+        if np is None:  # pragma: no cover
+            raise GarthException(
+                msg="numpy is required for to_numpy: pip install garth[numpy]"
+            )
+        return (
+            np.frombuffer(self.timestamps, dtype="datetime64[ms]"),
+            self._numpy_values(),
+        )
+
+    def _numpy_values(self) -> Any:
+        return np.frombuffer(self.values, dtype=_typecode(self.values))
+
+
+def _typecode(column: array | memoryview) -> str:
+    return column.typecode if isinstance(column, array) else column.format
+
+
+def _ms(when: datetime) -> int:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return int(when.timestamp() * 1000)
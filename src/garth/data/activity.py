@@ -7,7 +7,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, remove_dto_suffix_from_dict
+from ..utils import build, camel_to_snake_dict, remove_dto_suffix_from_dict
 
 
 @dataclass
@@ -167,7 +167,7 @@ class Activity:
         )
         data = camel_to_snake_dict(data)
         data = remove_dto_suffix_from_dict(data)
-        return cls(**data)
+        return build(cls, data)
 
     @classmethod
     def list(
@@ -196,7 +196,7 @@ class Activity:
         activities = []
         for item in data:
             item = camel_to_snake_dict(item)
-            activities.append(cls(**item))
+            activities.append(build(cls, item))
         return activities
 
     @classmethod
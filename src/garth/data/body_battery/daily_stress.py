@@ -6,8 +6,9 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from ... import http
-from ...utils import camel_to_snake_dict, format_end_date
-from .._base import Data
+from ...utils import build, format_end_date
+from .._base import Data, connectapi_snake_case
+from .._series import TimeSeries
 from .readings import (
     BodyBatteryReading,
     StressReading,
@@ -38,36 +39,51 @@ class DailyBodyBatteryStress(Data):
         """Convert body battery values array to structured readings."""
         return parse_body_battery_readings(self.body_battery_values_array)
 
-    @property
+    @cached_property
     def stress_readings(self) -> list[StressReading]:
         """Convert stress values array to structured readings."""
         return parse_stress_readings(self.stress_values_array)
 
+    @cached_property
+    def body_battery_series(self) -> TimeSeries:
+        """Body Battery levels as compact timestamp and level arrays."""
+        return TimeSeries.from_rows(
+            (
+                values
+                for values in self.body_battery_values_array or []
+                if len(values) >= 4 and values[1] is not None
+            ),
+            column=2,
+        )
+
+    @cached_property
+    def stress_series(self) -> TimeSeries:
+        """Stress levels as compact timestamp and level arrays.
+
+        Negative values, which Garmin uses for off-wrist or too active to
+        measure, are left out.
+        """
+        return TimeSeries.from_rows(self.stress_values_array, min_value=0)
+
     @property
     def current_body_battery(self) -> int | None:
         """Get the latest Body Battery level."""
-        readings = self.body_battery_readings
-        return readings[-1].level if readings else None
+        return self.body_battery_series.last()
 
     @property
     def max_body_battery(self) -> int | None:
         """Get the maximum Body Battery level for the day."""
-        readings = self.body_battery_readings
-        return max(reading.level for reading in readings) if readings else None
+        return self.body_battery_series.max()
 
     @property
     def min_body_battery(self) -> int | None:
         """Get the minimum Body Battery level for the day."""
-        readings = self.body_battery_readings
-        return min(reading.level for reading in readings) if readings else None
+        return self.body_battery_series.min()
 
     @property
     def body_battery_change(self) -> int | None:
         """Calculate the Body Battery change for the day."""
-        readings = self.body_battery_readings
-        if not readings or len(readings) < 2:
-            return None
-        return readings[-1].level - readings[0].level
+        return self.body_battery_series.change()
 
     @classmethod
     def get(
@@ -81,10 +97,9 @@ class DailyBodyBatteryStress(Data):
         date_str = format_end_date(day)
 
         path = f"/wellness-service/wellness/dailyStress/{date_str}"
-        response = client.connectapi(path)
+        response = connectapi_snake_case(client, path)
 
         if not isinstance(response, dict):
             return None
 
-        snake_response = camel_to_snake_dict(response)
-        return cls(**snake_response)
+        return build(cls, response)
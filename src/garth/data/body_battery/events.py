@@ -36,6 +36,8 @@ class BodyBatteryData(Data):
     average_stress: float | None = None
     stress_values_array: list[list[int]] | None = None
     body_battery_values_array: list[list[Any]] | None = None
+    # The day requested, which a sleep event can start the evening before
+    calendar_date: date | None = None
 
     @property
     def body_battery_readings(self) -> list[BodyBatteryReading]:
@@ -193,6 +195,7 @@ class BodyBatteryData(Data):
                         average_stress=avg_stress,
                         stress_values_array=stress_values,
                         body_battery_values_array=battery_values,
+                        calendar_date=day,
                     )
                 )
 
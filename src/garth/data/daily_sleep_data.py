@@ -8,8 +8,8 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
-from ._base import Data
+from ..utils import build, format_end_date
+from ._base import Data, connectapi_snake_case
 
 
 @dataclass
@@ -133,20 +133,22 @@ class DailySleepData(Data):
         client = client or http.client
         day = format_end_date(day)
         path = f"/sleep-service/sleep/dailySleepData?date={day}"
-        data = client.connectapi(path)
+        data = connectapi_snake_case(client, path)
         assert isinstance(data, dict)
-        data = camel_to_snake_dict(data)
 
         if not data["daily_sleep_dto"].get("id"):
             return None
 
-        return cls(**data)
+        return build(cls, data)
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda x: x.daily_sleep_dto.calendar_date)
 
+    @classmethod
+    def _calendar_date(cls, item: Self) -> date:
+        return item.daily_sleep_dto.calendar_date
+
     @property
     def sleep_need_minutes(self) -> int | None:
         """Get the sleep need in minutes for this day."""
@@ -4,7 +4,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from ..utils import build, camel_to_snake_dict, format_end_date
 from ._base import Data
 
 
@@ -61,4 +61,4 @@ class DailySummary(Data):
             f"Expected dict from {path}, got {type(daily_summary).__name__}"
         )
         daily_summary = camel_to_snake_dict(daily_summary)
-        return cls(**daily_summary)
+        return build(cls, daily_summary)
@@ -8,7 +8,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from ..utils import build, camel_to_snake_dict, format_end_date
 
 
 @dataclass
@@ -79,6 +79,6 @@ class FitnessActivity:
         activities = []
         for item in data:
             item = camel_to_snake_dict(item)
-            activities.append(cls(**item))
+            activities.append(build(cls, item))
 
         return sorted(activities, key=lambda x: x.start_local)
@@ -5,7 +5,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from ..utils import build, camel_to_snake_dict, format_end_date
 from ._base import Data
 
 
@@ -77,9 +77,8 @@ class GarminScoresData(Data):
 
         data = {**data_hill_score, **data_endurance_score}
 
-        return cls(**data)
+        return build(cls, data)
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda d: d.calendar_date)
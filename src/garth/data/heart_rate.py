@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import builtins
 from datetime import date, datetime, timezone
+from functools import cached_property
 
 from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
-from ._base import Data
+from ..utils import build, format_end_date
+from ._base import Data, connectapi_snake_case
+from ._series import TimeSeries
 
 
 @dataclass
@@ -34,6 +36,8 @@ class DailyHeartRate(Data):
         145
         >>> len(hr.readings)
         720
+        >>> hr.series.mean()
+        68.4
     """
 
     user_profile_pk: int
@@ -64,6 +68,15 @@ class DailyHeartRate(Data):
             if ts is not None and hr is not None
         ]
 
+    @cached_property
+    def series(self) -> TimeSeries:
+        """Heart rate readings as compact timestamp and value arrays.
+
+        Readings where heart rate is None are skipped. Join days with
+        `TimeSeries.concat` to aggregate over a longer range.
+        """
+        return TimeSeries.from_rows(self.heart_rate_values)
+
     @classmethod
     def get(
         cls,
@@ -74,16 +87,14 @@ class DailyHeartRate(Data):
         client = client or http.client
         day = format_end_date(day)
         path = f"/wellness-service/wellness/dailyHeartRate/?date={day}"
-        hr_data = client.connectapi(path)
+        hr_data = connectapi_snake_case(client, path)
         if not hr_data:
             return None  # pragma: no cover
         assert isinstance(hr_data, dict), (
             f"Expected dict from {path}, got {type(hr_data).__name__}"
         )
-        hr_data = camel_to_snake_dict(hr_data)
-        return cls(**hr_data)
+        return build(cls, hr_data)
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda d: d.calendar_date)
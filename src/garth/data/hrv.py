@@ -7,8 +7,8 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
-from ._base import Data
+from ..utils import build, format_end_date
+from ._base import Data, connectapi_snake_case
 
 
 @dataclass
@@ -62,16 +62,18 @@ class HRVData(Data):
         client = client or http.client
         day = format_end_date(day)
         path = f"/hrv-service/hrv/{day}"
-        hrv_data = client.connectapi(path)
+        hrv_data = connectapi_snake_case(client, path)
         if not hrv_data:
             return None
         assert isinstance(hrv_data, dict), (
             f"Expected dict from {path}, got {type(hrv_data).__name__}"
         )
-        hrv_data = camel_to_snake_dict(hrv_data)
-        return cls(**hrv_data)
+        return build(cls, hrv_data)
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda d: d.hrv_summary.calendar_date)
+
+    @classmethod
+    def _calendar_date(cls, item: Self) -> date:
+        return item.hrv_summary.calendar_date
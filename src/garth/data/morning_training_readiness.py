@@ -6,7 +6,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from ..utils import build, camel_to_snake_dict, format_end_date
 from ._base import Data
 
 
@@ -64,9 +64,8 @@ class MorningTrainingReadinessData(Data):
             return None  # pragma: no cover
 
         morning_readiness_data = camel_to_snake_dict(morning_readiness_data)
-        return cls(**morning_readiness_data)
+        return build(cls, morning_readiness_data)
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda d: d.calendar_date)
@@ -8,11 +8,11 @@ from typing_extensions import Self
 
 from .. import http
 from ..utils import (
-    camel_to_snake_dict,
+    build,
     format_end_date,
     get_localized_datetime,
 )
-from ._base import Data
+from ._base import Data, connectapi_snake_case
 
 
 @dataclass
@@ -116,17 +116,21 @@ class SleepData(Data):
             f"/wellness-service/wellness/dailySleepData/{client.username}?"
             f"nonSleepBufferMinutes={buffer_minutes}&date={day}"
         )
-        sleep_data = client.connectapi(path)
+        sleep_data = connectapi_snake_case(client, path)
         assert sleep_data
         assert isinstance(sleep_data, dict), (
             f"Expected dict from {path}, got {type(sleep_data).__name__}"
         )
-        sleep_data = camel_to_snake_dict(sleep_data)
         return (
-            cls(**sleep_data) if sleep_data["daily_sleep_dto"]["id"] else None
+            build(cls, sleep_data)
+            if sleep_data["daily_sleep_dto"]["id"]
+            else None
         )
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda x: x.daily_sleep_dto.calendar_date)
+
+    @classmethod
+    def _calendar_date(cls, item: Self) -> date:
+        return item.daily_sleep_dto.calendar_date
@@ -6,7 +6,7 @@ from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
 from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from ..utils import build, camel_to_snake_dict, format_end_date
 from ._base import Data
 
 
@@ -58,9 +58,8 @@ class TrainingReadinessData(Data):
             return None
 
         data = cast(list[dict[str, Any]], raw_data)
-        return [cls(**camel_to_snake_dict(entry)) for entry in data]
+        return [build(cls, camel_to_snake_dict(entry)) for entry in data]
 
     @classmethod
-    def list(cls, *args, **kwargs) -> builtins.list[Self]:
-        data = super().list(*args, **kwargs)
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
         return sorted(data, key=lambda d: (d.calendar_date, d.timestamp))
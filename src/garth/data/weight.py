@@ -1,6 +1,7 @@
 import builtins
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 from itertools import chain
+from typing import ClassVar
 
 from pydantic import Field
 from pydantic.dataclasses import dataclass
@@ -8,11 +9,12 @@ from typing_extensions import Self
 
 from .. import http
 from ..utils import (
+    build,
     camel_to_snake_dict,
     format_end_date,
     get_localized_datetime,
 )
-from ._base import MAX_WORKERS, Data
+from ._base import Data
 
 
 @dataclass
@@ -33,6 +35,8 @@ class WeightData(Data):
     visceral_fat: float | None = None
     metabolic_age: int | None = None
 
+    _range_days: ClassVar[int | None] = 365
+
     @property
     def datetime_utc(self) -> datetime:
         return datetime.fromtimestamp(
@@ -62,21 +66,12 @@ class WeightData(Data):
         if not day_weight_list:
             return None
 
-        return cls(**camel_to_snake_dict(day_weight_list[0]))
+        return build(cls, camel_to_snake_dict(day_weight_list[0]))
 
     @classmethod
-    def list(
-        cls,
-        end: date | str | None = None,
-        days: int = 1,
-        *,
-        client: http.Client | None = None,
-        max_workers: int = MAX_WORKERS,
+    def _get_range(
+        cls, start: date, end: date, *, client: http.Client
     ) -> builtins.list[Self]:
-        client = client or http.client
-        end = format_end_date(end)
-        start = end - timedelta(days=days - 1)
-
         data = client.connectapi(
             f"/weight-service/weight/range/{start}/{end}?includeAll=true"
         )
@@ -87,8 +82,11 @@ class WeightData(Data):
         weight_metrics = chain.from_iterable(
             summary["allWeightMetrics"] for summary in weight_summaries
         )
-        weight_data_list = (
-            cls(**camel_to_snake_dict(weight_data))
+        return [
+            build(cls, camel_to_snake_dict(weight_data))
             for weight_data in weight_metrics
-        )
-        return sorted(weight_data_list, key=lambda d: d.datetime_utc)
+        ]
+
+    @classmethod
+    def _sorted(cls, data: builtins.list[Self]) -> builtins.list[Self]:
+        return sorted(data, key=lambda d: d.datetime_utc)
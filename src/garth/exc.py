@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-from requests import HTTPError
-
 
 @dataclass
 class GarthException(Exception):
@@ -15,7 +13,8 @@ class GarthException(Exception):
 
 @dataclass
 class GarthHTTPError(GarthException):
-    error: HTTPError
+    # requests.HTTPError, or httpx.HTTPStatusError from AsyncClient
+    error: Exception
 
     def __str__(self) -> str:
         return f"{self.msg}: {self.error}"
@@ -0,0 +1,400 @@
+"""Export `list` and `stream` results to Arrow and Parquet.
+
+Columns are typed from each class's fields: nested data classes become
+structs, lists become Arrow lists, and dates and datetimes keep their
+types. Values without a precise type, such as `Any`, are written as
+JSON strings. Everything works on iterables in batches, so a `stream`
+can be written to Parquet without holding the whole range in memory:
+
+    batches = export.record_batches(garth.DailySteps.stream(end, 365))
+    export.write_parquet(batches, "steps/")
+"""
+
+import dataclasses
+import types
+from array import array
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from datetime import date, datetime
+from functools import cache
+from itertools import chain, islice
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+from .data._series import TimeSeries, _typecode
+from .exc import GarthException
+from .utils import _calendar_date, dumps
+
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+    ds = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+    PYARROW_AVAILABLE = False
+
+
+BATCH_SIZE = 1024
+
+_Convert = Callable[[Any], Any] | None
+
+
+def schema(cls: type, exclude: Collection[str] = ()) -> "pa.Schema":
+    """Arrow schema for entries of `cls`.
+
+    A `calendar_date` column is added for classes whose day lives on a
+    nested object, so every table can be partitioned by it.
+    """
+    _require_pyarrow()
+    return _plan(cls, tuple(exclude))[0]
+
+
+def record_batches(
+    items: Iterable[Any],
+    cls: type | None = None,
+    *,
+    exclude: Collection[str] = (),
+    batch_size: int = BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """Convert entries to record batches of up to `batch_size` rows.
+
+    `cls` defaults to the type of the first entry. Fields in `exclude`,
+    such as large per-sample arrays, are left out.
+    """
+    _require_pyarrow()
+    items = iter(items)
+    if cls is None:
+        if (first := next(items, None)) is None:
+            return
+        cls = type(first)
+        items = chain([first], items)
+    arrow_schema, columns = _plan(cls, tuple(exclude))
+    while batch := list(islice(items, batch_size)):
+        arrays = []
+        for get, convert in columns:
+            values = [get(item) for item in batch]
+            if convert is not None:
+                values = [None if v is None else convert(v) for v in values]
+            arrays.append(values)
+        yield pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+
+
+def to_arrow(
+    items: Iterable[Any],
+    cls: type | None = None,
+    *,
+    exclude: Collection[str] = (),
+) -> "pa.Table":
+    """Convert entries to a single Arrow table."""
+    _require_pyarrow()
+    items = list(items)
+    if cls is None and not items:
+        raise ValueError("cls is required when there are no entries")
+    cls = cls or type(items[0])
+    return pa.Table.from_batches(
+        record_batches(items, cls, exclude=exclude),
+        schema=schema(cls, exclude),
+    )
+
+
+def from_payloads(cls: type, payloads: Sequence[dict]) -> "pa.Table":
+    """Arrow table of `cls` entries built straight from their payloads.
+
+    `payloads` are the snake_case dicts `cls` would be built from. Each
+    column is handed to Arrow as a whole, with dates and datetimes parsed
+    from their ISO strings by Arrow, so no instance or dict is created
+    per entry. A column Arrow can't take as is, such as timestamps with
+    an offset, falls back to validating its values one by one.
+    """
+    _require_pyarrow()
+    plan = _payload_plan(cls)
+    arrow_schema = pa.schema(
+        [pa.field(name, arrow_type) for name, *_, arrow_type, _ in plan]
+    )
+    arrays = [
+        _payload_column(
+            [payload.get(key, default) for payload in payloads],
+            arrow_type,
+            annotation,
+            convert,
+        )
+        for _, key, default, annotation, arrow_type, convert in plan
+    ]
+    return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def samples(
+    items: Iterable[Any],
+    field: str,
+    *,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """Per-sample rows from each entry's `field`, one batch per entry or
+    `batch_size` samples.
+
+    `field` is either a `TimeSeries`, such as `DailyHeartRate.series` or
+    `DailyBodyBatteryStress.stress_series`, which gives `calendar_date`,
+    `timestamp` and `value` columns without copying the samples, or a
+    list of data classes, such as `HRVData.hrv_readings`, which gives
+    `calendar_date` and a column per field.
+    """
+    _require_pyarrow()
+    item_schema = None
+    for item in items:
+        value = getattr(item, field)
+        day = _calendar_date(type(item), item)
+        if isinstance(value, TimeSeries):
+            yield from _series_batches(value, day, batch_size)
+            continue
+        if not value:
+            continue
+        if item_schema is None:
+            item_schema = schema(type(value[0])).insert(
+                0, pa.field("calendar_date", pa.date32())
+            )
+        for batch in record_batches(
+            value, type(value[0]), batch_size=batch_size
+        ):
+            yield pa.RecordBatch.from_arrays(
+                [
+                    pa.array([day] * batch.num_rows, pa.date32()),
+                    *batch.columns,
+                ],
+                schema=item_schema,
+            )
+
+
+def write_parquet(
+    batches: Iterable["pa.RecordBatch"],
+    path: str,
+    *,
+    partition_by: str | None = "calendar_date",
+    **kwargs,
+):
+    """Write record batches to Parquet files under `path` as they come.
+
+    Files are partitioned into `calendar_date=YYYY-MM-DD` directories
+    unless `partition_by` is None. `kwargs` are passed to
+    `pyarrow.dataset.write_dataset`.
+    """
+    _require_pyarrow()
+    batches = iter(batches)
+    if (first := next(batches, None)) is None:
+        return
+    kwargs.setdefault("existing_data_behavior", "overwrite_or_ignore")
+    ds.write_dataset(
+        chain([first], batches),
+        path,
+        schema=first.schema,
+        format="parquet",
+        partitioning=_partitioning(first.schema, partition_by),
+        **kwargs,
+    )
+
+
+def read_parquet(
+    path: str, *, partition_by: str | None = "calendar_date"
+) -> "pa.Table":
+    """Read what `write_parquet` wrote, with the partition column back
+    as dates rather than strings."""
+    _require_pyarrow()
+    partitioning = None
+    if partition_by:
+        partitioning = ds.partitioning(
+            pa.schema([pa.field(partition_by, pa.date32())]), flavor="hive"
+        )
+    return ds.dataset(
+        path, format="parquet", partitioning=partitioning
+    ).to_table()
+
+
+def _partitioning(
+    arrow_schema: "pa.Schema", partition_by: str | None
+) -> "ds.Partitioning | None":
+    if not partition_by:
+        return None
+    return ds.partitioning(
+        pa.schema([arrow_schema.field(partition_by)]), flavor="hive"
+    )
+
+
+def _require_pyarrow():
+    if pa is None:  # pragma: no cover
+        raise GarthException(
+            msg="pyarrow is required for export: pip install garth[arrow]"
+        )
+
+
+_plans: dict[tuple[type, tuple[str, ...]], tuple[Any, list]] = {}
+
+
+def _plan(
+    cls: type, exclude: tuple[str, ...]
+) -> tuple["pa.Schema", list[tuple[Callable[[Any], Any], _Convert]]]:
+    """Schema and per-column `(get, convert)` pairs for `cls`."""
+    key = (cls, exclude)
+    if (plan := _plans.get(key)) is not None:
+        return plan
+    fields, columns = [], []
+    names = [f.name for f in dataclasses.fields(cls)]
+    if "calendar_date" not in names and hasattr(cls, "_calendar_date"):
+        fields.append(pa.field("calendar_date", pa.date32()))
+        columns.append((cls._calendar_date, None))
+    for name, field in cls.__pydantic_fields__.items():  # type: ignore[attr-defined]
+        if name in exclude:
+            continue
+        arrow_type, convert = _arrow_type(field.annotation)
+        fields.append(pa.field(name, arrow_type))
+        columns.append((_getter(name), convert))
+    plan = _plans[key] = (pa.schema(fields), columns)
+    return plan
+
+
+@cache
+def _payload_plan(
+    cls: type,
+) -> list[tuple[str, str, Any, Any, "pa.DataType", _Convert]]:
+    """`(name, key, default, annotation, arrow_type, convert)` for each
+    field of `cls`."""
+    plan = []
+    for name, field in cls.__pydantic_fields__.items():  # type: ignore[attr-defined]
+        plan.append(
+            (
+                name,
+                field.alias or name,
+                None
+                if field.is_required()
+                else field.get_default(call_default_factory=True),
+                field.annotation,
+                *_arrow_type(field.annotation),
+            )
+        )
+    return plan
+
+
+def _payload_column(
+    values: list[Any],
+    arrow_type: "pa.DataType",
+    annotation: Any,
+    convert: _Convert,
+) -> "pa.Array":
+    try:
+        if pa.types.is_date(arrow_type) or pa.types.is_timestamp(arrow_type):
+            return pa.array(values, pa.string()).cast(arrow_type)
+        if convert is _json:
+            values = [None if v is None else _json(v) for v in values]
+        return pa.array(values, arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        validate = TypeAdapter(annotation).validate_python
+        validated = [None if v is None else validate(v) for v in values]
+        if convert is not None:
+            validated = [None if v is None else convert(v) for v in validated]
+        return pa.array(validated, arrow_type)
+
+
+def _getter(name: str) -> Callable[[Any], Any]:
+    return lambda item: getattr(item, name)
+
+
+def _arrow_type(tp: Any) -> tuple["pa.DataType", _Convert]:
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return _arrow_type(args[0])
+        return pa.string(), _json
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        item_type, convert = _arrow_type(item)
+        if convert is None:
+            return pa.list_(item_type), None
+        return pa.list_(item_type), lambda values: [
+            None if v is None else convert(v) for v in values
+        ]
+    if dataclasses.is_dataclass(tp) and hasattr(tp, "__pydantic_fields__"):
+        struct_fields, converters = [], []
+        for name, field in tp.__pydantic_fields__.items():
+            field_type, convert = _arrow_type(field.annotation)
+            struct_fields.append(pa.field(name, field_type))
+            converters.append((name, convert))
+
+        def to_dict(value: Any) -> dict[str, Any]:
+            result = {}
+            for name, convert in converters:
+                v = getattr(value, name)
+                result[name] = (
+                    v if v is None or convert is None else convert(v)
+                )
+            return result
+
+        return pa.struct(struct_fields), to_dict
+    scalar = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        date: pa.date32(),
+        datetime: pa.timestamp("us"),
+    }.get(tp)
+    if scalar is not None:
+        return scalar, None
+    return pa.string(), _json
+
+
+def _json(value: Any) -> str:
+    return dumps(value).decode()
+
+
+def _series_batches(
+    series: TimeSeries, day: date | None, batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    series_schema = pa.schema(
+        [
+            pa.field("calendar_date", pa.date32()),
+            pa.field("timestamp", pa.timestamp("ms", tz="UTC")),
+            pa.field("value", _typecode_type(series)),
+        ]
+    )
+    for start in range(0, len(series), batch_size):
+        n = min(batch_size, len(series) - start)
+        timestamps = memoryview(series.timestamps)[start : start + n]
+        values = memoryview(series.values)[start : start + n]
+        yield pa.RecordBatch.from_arrays(
+            [
+                pa.array([day] * n, pa.date32()),
+                # Views on the series' own memory rather than copies
+                pa.Array.from_buffers(
+                    series_schema.field("timestamp").type,
+                    n,
+                    [None, pa.py_buffer(timestamps)],
+                ),
+                pa.Array.from_buffers(
+                    series_schema.field("value").type,
+                    n,
+                    [None, pa.py_buffer(values)],
+                ),
+            ],
+            schema=series_schema,
+        )
+
+
+def _typecode_type(series: TimeSeries) -> "pa.DataType":
+    typecode = _typecode(series.values)
+    if typecode in ("f", "d"):
+        return pa.float32() if typecode == "f" else pa.float64()
+    if typecode not in set("bBhHiIlLqQ"):
+        raise GarthException(
+            msg=f"Unsupported TimeSeries typecode for export: {typecode!r}"
+        )
+    # "i" and "l" vary in size by platform, so go by the item size
+    bits = array(typecode).itemsize * 8
+    return getattr(pa, f"{'int' if typecode.islower() else 'uint'}{bits}")()
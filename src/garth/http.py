@@ -1,8 +1,15 @@
+import asyncio
 import base64
+import hashlib
 import json
+import logging
 import os
+import re
+import threading
+import time
 from collections.abc import Callable
-from typing import IO, Any, Literal
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Literal, TypeVar, cast
 from urllib.parse import urljoin
 
 from pydantic import model_validator
@@ -12,14 +19,28 @@ from requests.adapters import HTTPAdapter, Retry
 
 from . import sso
 from .auth_tokens import OAuth1Token, OAuth2Token
+from .cache import CachePolicy, ResponseCache
 from .exc import GarthException, GarthHTTPError
+from .ratelimit import RateLimiter, retry_after
 from .telemetry import Telemetry
-from .utils import asdict
+from .utils import asdict, loads
 
 
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+    HTTPX_AVAILABLE = False
+
+
+T = TypeVar("T")
+
 USER_AGENT = {"User-Agent": "GCM-iOS-5.22.1.4"}
 OAUTH1_TOKEN_FILE = "oauth1_token.json"
 OAUTH2_TOKEN_FILE = "oauth2_token.json"
+REFRESH_RETRY = 60
 
 
 class GarthSettings(BaseSettings):
@@ -49,24 +70,51 @@ class Client:
     backoff_factor: float = 0.5
     pool_connections: int = 10
     pool_maxsize: int = 10
+    adapter: HTTPAdapter | None = None
+    max_workers: int = 10
+    cache: ResponseCache | None = None
+    cache_policy: CachePolicy
+    refresh_margin: float | None = None
+    rate_limiter: RateLimiter | None = None
+    rate_limits: dict[str, RateLimiter]
+    _executor: ThreadPoolExecutor | None = None
+    # False while the executor or adapter is lent by a `ClientPool`
+    _owns_executor: bool = True
+    _owns_adapter: bool = True
+    _refresher: threading.Thread | None = None
     _user_profile: dict[str, Any] | None = None
     _garth_home: str | None = None
     telemetry: Telemetry
 
-    def __init__(self, session: Session | None = None, **kwargs):
+    def __init__(
+        self,
+        session: Session | None = None,
+        auto_resume: bool = True,
+        **kwargs,
+    ):
         self.sess = session if session else Session()
+        self._executor_lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_wake = threading.Event()
+        self.cache_policy = CachePolicy()
+        self.rate_limits = {}
         self.sess.headers.update(USER_AGENT)
         self.telemetry = Telemetry()
         self.configure(
-            timeout=self.timeout,
-            retries=self.retries,
-            status_forcelist=self.status_forcelist,
-            backoff_factor=self.backoff_factor,
-            **kwargs,
+            **{
+                "timeout": self.timeout,
+                "retries": self.retries,
+                "status_forcelist": self.status_forcelist,
+                "backoff_factor": self.backoff_factor,
+                **kwargs,
+            }
         )
         if self.telemetry.enabled:
             print(f"Garth session: {self.telemetry.session_id}")
-        self._auto_resume()
+        if auto_resume:
+            self._auto_resume()
 
     def configure(
         self,
@@ -82,10 +130,18 @@ class Client:
         backoff_factor: float | None = None,
         pool_connections: int | None = None,
         pool_maxsize: int | None = None,
+        adapter: HTTPAdapter | None = None,
+        max_workers: int | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        refresh_margin: float | Literal[False] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        rate_limits: dict[str, RateLimiter] | None = None,
         telemetry_enabled: bool | None = None,
         telemetry_send_to_logfire: bool | None = None,
         telemetry_token: str | None = None,
         telemetry_callback: Callable[[dict], None] | None = None,
+        telemetry_batch_callback: Callable[[list[dict]], None] | None = None,
     ):
         if oauth1_token is not None:
             self.oauth1_token = oauth1_token
@@ -109,27 +165,197 @@ class Client:
             self.pool_connections = pool_connections
         if pool_maxsize is not None:
             self.pool_maxsize = pool_maxsize
-
-        retry = Retry(
-            total=self.retries,
-            status_forcelist=self.status_forcelist,
-            backoff_factor=self.backoff_factor,
-        )
-        adapter = HTTPAdapter(
-            max_retries=retry,
-            pool_connections=self.pool_connections,
-            pool_maxsize=self.pool_maxsize,
-        )
-        self.sess.mount("https://", adapter)
+        if max_workers is not None and max_workers != self.max_workers:
+            self.max_workers = max_workers
+            self._retire_executor()
+        if cache is not None:
+            self.cache = cache
+        if cache_policy is not None:
+            self.cache_policy = cache_policy
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if rate_limits is not None:
+            self.rate_limits = rate_limits
+        if refresh_margin is False:
+            self.refresh_margin = None
+            self._stop_refresher()
+        elif refresh_margin is not None:
+            self.refresh_margin = refresh_margin
+            self._start_refresher()
+        # Let the refresher reschedule for new tokens or margin
+        self._refresh_wake.set()
+
+        if adapter is not None:
+            self.adapter = adapter
+            self._owns_adapter = True
+        elif self.adapter is None or any(
+            option is not None
+            for option in (
+                retries,
+                status_forcelist,
+                backoff_factor,
+                pool_connections,
+                pool_maxsize,
+                rate_limiter,
+                rate_limits,
+            )
+        ):
+            self.adapter = self._build_adapter(
+                retries=self.retries,
+                status_forcelist=self.status_forcelist,
+                backoff_factor=self.backoff_factor,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                limited=bool(self.rate_limiter or self.rate_limits),
+            )
+            self._owns_adapter = True
+        self.sess.mount("https://", self.adapter)
 
         self.telemetry.configure(
             enabled=telemetry_enabled,
             send_to_logfire=telemetry_send_to_logfire,
             token=telemetry_token,
             callback=telemetry_callback,
+            batch_callback=telemetry_batch_callback,
         )
         self.telemetry.attach(self.sess)
 
+    @staticmethod
+    def _build_adapter(
+        retries: int,
+        status_forcelist: tuple[int, ...],
+        backoff_factor: float,
+        pool_connections: int,
+        pool_maxsize: int,
+        limited: bool,
+    ) -> HTTPAdapter:
+        # With a rate limiter, 429s reach `request` untouched so the
+        # limiter sees every one and owns the wait and the retry
+        retry = Retry(
+            total=retries,
+            status_forcelist=tuple(
+                status
+                for status in status_forcelist
+                if not (limited and status == 429)
+            ),
+            backoff_factor=backoff_factor,
+            respect_retry_after_header=not limited,
+        )
+        return HTTPAdapter(
+            max_retries=retry,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool shared by all `Data.list` calls on this client.
+
+        Created on first use with `max_workers` threads, which caps the
+        number of concurrent requests the client makes from `list`.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="garth",
+                )
+                self._owns_executor = True
+            return self._executor
+
+    def _retire_executor(self):
+        """Have the next `executor` access create a new pool.
+
+        The old pool isn't shut down, since a `list` or `stream` already
+        running may still submit to it. Its threads exit once they're
+        idle and the last caller holding it is done, as
+        `ThreadPoolExecutor` does when it's garbage collected.
+        """
+        with self._executor_lock:
+            self._executor = None
+
+    def _shutdown_executor(self, wait: bool = True):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=wait)
+
+    def _start_refresher(self):
+        if self._refresher is None or not self._refresher.is_alive():
+            self._refresher = threading.Thread(
+                target=self._refresh_loop,
+                name="garth-refresh",
+                daemon=True,
+            )
+            self._refresher.start()
+
+    def _stop_refresher(self):
+        refresher, self._refresher = self._refresher, None
+        self._refresh_wake.set()
+        if (
+            refresher is not None
+            and refresher is not threading.current_thread()
+        ):
+            refresher.join()
+
+    def _refresh_loop(self):
+        """Refresh the OAuth2 token `refresh_margin` seconds before it
+        expires, so requests don't wait on the exchange.
+
+        Runs until `close()` or `configure(refresh_margin=False)`. Failed
+        refreshes are retried after `REFRESH_RETRY` seconds; requests
+        still refresh an expired token themselves.
+        """
+        while (
+            self._refresher is threading.current_thread()
+            and self.refresh_margin is not None
+        ):
+            delay = self._refresh_delay()
+            if delay <= 0:
+                try:
+                    self._refresh_oauth2_if_expired(self.refresh_margin)
+                except Exception as e:
+                    logging.warning(f"Background OAuth2 refresh failed: {e}")
+                    delay = REFRESH_RETRY
+                else:
+                    # A margin longer than the token's lifetime would
+                    # otherwise refresh in a loop
+                    delay = max(self._refresh_delay(), REFRESH_RETRY)
+            self._refresh_wake.wait(delay)
+            self._refresh_wake.clear()
+
+    def _refresh_delay(self) -> float:
+        if not isinstance(self.oauth1_token, OAuth1Token) or not isinstance(
+            self.oauth2_token, OAuth2Token
+        ):
+            return REFRESH_RETRY
+        return (
+            self.oauth2_token.expires_at
+            - (self.refresh_margin or 0)
+            - time.time()
+        )
+
+    def close(self):
+        """Stop background refresh, shut down the worker pool, deliver
+        queued telemetry and close the HTTP session.
+
+        A worker pool or adapter shared by a `ClientPool` is left open for
+        the pool's other clients.
+        """
+        self._stop_refresher()
+        self._shutdown_executor()
+        self.telemetry.close()
+        if not self._owns_adapter:
+            # `Session.close` closes every mounted adapter
+            self.sess.adapters.pop("https://", None)
+        self.sess.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _auto_resume(self):
         """Auto-resume session from GARTH_HOME or GARTH_TOKEN env vars."""
         settings = GarthSettings()
@@ -178,19 +404,30 @@ class Client:
             assert self.oauth1_token, (
                 "OAuth1 token is required for API requests"
             )
-            if (
-                not isinstance(self.oauth2_token, OAuth2Token)
-                or self.oauth2_token.expired
-            ):
-                self.refresh_oauth2()
+            if self._oauth2_expired():
+                self._refresh_oauth2_if_expired()
             headers["Authorization"] = str(self.oauth2_token)
-        self.last_resp = self.sess.request(
-            method,
-            url,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs,
-        )
+        limiters = self._rate_limiters(path)
+        for attempt in range(self.retries + 1):
+            for limiter in limiters:
+                limiter.acquire()
+            status = delay = None
+            try:
+                self.last_resp = self.sess.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+                status = self.last_resp.status_code
+                delay = retry_after(self.last_resp.headers.get("Retry-After"))
+            finally:
+                for limiter in limiters:
+                    limiter.release(status, delay)
+            # Throttled requests wait out the backoff in acquire and retry
+            if status != 429 or not limiters or attempt == self.retries:
+                break
         try:
             self.last_resp.raise_for_status()
         except HTTPError as e:
@@ -240,13 +477,92 @@ class Client:
         if self._garth_home:
             self.dump(self._garth_home, oauth2_only=True)
 
+    def _rate_limiters(self, path: str) -> list[RateLimiter]:
+        """The client-wide limiter and the first one matching `path`."""
+        limiters = [self.rate_limiter] if self.rate_limiter else []
+        for pattern, limiter in self.rate_limits.items():
+            if re.search(pattern, path):
+                limiters.append(limiter)
+                break
+        return limiters
+
+    def _oauth2_expired(self, margin: float = 0) -> bool:
+        return (
+            not isinstance(self.oauth2_token, OAuth2Token)
+            or self.oauth2_token.expires_at - margin < time.time()
+        )
+
+    def _refresh_oauth2_if_expired(self, margin: float = 0):
+        # Threads that find the token expired queue here; only the first
+        # exchanges it and the rest reuse the new token.
+        with self._refresh_lock:
+            if self._oauth2_expired(margin):
+                self.refresh_oauth2()
+
     def connectapi(
-        self, path: str, method="GET", **kwargs
+        self, path: str, method="GET", *, snake_case: bool = False, **kwargs
     ) -> dict[str, Any] | list[dict[str, Any]] | None:
-        resp = self.request(method, "connectapi", path, api=True, **kwargs)
-        if resp.status_code == 204:
-            return None
-        return resp.json()
+        """Request a Garmin Connect API path and decode the JSON response.
+
+        With `snake_case`, keys are converted to snake case while decoding,
+        which saves parsers a second pass with `camel_to_snake_dict`.
+        """
+        if method == "GET":
+            # Identical GETs in flight at the same time share one request
+            key = self._request_key(path, kwargs)
+            content = self._single_flight(
+                key, lambda: self._get_content(key, path, kwargs)
+            )
+        else:
+            resp = self.request(method, "connectapi", path, api=True, **kwargs)
+            content = b"" if resp.status_code == 204 else resp.content
+        return loads(content, snake_case) if content else None
+
+    def _get_content(self, key: str, path: str, kwargs: dict) -> bytes:
+        """Body of a connectapi GET, served from the cache if possible."""
+        cache, ttl = self.cache, self._cache_ttl(path, kwargs)
+        if cache is not None and ttl != 0:
+            if (content := cache.get(key)) is not None:
+                return content
+        resp = self.request("GET", "connectapi", path, api=True, **kwargs)
+        if cache is not None and ttl != 0:
+            cache.set(key, resp.content, ttl)
+        return resp.content
+
+    def _single_flight(self, key: str, fetch: Callable[[], T]) -> T:
+        """Call `fetch`, or wait for the thread already fetching `key`."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _request_key(self, path: str, kwargs: dict[str, Any]) -> str:
+        # Responses are per account, so key on the account's OAuth1 token
+        user = getattr(self.oauth1_token, "oauth_token", None)
+        raw = json.dumps(
+            [user, self.domain, path, kwargs], sort_keys=True, default=str
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _cache_ttl(self, path: str, kwargs: dict[str, Any]) -> float | None:
+        """TTL for caching a GET, or 0 if it shouldn't be cached."""
+        if self.cache is None or set(kwargs) - {"params"}:
+            return 0
+        return self.cache_policy.ttl(path, kwargs.get("params"))
 
     def download(self, path: str, **kwargs) -> bytes:
         resp = self.get("connectapi", path, api=True, **kwargs)
@@ -303,4 +619,322 @@ class Client:
         )
 
 
+def _request_key(path: str, method: str, kwargs: dict[str, Any]) -> str:
+    return json.dumps([method, path, kwargs], sort_keys=True, default=str)
+
+
+class _PendingRequest(BaseException):
+    """Raised by _ReplayClient for a response that hasn't been fetched yet.
+
+    Derives from BaseException so `except Exception` blocks in `get`
+    implementations don't swallow it.
+    """
+
+    def __init__(self, key: str, path: str, method: str, kwargs: dict):
+        super().__init__(path)
+        self.key = key
+        self.path = path
+        self.method = method
+        self.kwargs = kwargs
+
+
+class _ReplayClient:
+    """Sync client handed to the function given to AsyncClient.run.
+
+    Only `connectapi` and what's built on it are supported: `user_profile`,
+    `profile` and `username`, plus the domain and tokens. `connectapi` is
+    served from responses the async client already fetched and raises
+    `_PendingRequest` for anything else. Any other `Client` attribute
+    raises AttributeError naming what's supported.
+    """
+
+    _user_profile: dict[str, Any] | None = None
+
+    def __init__(
+        self, aclient: "AsyncClient", responses: dict[str, Any]
+    ) -> None:
+        self.domain = aclient.domain
+        self.oauth1_token = aclient.oauth1_token
+        self.oauth2_token = aclient.oauth2_token
+        self._user_profile = aclient._user_profile
+        self._responses = responses
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(
+            f"{name!r} isn't available in AsyncClient.run, which only "
+            "supports connectapi, user_profile, profile, username, domain "
+            "and the tokens"
+        )
+
+    def connectapi(
+        self, path: str, method="GET", *, snake_case: bool = False, **kwargs
+    ) -> dict[str, Any] | list[dict[str, Any]] | None:
+        key = _request_key(path, method, kwargs)
+        if key not in self._responses:
+            raise _PendingRequest(key, path, method, kwargs)
+        content = self._responses[key]
+        if isinstance(content, Exception):
+            raise content
+        # Decode on every replay since parsers may mutate the result
+        return loads(content, snake_case) if content else None
+
+    user_profile = Client.user_profile
+    profile = Client.profile
+    username = Client.username
+
+
+class AsyncClient:
+    """asyncio counterpart of `Client`, built on httpx.
+
+    Tokens, domain and request settings are shared with a sync `Client`,
+    so `AsyncClient(garth.client)` reuses an existing session. Requires
+    the `async` extra (`pip install garth[async]`).
+    """
+
+    sess: "httpx.AsyncClient"
+    last_resp: "httpx.Response"
+    client: Client
+    max_connections: int = 100
+    _user_profile: dict[str, Any] | None = None
+
+    def __init__(
+        self,
+        client: Client | None = None,
+        /,
+        session: "httpx.AsyncClient | None" = None,
+        max_connections: int | None = None,
+    ):
+        if not HTTPX_AVAILABLE:  # pragma: no cover
+            raise GarthException(
+                msg="httpx is required for AsyncClient: "
+                "pip install garth[async]"
+            )
+        self.client = client if client else Client()
+        if max_connections is not None:
+            self.max_connections = max_connections
+        self.sess = (
+            session
+            if session
+            else httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections),
+                proxy=self.client.sess.proxies.get("https"),
+                verify=self.client.sess.verify,
+            )
+        )
+        self.sess.headers.update(USER_AGENT)
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        self._refresh_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.sess.aclose()
+
+    @property
+    def domain(self) -> str:
+        return self.client.domain
+
+    @property
+    def oauth1_token(self) -> OAuth1Token | Literal["needs_mfa"] | None:
+        return self.client.oauth1_token
+
+    @property
+    def oauth2_token(self) -> OAuth2Token | dict[str, Any] | None:
+        return self.client.oauth2_token
+
+    async def request(
+        self,
+        method: str,
+        subdomain: str,
+        path: str,
+        /,
+        api: bool = False,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> "httpx.Response":
+        url = f"https://{subdomain}.{self.domain}"
+        url = urljoin(url, path)
+        headers = dict(headers or {})
+        if api:
+            assert self.oauth1_token, (
+                "OAuth1 token is required for API requests"
+            )
+            if self.client._oauth2_expired():
+                # One task at a time waits on the sync client's refresh,
+                # which also coordinates with threads using it directly
+                async with self._refresh_lock:
+                    await asyncio.to_thread(
+                        self.client._refresh_oauth2_if_expired
+                    )
+            headers["Authorization"] = str(self.oauth2_token)
+
+        # Mirror the urllib3 Retry policy mounted on the sync session
+        retries = (
+            self.client.retries
+            if method.upper() in Retry.DEFAULT_ALLOWED_METHODS
+            else 0
+        )
+        limiters = self.client._rate_limiters(path)
+        # Throttled requests of any method are retried after the limiter's
+        # backoff
+        throttle_retries = self.client.retries if limiters else 0
+        async with self._semaphore:
+            for attempt in range(max(retries, throttle_retries) + 1):
+                for limiter in limiters:
+                    await limiter.aacquire()
+                status = delay = None
+                try:
+                    resp = await self.sess.request(
+                        method,
+                        url,
+                        headers=headers,
+                        timeout=self.client.timeout,
+                        **kwargs,
+                    )
+                    status = resp.status_code
+                    delay = retry_after(resp.headers.get("Retry-After"))
+                finally:
+                    for limiter in limiters:
+                        limiter.release(status, delay)
+                if status == 429 and attempt < throttle_retries:
+                    continue
+                if (
+                    attempt >= retries
+                    or status not in self.client.status_forcelist
+                ):
+                    break
+                await asyncio.sleep(self.client.backoff_factor * 2**attempt)
+        self.last_resp = resp
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise GarthHTTPError(
+                msg="Error in request",
+                error=e,
+            )
+        return resp
+
+    async def get(self, *args, **kwargs) -> "httpx.Response":
+        return await self.request("GET", *args, **kwargs)
+
+    async def post(self, *args, **kwargs) -> "httpx.Response":
+        return await self.request("POST", *args, **kwargs)
+
+    async def delete(self, *args, **kwargs) -> "httpx.Response":
+        return await self.request("DELETE", *args, **kwargs)
+
+    async def put(self, *args, **kwargs) -> "httpx.Response":
+        return await self.request("PUT", *args, **kwargs)
+
+    async def refresh_oauth2(self):
+        """Exchange the OAuth1 token for a new OAuth2 token.
+
+        The exchange goes through the sync client's SSO flow in a worker
+        thread. It only happens about once an hour.
+        """
+        await asyncio.to_thread(self.client.refresh_oauth2)
+
+    async def connectapi(
+        self, path: str, method="GET", *, snake_case: bool = False, **kwargs
+    ) -> dict[str, Any] | list[dict[str, Any]] | None:
+        content = await self._content(path, method, kwargs)
+        return loads(content, snake_case) if content else None
+
+    async def _content(
+        self, path: str, method: str, kwargs: dict[str, Any]
+    ) -> bytes:
+        """Raw connectapi response body, going through the client's
+        cache."""
+        cache = self.client.cache
+        ttl = self.client._cache_ttl(path, kwargs) if method == "GET" else 0
+        key = self.client._request_key(path, kwargs)
+        if cache is not None and ttl != 0:
+            if (content := cache.get(key)) is not None:
+                return content
+        resp = await self.request(
+            method, "connectapi", path, api=True, **kwargs
+        )
+        if cache is not None and ttl != 0:
+            cache.set(key, resp.content, ttl)
+        return resp.content
+
+    async def download(self, path: str, **kwargs) -> bytes:
+        resp = await self.get("connectapi", path, api=True, **kwargs)
+        return resp.content
+
+    async def upload(
+        self, fp: IO[bytes], /, path: str = "/upload-service/upload"
+    ) -> dict[str, Any]:
+        fname = os.path.basename(fp.name)
+        files = {"file": (fname, fp)}
+        result = await self.connectapi(
+            path,
+            method="POST",
+            files=files,
+        )
+        assert result is not None, "No result from upload"
+        assert isinstance(result, dict)
+        return result
+
+    async def run(self, func: Callable[[Client], T]) -> T:
+        """Run sync garth code against this client.
+
+        `func` is called with a sync client whose `connectapi` is served
+        from responses fetched here. Whenever it asks for a response that
+        hasn't been fetched yet, the request is awaited and `func` is
+        called again, so it must only read through `connectapi`. This is
+        how the `aget`/`alist` variants reuse the parsing in `get`/`list`.
+        """
+        responses: dict[str, Any] = {}
+        while True:
+            replay = _ReplayClient(self, responses)
+            try:
+                result = func(cast(Client, replay))
+            except _PendingRequest as pending:
+                responses[pending.key] = await self._fetch(pending)
+                continue
+            if replay._user_profile:
+                self._user_profile = replay._user_profile
+            return result
+
+    async def _fetch(self, pending: _PendingRequest) -> Any:
+        # Concurrent runs waiting on the same GET share one request,
+        # e.g. the profile lookup behind `username`
+        task = self._inflight.get(pending.key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_content(pending))
+            if pending.method == "GET":
+                self._inflight[pending.key] = task
+                task.add_done_callback(
+                    lambda _: self._inflight.pop(pending.key, None)
+                )
+        return await asyncio.shield(task)
+
+    async def _fetch_content(self, pending: _PendingRequest) -> Any:
+        try:
+            return await self._content(
+                pending.path, pending.method, pending.kwargs
+            )
+        except GarthHTTPError as e:
+            # Raised again from connectapi so `get` can handle it
+            return e
+
+    def dump(self, dir_path: str, /, oauth2_only: bool = False):
+        self.client.dump(dir_path, oauth2_only=oauth2_only)
+
+    def dumps(self) -> str:
+        return self.client.dumps()
+
+    def load(self, dir_path: str):
+        self.client.load(dir_path)
+
+    def loads(self, s: str):
+        self.client.loads(s)
+
+
 client = Client()
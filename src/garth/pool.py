@@ -0,0 +1,190 @@
+import threading
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from requests import Session
+
+from .http import Client
+
+
+T = TypeVar("T")
+
+_Task = tuple[Future, Callable[..., Any], tuple, dict]
+
+
+class ClientPool:
+    """Clients for many accounts sharing connections and workers.
+
+    Each account has its own `Client` and tokens, but all of them share one
+    connection pool, one worker pool for `Data.list`, and a scheduler for
+    work submitted with `submit`. The scheduler takes tasks round-robin
+    across accounts and runs at most `max_per_account` per account at a
+    time, so a long backfill for one account doesn't starve the rest.
+
+    Args:
+        max_workers: Tasks running at once across all accounts. Also the
+            size of the worker pool `Data.list` uses.
+        max_per_account: Tasks running at once for any one account.
+        **kwargs: Options passed to `Client.configure` for every account.
+            A `rate_limiter` or `rate_limits` given here is shared, so it
+            limits requests across all accounts together. For a limit per
+            account, configure each client returned by `add`.
+    """
+
+    def __init__(
+        self, max_workers: int = 32, max_per_account: int = 4, **kwargs
+    ):
+        self.max_workers = max_workers
+        self.max_per_account = max_per_account
+        self._config = kwargs
+        # Scheduler workers and list workers can both be mid-request
+        self._adapter = Client._build_adapter(
+            retries=kwargs.get("retries", Client.retries),
+            status_forcelist=kwargs.get(
+                "status_forcelist", Client.status_forcelist
+            ),
+            backoff_factor=kwargs.get("backoff_factor", Client.backoff_factor),
+            pool_connections=kwargs.get(
+                "pool_connections", Client.pool_connections
+            ),
+            pool_maxsize=2 * max_workers,
+            limited=bool(
+                kwargs.get("rate_limiter") or kwargs.get("rate_limits")
+            ),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="garth-pool"
+        )
+        self._clients: dict[str, Client] = {}
+        self._queues: dict[str, deque[_Task]] = {}
+        self._running: Counter[str] = Counter()
+        self._order: deque[str] = deque()
+        self._cond = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    def add(
+        self, name: str, token: str | None = None, home: str | None = None
+    ) -> Client:
+        """Add an account, resuming it from `Client.dumps()` output or a
+        token directory if given. Otherwise log in with the returned
+        client."""
+        client = Client(
+            Session(), auto_resume=False, adapter=self._adapter, **self._config
+        )
+        # The pool owns these, so closing one client leaves them open
+        client._executor = self._executor
+        client._owns_executor = client._owns_adapter = False
+        if token:
+            client.loads(token)
+        elif home:
+            client.load(home)
+        with self._cond:
+            if name in self._clients:
+                raise ValueError(f"Account {name!r} already in pool")
+            self._clients[name] = client
+            self._queues[name] = deque()
+            self._order.append(name)
+        return client
+
+    def remove(self, name: str) -> Client:
+        """Remove an account, cancelling its queued tasks."""
+        with self._cond:
+            client = self._clients.pop(name)
+            for future, *_ in self._queues.pop(name):
+                future.cancel()
+            self._order.remove(name)
+        client._stop_refresher()
+        return client
+
+    def __getitem__(self, name: str) -> Client:
+        return self._clients[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._clients
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._clients))
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def submit(
+        self, name: str, fn: Callable[..., T], /, *args, **kwargs
+    ) -> "Future[T]":
+        """Schedule `fn(client, *args, **kwargs)` for an account."""
+        future: Future[T] = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed ClientPool")
+            self._queues[name].append((future, fn, args, kwargs))
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"garth-pool-scheduler-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify()
+        return future
+
+    def submit_all(
+        self, fn: Callable[..., T], /, *args, **kwargs
+    ) -> dict[str, "Future[T]"]:
+        """Schedule `fn(client, *args, **kwargs)` for every account."""
+        return {name: self.submit(name, fn, *args, **kwargs) for name in self}
+
+    def _next_task(self) -> tuple[str, _Task] | None:
+        # Called with the lock held. Rotating the order after each pick
+        # gives every account a turn before any account gets a second.
+        for _ in range(len(self._order)):
+            name = self._order[0]
+            self._order.rotate(-1)
+            queue = self._queues[name]
+            if queue and self._running[name] < self.max_per_account:
+                return name, queue.popleft()
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while (task := self._next_task()) is None:
+                    if self._closed and not any(self._queues.values()):
+                        return
+                    self._cond.wait()
+                name, (future, fn, args, kwargs) = task
+                client = self._clients[name]
+                self._running[name] += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(client, *args, **kwargs)
+                    except BaseException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+            finally:
+                with self._cond:
+                    self._running[name] -= 1
+                    self._cond.notify_all()
+
+    def close(self):
+        """Finish queued tasks, then shut down workers and connections."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+        for client in self._clients.values():
+            client.close()
+        self._executor.shutdown()
+        self._adapter.close()
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
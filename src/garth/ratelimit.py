@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+# How often a request waiting for a concurrency slot checks again
+POLL_INTERVAL = 0.05
+
+
+def retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a `Retry-After` header, in either its
+    delay-seconds or HTTP-date form."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Client-side token bucket with adaptive concurrency.
+
+    Requests take a token, refilled at `rate` per second up to `burst`,
+    and one of `concurrency` slots. Concurrency grows additively while
+    requests succeed and halves on HTTP 429, at which point all requests
+    wait for the server's `Retry-After`, or an exponential backoff if it
+    doesn't send one.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Requests that can be made at once after being idle.
+        max_concurrency: Upper bound on requests in flight.
+        min_concurrency: Lower bound on requests in flight.
+        max_backoff: Longest wait, in seconds, after a 429.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        max_backoff: float = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_backoff = max_backoff
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._backoff = 1.0
+        self._lock = threading.Lock()
+
+    @property
+    def backoff(self) -> float:
+        """Seconds until requests resume after a 429, or 0."""
+        return max(self._blocked_until - time.monotonic(), 0.0)
+
+    def try_acquire(self) -> float:
+        """Take a slot and a token if available.
+
+        Returns 0 on success, otherwise the seconds to wait before trying
+        again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self.in_flight >= int(self.concurrency):
+                return POLL_INTERVAL
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0
+
+    def acquire(self):
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def release(
+        self, status: int | None = None, retry_after: float | None = None
+    ):
+        """Return a slot, adapting to the response's status code.
+
+        `status` is None if the request failed without a response.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if status == 429:
+                self.throttled += 1
+                self.concurrency = max(
+                    self.min_concurrency, self.concurrency / 2
+                )
+                wait = (
+                    retry_after if retry_after is not None else self._backoff
+                )
+                self._backoff = min(self._backoff * 2, self.max_backoff)
+                self._blocked_until = max(
+                    self._blocked_until,
+                    time.monotonic() + min(wait, self.max_backoff),
+                )
+            elif status is not None and status < 400:
+                self._backoff = 1.0
+                self.concurrency = min(
+                    self.max_concurrency,
+                    self.concurrency + 1 / self.concurrency,
+                )
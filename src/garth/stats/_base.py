@@ -1,11 +1,22 @@
+import builtins
+from collections.abc import Iterator
+from contextlib import closing
 from datetime import date, timedelta
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from pydantic.dataclasses import dataclass
 from typing_extensions import Self
 
-from .. import http
-from ..utils import camel_to_snake_dict, format_end_date
+from .. import export, http
+from ..utils import (
+    build,
+    camel_to_snake_dict,
+    client_executor,
+    format_end_date,
+    trusted,
+)
+from ..warehouse import Warehouse
+from . import _pagination
 
 
 @dataclass
@@ -15,36 +26,191 @@ class Stats:
     _path: ClassVar[str]
     _page_size: ClassVar[int]
     _period_type: ClassVar[str | None] = None
+    _default_period: ClassVar[int] = 1
 
     @classmethod
     def list(
         cls,
         end: date | str | None = None,
-        period: int = 1,
+        period: int | None = None,
         *,
         client: http.Client | None = None,
-    ) -> list[Self]:
+        max_workers: int | None = None,
+        validate: bool = True,
+        warehouse: Warehouse | None = None,
+    ) -> builtins.list[Self]:
+        """Fetch `period` days or weeks ending on `end`, oldest first.
+
+        `period` defaults to `_default_period`: 1, or 28 for `DailyHRV`.
+        Ranges longer than `_page_size` are split into pages. The newest
+        page is fetched first; if it has data, the older pages are fetched
+        concurrently on the client's worker pool, at most `max_workers` at
+        a time; it defaults to the client's `max_workers`. With a
+        `warehouse`, days already stored are read from it and only missing
+        days are fetched.
+        """
         client = client or http.client
         end = format_end_date(end)
-        period_type = cls._period_type or (
-            "days" if "daily" in cls._path else "weeks"
+        period = period or cls._default_period
+        if warehouse is not None:
+            return warehouse.list(
+                cls,
+                end,
+                period,
+                client=client,
+                max_workers=max_workers,
+                validate=validate,
+            )
+        with client_executor(client, max_workers, _pagination.MAX_WORKERS) as (
+            executor,
+            limit,
+        ):
+            pages = _pagination.fetch(
+                lambda page: cls._get_page(
+                    *page, client=client, validate=validate
+                ),
+                cls._pages(end, period),
+                limit,
+                executor,
+            )
+            return _pagination.merge(pages)
+
+    @classmethod
+    def stream(
+        cls,
+        end: date | str | None = None,
+        period: int | None = None,
+        *,
+        client: http.Client | None = None,
+        max_workers: int | None = None,
+        validate: bool = True,
+        newest_first: bool = False,
+    ) -> Iterator[Self]:
+        """Yield the entries of `list`, oldest first as `Data.stream` does.
+
+        Pages are fetched newest first, so oldest first waits for the
+        whole range. With `newest_first`, entries are yielded page by
+        page as they're fetched instead.
+        """
+        client = client or http.client
+        end = format_end_date(end)
+        period = period or cls._default_period
+        with client_executor(client, max_workers, _pagination.MAX_WORKERS) as (
+            executor,
+            limit,
+        ):
+            pages = _pagination.fetch(
+                lambda page: cls._get_page(
+                    *page, client=client, validate=validate
+                ),
+                cls._pages(end, period),
+                limit,
+                executor,
+            )
+            if not newest_first:
+                yield from _pagination.merge(pages)
+                return
+            with closing(pages):
+                for page in pages:
+                    yield from reversed(page)
+
+    @classmethod
+    async def alist(
+        cls,
+        end: date | str | None = None,
+        period: int | None = None,
+        *,
+        client: http.AsyncClient,
+        validate: bool = True,
+    ) -> builtins.list[Self]:
+        """Async variant of `list`."""
+        end = format_end_date(end)
+        period = period or cls._default_period
+        pages = await _pagination.afetch(
+            lambda page: client.run(
+                lambda c: cls._get_page(*page, client=c, validate=validate)
+            ),
+            cls._pages(end, period),
         )
+        return _pagination.merge(pages)
+
+    @classmethod
+    def to_arrow(
+        cls,
+        end: date | str | None = None,
+        period: int | None = None,
+        *,
+        client: http.Client | None = None,
+        max_workers: int | None = None,
+    ) -> Any:
+        """`list` as an Arrow table, with a typed column per field.
 
-        if period > cls._page_size:
-            page = cls.list(end, cls._page_size, client=client)
-            if not page:
-                return []
-            page = (
-                cls.list(
-                    end - timedelta(**{period_type: cls._page_size}),
-                    period - cls._page_size,
-                    client=client,
-                )
-                + page
+        Columns are built straight from the responses rather than from
+        instances, so values aren't validated. Requires pyarrow.
+        """
+        client = client or http.client
+        end = format_end_date(end)
+        period = period or cls._default_period
+        with client_executor(client, max_workers, _pagination.MAX_WORKERS) as (
+            executor,
+            limit,
+        ):
+            pages = _pagination.fetch(
+                lambda page: cls._get_payloads(*page, client=client),
+                cls._pages(end, period),
+                limit,
+                executor,
             )
-            return page
+            return export.from_payloads(cls, _pagination.merge(pages))
+
+    @classmethod
+    def to_frame(
+        cls,
+        end: date | str | None = None,
+        period: int | None = None,
+        *,
+        client: http.Client | None = None,
+        max_workers: int | None = None,
+    ) -> Any:
+        """`to_arrow` as a pandas DataFrame, with dates as datetime64.
+
+        Requires pyarrow and pandas.
+        """
+        table = cls.to_arrow(
+            end, period, client=client, max_workers=max_workers
+        )
+        return table.to_pandas(date_as_object=False)
 
-        start = end - timedelta(**{period_type: period - 1})
+    @classmethod
+    def _period_unit(cls) -> str:
+        return cls._period_type or (
+            "days" if "daily" in cls._path else "weeks"
+        )
+
+    @classmethod
+    def _pages(cls, end: date, period: int) -> builtins.list[_pagination.Page]:
+        return _pagination.plan(
+            end, period, cls._page_size, cls._period_unit()
+        )
+
+    @classmethod
+    def _get_page(
+        cls,
+        end: date,
+        period: int,
+        *,
+        client: http.Client,
+        validate: bool = True,
+    ) -> builtins.list[Self]:
+        page_dirs = cls._get_payloads(end, period, client=client)
+        with trusted(not validate):
+            return [build(cls, stat) for stat in page_dirs]
+
+    @classmethod
+    def _get_payloads(
+        cls, end: date, period: int, *, client: http.Client
+    ) -> builtins.list[dict[str, Any]]:
+        start = end - timedelta(**{cls._period_unit(): period - 1})
         path = cls._path.format(start=start, end=end, period=period)
         response = client.connectapi(path)
 
@@ -53,8 +219,7 @@ class Stats:
         if not page_dirs:
             return []
 
-        page_dirs = [camel_to_snake_dict(stat) for stat in page_dirs]
-        return [cls(**stat) for stat in page_dirs]
+        return [camel_to_snake_dict(stat) for stat in page_dirs]
 
     @classmethod
     def _parse_response(cls, response):
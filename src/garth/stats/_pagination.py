@@ -0,0 +1,101 @@
+"""Pagination for `Stats` classes.
+
+A range is planned as pages newest first. Fetching stops at the first
+empty page, since there's no older data, and the remaining pages are
+joined oldest first.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from datetime import date, timedelta
+from itertools import chain
+from typing import TypeVar
+
+from ..utils import bounded_map
+
+
+MAX_WORKERS = 10
+
+T = TypeVar("T")
+Page = tuple[date, int]
+
+
+def plan(
+    end: date, period: int, page_size: int, period_type: str = "days"
+) -> list[Page]:
+    """Split `period` units ending on `end` into `(end, period)` pages.
+
+    Pages are ordered newest first.
+    """
+    return [
+        (
+            end - timedelta(**{period_type: offset}),
+            min(page_size, period - offset),
+        )
+        for offset in range(0, period, page_size)
+    ]
+
+
+def fetch(
+    get_page: Callable[[Page], list[T]],
+    pages: list[Page],
+    max_workers: int = MAX_WORKERS,
+    executor: Executor | None = None,
+) -> Iterator[list[T]]:
+    """Yield pages newest first until one comes back empty.
+
+    The newest page is fetched on the calling thread so an empty range
+    costs one request. If it has data, older pages are fetched
+    concurrently on `executor`, or a pool for this call, at most
+    `max_workers` at a time. Closing the iterator cancels pages that
+    haven't started.
+    """
+    if not pages or not (newest := get_page(pages[0])):
+        return
+    yield newest
+    if len(pages) == 1:
+        return
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(pages) - 1)
+                )
+            )
+        older = stack.enter_context(
+            closing(bounded_map(executor, get_page, pages[1:], max_workers))
+        )
+        for page in older:
+            if not page:
+                return
+            yield page
+
+
+async def afetch(
+    get_page: Callable[[Page], Awaitable[list[T]]], pages: list[Page]
+) -> list[list[T]]:
+    """Async variant of `fetch` that returns the pages as a list.
+
+    Older pages are all requested at once. A failed page is only raised
+    if no newer page was empty.
+    """
+    if not pages or not (newest := await get_page(pages[0])):
+        return []
+    older = await asyncio.gather(
+        *(get_page(page) for page in pages[1:]), return_exceptions=True
+    )
+    result = [newest]
+    for page in older:
+        if isinstance(page, BaseException):
+            raise page
+        if not page:
+            break
+        result.append(page)
+    return result
+
+
+def merge(pages: Iterable[list[T]]) -> list[T]:
+    """Join pages given newest first into a single list, oldest first."""
+    return list(chain.from_iterable(reversed(list(pages))))
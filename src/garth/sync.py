@@ -0,0 +1,241 @@
+"""Incremental sync of `Data` and `Stats` classes.
+
+Each account and class has a watermark: the last day whose data is
+considered final. A sync fetches from the day after the watermark up to
+today. Days within `settle_days` of today may still change, so the
+watermark stops short of them and they're fetched again on every run.
+A hash of each recent day's content tells which days actually changed.
+"""
+
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Generic, TypeVar
+
+from . import http
+from .utils import (
+    _calendar_date,
+    _period_unit,
+    asdict,
+    connect_sqlite,
+    format_end_date,
+)
+
+
+T = TypeVar("T")
+
+
+class SyncStore:
+    """Watermarks and per-day content hashes persisted in SQLite.
+
+    Safe to share between threads, and between `Sync`s for different
+    accounts.
+    """
+
+    def __init__(self, path: str = "~/.garth/sync.sqlite"):
+        self.path, self._conn = connect_sqlite(path)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "account TEXT NOT NULL, kind TEXT NOT NULL, "
+                "day TEXT NOT NULL, PRIMARY KEY (account, kind))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS days ("
+                "account TEXT NOT NULL, kind TEXT NOT NULL, "
+                "day TEXT NOT NULL, hash TEXT NOT NULL, "
+                "PRIMARY KEY (account, kind, day))"
+            )
+
+    def watermark(self, account: str, kind: str) -> date | None:
+        """Last day of `kind` considered final for `account`, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT day FROM watermarks WHERE account = ? AND kind = ?",
+                (account, kind),
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def hashes(self, account: str, kind: str) -> dict[date, str]:
+        """Content hashes of the days after the watermark."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, hash FROM days WHERE account = ? AND kind = ?",
+                (account, kind),
+            ).fetchall()
+        return {date.fromisoformat(day): hash_ for day, hash_ in rows}
+
+    def save(
+        self,
+        account: str,
+        kind: str,
+        start: date,
+        end: date,
+        hashes: dict[date, str],
+        watermark: date | None,
+    ):
+        """Record a sync of `start` to `end`.
+
+        Replaces the hashes for those days with `hashes`, then advances
+        the watermark and drops hashes for days up to it.
+        """
+        key = (account, kind)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM days WHERE account = ? AND kind = ? "
+                "AND day BETWEEN ? AND ?",
+                (*key, start.isoformat(), end.isoformat()),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO days VALUES (?, ?, ?, ?)",
+                [
+                    (*key, day.isoformat(), hash_)
+                    for day, hash_ in hashes.items()
+                ],
+            )
+            if watermark is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                    (*key, watermark.isoformat()),
+                )
+                self._conn.execute(
+                    "DELETE FROM days WHERE account = ? AND kind = ? "
+                    "AND day <= ?",
+                    (*key, watermark.isoformat()),
+                )
+
+    def reset(self, account: str, kind: str | None = None):
+        """Forget what's been synced for an account, or one of its
+        classes, so the next sync starts over."""
+        where = "account = ?" + (" AND kind = ?" if kind else "")
+        params = (account, kind) if kind else (account,)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM watermarks WHERE {where}", params)
+            self._conn.execute(f"DELETE FROM days WHERE {where}", params)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class SyncResult(Generic[T]):
+    """Outcome of syncing one class.
+
+    Attributes:
+        kind: Name of the class synced.
+        items: Entries for days that are new or whose content changed,
+            oldest first.
+        changed: Days that are new, changed or no longer have data.
+        start: First day fetched, or None if nothing was due.
+        end: Last day fetched.
+        watermark: Last day now considered final.
+    """
+
+    kind: str
+    items: list[T] = field(default_factory=list)
+    changed: list[date] = field(default_factory=list)
+    start: date | None = None
+    end: date | None = None
+    watermark: date | None = None
+
+
+class Sync:
+    """Fetches only the days of a `Data` or `Stats` class that are new
+    or may still change.
+
+    Args:
+        store: Where watermarks are kept. Defaults to
+            `SyncStore("~/.garth/sync.sqlite")`.
+        settle_days: Days before today whose data may still change.
+        days: Days to backfill the first time a class is synced.
+        client: Client to fetch with. Defaults to `garth.client`.
+        account: Name watermarks are kept under. Defaults to the
+            client's username.
+    """
+
+    def __init__(
+        self,
+        store: SyncStore | None = None,
+        *,
+        settle_days: int = 3,
+        days: int = 30,
+        client: http.Client | None = None,
+        account: str | None = None,
+    ):
+        self.store = store or SyncStore()
+        self.settle_days = settle_days
+        self.days = days
+        self.client = client or http.client
+        self._account = account
+
+    @property
+    def account(self) -> str:
+        if self._account is None:
+            self._account = self.client.username
+        return self._account
+
+    def run(
+        self, cls: type[T], end: date | str | None = None, **kwargs
+    ) -> SyncResult[T]:
+        """Sync `cls` up to `end`, which defaults to today.
+
+        `kwargs` are passed to `cls.list`, such as `validate` or
+        `max_workers`. Entries without a calendar date aren't tracked.
+        """
+        kind = cls.__name__
+        end = format_end_date(end)
+        # Weekly stats are keyed by the first day of each week
+        span = 7 if _period_unit(cls) == "weeks" else 1
+        watermark = self.store.watermark(self.account, kind)
+        start = (
+            watermark + timedelta(days=1)
+            if watermark
+            else end - timedelta(days=self.days - 1)
+        )
+        if start > end:
+            return SyncResult(kind, watermark=watermark)
+
+        periods = (end - start).days // span + 1
+        items = cls.list(end, periods, client=self.client, **kwargs)  # type: ignore[attr-defined]
+        by_day: defaultdict[date, list[T]] = defaultdict(list)
+        for item in items:
+            # Weeks starting before `start` were final at the last sync
+            day = _calendar_date(cls, item)
+            if day is not None and day >= start:
+                by_day[day].append(item)
+        hashes = {day: _hash(entries) for day, entries in by_day.items()}
+
+        previous = self.store.hashes(self.account, kind)
+        changed = sorted(
+            day
+            for day in set(hashes) | {d for d in previous if d <= end}
+            if hashes.get(day) != previous.get(day)
+        )
+        settled = end - timedelta(days=self.settle_days + span - 1)
+        if settled >= start:
+            watermark = settled
+        self.store.save(self.account, kind, start, end, hashes, watermark)
+        return SyncResult(
+            kind,
+            items=[item for day in changed for item in by_day.get(day, [])],
+            changed=changed,
+            start=start,
+            end=end,
+            watermark=watermark,
+        )
+
+    def run_all(
+        self, classes: list[type], end: date | str | None = None
+    ) -> dict[str, SyncResult]:
+        """Sync each class in turn, keyed by class name."""
+        return {cls.__name__: self.run(cls, end) for cls in classes}
+
+
+def _hash(entries: list[Any]) -> str:
+    raw = json.dumps(asdict(entries), sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
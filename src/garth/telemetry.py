@@ -1,6 +1,10 @@
+import atexit
 import json
+import queue
 import re
+import threading
 import uuid
+import weakref
 from collections.abc import Callable
 from typing import Any
 
@@ -58,6 +62,12 @@ JSON_SENSITIVE_FIELDS = [
 SENSITIVE_HEADERS = ["Authorization", "Cookie", "Set-Cookie"]
 SENSITIVE_HEADERS_LOWER = {h.lower() for h in SENSITIVE_HEADERS}
 
+# Pre-compiled regex for JSON fields in text that doesn't parse, such as
+# a truncated body. A value cut off by truncation is matched to the end.
+_JSON_FIELD_PATTERNS = [
+    re.compile(rf'("{fld}"\s*:\s*)"[^"]*"?') for fld in JSON_SENSITIVE_FIELDS
+]
+
 # Pre-compiled regex for cookie sanitization
 _COOKIE_PATTERN = re.compile(r"=[^;]*")
 
@@ -84,7 +94,8 @@ def sanitize(text: str) -> str:
                     data[fld] = REDACTED
             return json.dumps(data)
     except (json.JSONDecodeError, TypeError):
-        pass
+        for pattern in _JSON_FIELD_PATTERNS:
+            text = pattern.sub(rf'\1"{REDACTED}"', text)
 
     return text
 
@@ -104,6 +115,18 @@ def _scrubbing_callback(m):
 
 
 class Telemetry(BaseSettings):
+    """Captures each HTTP response for telemetry.
+
+    The response hook only copies what's logged, with request and
+    response bodies cut to `max_body_size` bytes if set, and queues it;
+    the response itself isn't kept. A background thread takes up to
+    `batch_size` queued responses at a time, sanitizes them and passes
+    the batch to `batch_callback`, or each one to `callback`, so requests
+    aren't slowed down. When more than `queue_size` responses are
+    waiting, new ones are dropped and counted in `dropped`. Queued
+    responses are flushed by `close` and when the interpreter exits.
+    """
+
     model_config = SettingsConfigDict(
         env_prefix="GARTH_TELEMETRY_",
         extra="ignore",
@@ -112,7 +135,13 @@ class Telemetry(BaseSettings):
     enabled: bool = False
     send_to_logfire: bool = False
     token: str = DEFAULT_TOKEN
+    queue_size: int = 1000
+    batch_size: int = 100
+    max_body_size: int | None = None
     callback: Callable[[dict], None] | None = Field(default=None, exclude=True)
+    batch_callback: Callable[[list[dict]], None] | None = Field(
+        default=None, exclude=True
+    )
     session_id: str = Field(
         default_factory=lambda: uuid.uuid4().hex[:16],
         exclude=True,
@@ -120,9 +149,19 @@ class Telemetry(BaseSettings):
     _logfire_configured: bool = False
     _logfire_instance: Any = None
     _attached_sessions: set = set()
+    _queue: Any = None
+    _worker: Any = None
+    _lock: Any = None
+    _dropped: int = 0
 
     def model_post_init(self, __context):
         self._attached_sessions = set()
+        self._lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """Responses dropped because the queue was full."""
+        return self._dropped
 
     def _default_callback(self, data: dict):
         """Default callback that sends to logfire."""
@@ -133,40 +172,148 @@ class Telemetry(BaseSettings):
         )
 
     def _response_hook(self, response: Response, *args, **kwargs):
-        """Session hook that captures request/response data."""
+        """Session hook that queues the response's fields for the worker."""
         if not self.enabled:
             return
+        try:
+            captured = self._capture(response)
+        except Exception:
+            return  # Don't let telemetry errors break the app
+        if captured is None:  # pragma: no cover
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._queue = queue.Queue(maxsize=self.queue_size)
+                _queues.add(self._queue)
+                self._worker = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="garth-telemetry",
+                    daemon=True,
+                )
+                self._worker.start()
+            try:
+                self._queue.put_nowait(captured)
+            except queue.Full:
+                self._dropped += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued response has been handled.
+
+        Returns False if `timeout` seconds passed first.
+        """
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                return True
+            pending = self._queue
+        return _flush(pending, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Deliver every queued response, then stop the worker.
 
+        A later response starts a new worker. Returns False if `timeout`
+        seconds passed first.
+        """
+        with self._lock:
+            worker, pending = self._worker, self._queue
+            self._worker = None
+        if worker is None or not worker.is_alive():
+            return True
+        _queues.discard(pending)
+        try:
+            # Handled after everything queued before it
+            pending.put(None, timeout=timeout)
+        except queue.Full:
+            return False
+        worker.join(timeout)
+        return not worker.is_alive()
+
+    def _run(self, pending: queue.Queue):
+        while True:
+            batch = [pending.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            records = []
+            for item in batch:
+                if isinstance(item, dict):
+                    if (data := self._sanitized(item)) is not None:
+                        records.append(data)
+                    continue
+                # Flush and stop markers wait for the records before them
+                self._deliver(records)
+                records = []
+                if item is None:
+                    return
+                item.set()
+            self._deliver(records)
+
+    def _capture(self, response: Response) -> dict[str, Any] | None:
+        """Copy what `_record` needs, so the response can be freed."""
+        request = response.request
+        if request is None:
+            return None
+        body = request.body
+        return {
+            "method": request.method,
+            "url": request.url,
+            "status_code": response.status_code,
+            "request_headers": dict(request.headers),
+            "response_headers": dict(response.headers),
+            "request_body": body[: self.max_body_size]
+            if isinstance(body, (str, bytes))
+            else None,
+            "response_body": (response.content or b"")[: self.max_body_size],
+        }
+
+    def _sanitized(self, captured: dict[str, Any]) -> dict[str, Any] | None:
+        """Build the sanitized record for a captured response."""
         try:
-            request = response.request
-            if request is None:  # pragma: no cover
-                return
             data = {
                 "session_id": self.session_id,
                 "garth_version": __version__,
-                "method": request.method,
-                "url": request.url,
-                "status_code": response.status_code,
+                "method": captured["method"],
+                "url": captured["url"],
+                "status_code": captured["status_code"],
                 "request_headers": str(
-                    sanitize_headers(dict(request.headers))
+                    sanitize_headers(captured["request_headers"])
                 ),
                 "response_headers": str(
-                    sanitize_headers(dict(response.headers))
+                    sanitize_headers(captured["response_headers"])
                 ),
             }
 
-            if request.body:
-                body = request.body
+            if body := captured["request_body"]:
                 if isinstance(body, bytes):
                     body = body.decode("utf-8", errors="replace")
                 data["request_body"] = sanitize(body)
 
-            data["response_body"] = sanitize(response.text)
-
-            callback = self.callback or self._default_callback
-            callback(data)
+            data["response_body"] = sanitize(
+                captured["response_body"].decode("utf-8", errors="replace")
+            )
         except Exception:
-            pass  # Don't let telemetry errors break the app
+            return None  # Don't let telemetry errors break the app
+        return data
+
+    def _deliver(self, records: list[dict[str, Any]]):
+        """Pass sanitized records to the batch callback or callback."""
+        if not records:
+            return
+        if self.batch_callback is not None:
+            try:
+                self.batch_callback(records)
+            except Exception:
+                pass  # Don't let telemetry errors break the app
+            return
+        callback = self.callback or self._default_callback
+        for data in records:
+            try:
+                callback(data)
+            except Exception:
+                pass
 
     def configure(
         self,
@@ -174,6 +321,7 @@ class Telemetry(BaseSettings):
         send_to_logfire: bool | None = None,
         token: str | None = None,
         callback: Callable[[dict], None] | None = None,
+        batch_callback: Callable[[list[dict]], None] | None = None,
     ):
         """
         Configure telemetry. Disabled by default.
@@ -185,6 +333,9 @@ class Telemetry(BaseSettings):
             callback: Custom callback for telemetry data. If provided,
                 logfire will not be configured and data will be passed
                 to this callback instead.
+            batch_callback: Custom callback that gets a list of up to
+                `batch_size` records at a time. Takes precedence over
+                `callback`, and logfire is not configured.
         """
         if enabled is not None:
             self.enabled = enabled
@@ -194,12 +345,18 @@ class Telemetry(BaseSettings):
             self.token = token
         if callback is not None:
             self.callback = callback
+        if batch_callback is not None:
+            self.batch_callback = batch_callback
 
         if not self.enabled:
             return
 
         # Configure logfire only if using default callback and not yet done
-        if self.callback is None and not self._logfire_configured:
+        if (
+            self.callback is None
+            and self.batch_callback is None
+            and not self._logfire_configured
+        ):
             self._configure_logfire()
 
     def _configure_logfire(self):
@@ -233,3 +390,24 @@ class Telemetry(BaseSettings):
 
         session.hooks["response"].append(self._response_hook)
         self._attached_sessions.add(session_id)
+
+
+# Queues of running workers, flushed at exit since workers are daemons
+_queues: weakref.WeakSet[queue.Queue] = weakref.WeakSet()
+
+
+def _flush(pending: queue.Queue, timeout: float | None) -> bool:
+    done = threading.Event()
+    try:
+        # Handled after everything queued before it
+        pending.put(done, timeout=timeout)
+    except queue.Full:
+        return False
+    return done.wait(timeout)
+
+
+@atexit.register
+def _flush_all(timeout: float = 5.0):
+    """Deliver what's queued before the interpreter exits."""
+    for pending in list(_queues):
+        _flush(pending, timeout)
@@ -1,7 +1,50 @@
 import dataclasses
+import json
+import os
 import re
+import sqlite3
+import threading
+import types
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+    ORJSON_AVAILABLE = False
+
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 CAMEL_TO_SNAKE = re.compile(
@@ -9,6 +52,9 @@ CAMEL_TO_SNAKE = re.compile(
 )
 
 
+# Responses reuse a small set of keys, so conversions are memoized. The
+# bound only matters for keys that embed ids or dates.
+@lru_cache(maxsize=4096)
 def camel_to_snake(camel_str: str) -> str:
     snake_str = CAMEL_TO_SNAKE.sub(r"_\1", camel_str)
     return snake_str.lower()
@@ -17,22 +63,62 @@ def camel_to_snake(camel_str: str) -> str:
 def camel_to_snake_dict(camel_dict: dict[str, Any]) -> dict[str, Any]:
     """
     Converts a dictionary's keys from camel case to snake case. This version
-    handles nested dictionaries and lists.
+    handles nested dictionaries and lists of dictionaries.
     """
     snake_dict: dict[str, Any] = {}
-    for k, v in camel_dict.items():
-        new_key = camel_to_snake(k)
-        if isinstance(v, dict):
-            snake_dict[new_key] = camel_to_snake_dict(v)
-        elif isinstance(v, list):
-            snake_dict[new_key] = [
-                camel_to_snake_dict(i) if isinstance(i, dict) else i for i in v
-            ]
-        else:
-            snake_dict[new_key] = v
+    # Nested dicts are converted from a stack of (source, target) pairs
+    # rather than recursively
+    stack = [(camel_dict, snake_dict)]
+    while stack:
+        source, target = stack.pop()
+        for k, v in source.items():
+            if isinstance(v, dict):
+                target[camel_to_snake(k)] = child = {}
+                stack.append((v, child))
+            elif isinstance(v, list):
+                target[camel_to_snake(k)] = items = v.copy()
+                # Lists without dicts, such as lists of samples, are only
+                # scanned in C
+                if dict not in map(type, items):
+                    continue
+                for i, item in enumerate(items):
+                    if isinstance(item, dict):
+                        items[i] = child = {}
+                        stack.append((item, child))
+            else:
+                target[camel_to_snake(k)] = v
     return snake_dict
 
 
+def _snake_case_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    return {camel_to_snake(k): v for k, v in pairs}
+
+
+def _snake_case_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return camel_to_snake_dict(value)
+    if isinstance(value, list) and dict in map(type, value):
+        return [
+            camel_to_snake_dict(i) if isinstance(i, dict) else i for i in value
+        ]
+    return value
+
+
+def loads(content: bytes | str, snake_case: bool = False) -> Any:
+    """Decode JSON, with orjson if it's installed.
+
+    With `snake_case`, the keys of every object are converted to snake
+    case. Without orjson, keys are converted as objects are decoded rather
+    than in a second pass over the result.
+    """
+    if orjson is not None:
+        data = orjson.loads(content)
+        return _snake_case_keys(data) if snake_case else data
+    if snake_case:
+        return json.loads(content, object_pairs_hook=_snake_case_pairs)
+    return json.loads(content)
+
+
 def remove_dto_suffix(key: str) -> str:
     """Remove _dto or DTO suffix from a key."""
     if key.endswith("_dto"):
@@ -77,23 +163,494 @@ def date_range(date_: date | str, days: int):
         yield date_ - timedelta(days=day)
 
 
+def bounded_map(
+    executor: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    limit: int,
+    *,
+    ordered: bool = True,
+) -> Iterator[R]:
+    """Like `executor.map`, but with at most `limit` calls in flight.
+
+    Results are yielded in input order, or as they complete when
+    `ordered` is false. Submitting lazily keeps one caller from taking
+    over a pool shared with others and bounds how many results are held
+    at once. Calls not yet started are cancelled if the iterator is
+    closed early.
+    """
+    futures: deque[Future[R]] = deque()
+    try:
+        for item in items:
+            if len(futures) >= limit:
+                if ordered:
+                    yield futures.popleft().result()
+                else:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        futures.remove(future)
+                        yield future.result()
+            futures.append(executor.submit(fn, item))
+        if ordered:
+            while futures:
+                yield futures.popleft().result()
+        else:
+            for future in as_completed(list(futures)):
+                futures.remove(future)
+                yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@contextmanager
+def client_executor(
+    client: Any, max_workers: int | None, default: int
+) -> Iterator[tuple[Executor, int]]:
+    """The client's worker pool and how many calls to run on it at once.
+
+    `max_workers` defaults to the client's, or `default` for clients
+    without one. Clients without a worker pool get one for this call.
+    """
+    if not max_workers:
+        max_workers = getattr(client, "max_workers", None)
+        if not isinstance(max_workers, int):
+            max_workers = default
+    executor = getattr(client, "executor", None)
+    if isinstance(executor, Executor):
+        yield executor, max_workers
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield executor, max_workers
+
+
+def connect_sqlite(path: str) -> tuple[str, sqlite3.Connection]:
+    """Open a SQLite database that can be shared between threads.
+
+    `~` in `path` is expanded and missing directories are created. Returns
+    the expanded path and the connection; callers serialize access with a
+    lock of their own.
+    """
+    path = os.path.expanduser(path)
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    return path, sqlite3.connect(path, check_same_thread=False)
+
+
+def _period_unit(cls: type) -> str:
+    period_unit = getattr(cls, "_period_unit", None)
+    return period_unit() if period_unit else "days"
+
+
+def _calendar_date(cls: type, item: Any) -> date | None:
+    calendar_date = getattr(cls, "_calendar_date", None)
+    if calendar_date:
+        return calendar_date(item)
+    return getattr(item, "calendar_date", None)
+
+
 def asdict(obj):
-    if dataclasses.is_dataclass(obj):
-        result = {}
-        for field in dataclasses.fields(obj):
-            value = getattr(obj, field.name)
-            result[field.name] = asdict(value)
-        return result
+    """Data classes as dicts, recursively, with dates and datetimes as ISO
+    strings. Lists are copied.
+
+    Each class's fields are converted by a plan made the first time it's
+    seen, so fields of primitive types are copied without inspecting
+    their values, and lists of them, such as `heart_rate_values`, are
+    copied whole.
+    """
+    plan = _asdict_plans.get(type(obj))
+    if plan is None:
+        if isinstance(obj, list):
+            return [asdict(v) for v in obj]
+        if isinstance(obj, datetime | date):
+            return obj.isoformat()
+        if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+            return obj
+        plan = _asdict_plans[type(obj)] = _asdict_plan(type(obj))
+    result = {}
+    for name, dump in plan:
+        value = getattr(obj, name)
+        if dump is not None and value is not None:
+            value = dump(value)
+        result[name] = value
+    return result
+
 
-    if isinstance(obj, list):
-        return [asdict(v) for v in obj]
+def dumps(obj: Any) -> bytes:
+    """Encode data classes, and lists and dicts of them, as JSON bytes.
 
+    Dates and datetimes are ISO strings, as with `asdict`. With orjson,
+    data classes are encoded directly, without building dicts first.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def _json_default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        plan = _asdict_plans.get(type(obj))
+        if plan is None:
+            plan = _asdict_plans[type(obj)] = _asdict_plan(type(obj))
+        return {name: getattr(obj, name) for name, _ in plan}
     if isinstance(obj, datetime | date):
         return obj.isoformat()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+_Dump = Callable[[Any], Any] | None
+_asdict_plans: dict[type, list[tuple[str, _Dump]]] = {}
+
+
+def _asdict_plan(cls: type) -> list[tuple[str, _Dump]]:
+    fields = getattr(cls, "__pydantic_fields__", None)
+    if fields is not None:
+        hints = {name: field.annotation for name, field in fields.items()}
+    else:
+        try:
+            hints = get_type_hints(cls)
+        except (NameError, TypeError):
+            hints = {}
+    return [
+        (field.name, _dumper(hints.get(field.name, Any)))
+        for field in dataclasses.fields(cls)
+    ]
+
+
+def _dumper(tp: Any) -> _Dump:
+    """How `asdict` converts a value of type `tp`, or None if it's used
+    as is."""
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return _dumper(args[0])
+        if all(_dumper(arg) is None for arg in args):
+            return None
+        return asdict
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        dump = _dumper(item)
+        if dump is None:
+            return list
+        return lambda values: [v if v is None else dump(v) for v in values]
+    if origin is Literal or tp in _PRIMITIVES:
+        return None
+    if tp in (date, datetime):
+        return _isoformat
+    return asdict
+
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
 
+
+_trusted: ContextVar[bool] = ContextVar("trusted", default=False)
+
+
+@contextmanager
+def trusted(enabled: bool = True) -> Iterator[None]:
+    """Build data classes with `build` without validating the payload.
+
+    Fields holding data classes, dates or datetimes are validated as
+    usual; every other value is used as returned by the API. This pays
+    off for payloads with large arrays of plain values and makes little
+    difference otherwise. Use it for bulk fetches where the upstream
+    schema is trusted.
+    """
+    token = _trusted.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+_deferred: ContextVar[bool] = ContextVar("deferred", default=False)
+
+
+@contextmanager
+def deferred(enabled: bool = True) -> Iterator[None]:
+    """Have `build` defer nested data classes and lists to first access.
+
+    Other fields are set right away, validated unless inside `trusted()`.
+    Fields holding data classes, lists, dates or datetimes keep the raw
+    payload until they're first read, so reading a few summary fields of
+    a large response doesn't pay for the rest of it.
+
+    The first deferred build of a class sets a descriptor on the class
+    for each deferred field. It only runs for fields still pending, so
+    other instances behave as before.
+    """
+    token = _deferred.set(enabled)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def build(cls: type[T], data: dict[str, Any]) -> T:
+    """`cls(**data)`, skipping validation inside `trusted()` and building
+    nested values on first access inside `deferred()`."""
+    if _deferred.get():
+        return _construct_deferred(cls, data, not _trusted.get())
+    if _trusted.get():
+        return _construct(cls, data)
+    return cls(**data)
+
+
+_MISSING = object()
+_Plan = list[tuple[str, str, Callable[[Any], Any] | None, Any]]
+
+
+class _ConstructPlan(NamedTuple):
+    names: frozenset[str]
+    required: frozenset[str]
+    # Payload key to field name, for fields with an alias
+    aliases: dict[str, str]
+    defaults: dict[str, Any]
+    factories: list[tuple[str, Callable[[], Any]]]
+    converters: list[tuple[str, Callable[[Any], Any]]]
+
+
+def _construct(cls: type[T], data: dict[str, Any]) -> T:
+    plan = _construct_plans.get(cls)
+    if plan is None:
+        plan = _construct_plans[cls] = _construct_plan(cls)
+    given = data
+    if plan.aliases:
+        # Fields with an alias are only read from it, as in validation
+        given = dict(data)
+        for key, name in plan.aliases.items():
+            given.pop(name, None)
+            if key in data:
+                given[name] = data[key]
+    if not plan.required <= given.keys():
+        # Let validation report the missing field
+        return cls(**data)
+    # Copying and filtering whole dicts keeps the per-field work to the
+    # fields that need converting
+    values = plan.defaults | given
+    for key in values.keys() - plan.names:
+        del values[key]
+    for name, factory in plan.factories:
+        if name not in given:
+            values[name] = factory()
+    for name, convert in plan.converters:
+        if (value := given.get(name)) is not None:
+            values[name] = convert(value)
+    obj = object.__new__(cls)
+    obj.__dict__.update(values)
+    return obj
+
+
+_construct_plans: dict[type, _ConstructPlan] = {}
+
+
+def _construct_plan(cls: type) -> _ConstructPlan:
+    names, required, aliases, defaults = set(), set(), {}, {}
+    factories, converters = [], []
+    for name, key, convert, default in _plan(cls):
+        names.add(name)
+        if key != name:
+            aliases[key] = name
+        if default is _MISSING:
+            required.add(name)
+        elif callable(default):
+            factories.append((name, default))
+        else:
+            defaults[name] = default
+        if convert is not None:
+            converters.append((name, convert))
+    return _ConstructPlan(
+        frozenset(names),
+        frozenset(required),
+        aliases,
+        defaults,
+        factories,
+        converters,
+    )
+
+
+def _plan(cls: type) -> _Plan:
+    """`(name, key, convert, default)` for each field of `cls`, where
+    `key` is the field's key in the payload."""
+    plan: _Plan = []
+    for name, field in cls.__pydantic_fields__.items():  # type: ignore[attr-defined]
+        if field.default_factory is not None:
+            default = field.default_factory
+        elif field.is_required():
+            default = _MISSING
+        else:
+            default = field.default
+            # Wrap callables so they aren't taken as factories
+            if callable(default):
+                default = partial(lambda d: d, default)
+        plan.append(
+            (
+                name,
+                field.validation_alias
+                if isinstance(field.validation_alias, str)
+                else field.alias or name,
+                _converter(field.annotation),
+                default,
+            )
+        )
+    return plan
+
+
+def _converter(tp: Any) -> Callable[[Any], Any] | None:
+    """Conversion a trusted value of type `tp` needs, or None.
+
+    Values holding data classes, dates or datetimes are handed whole to
+    pydantic-core, which builds nested objects and lists of them several
+    times faster than `_construct` can in Python.
+    """
+    if _needs_conversion(tp):
+        return TypeAdapter(tp).validate_python
+    return None
+
+
+def _needs_conversion(tp: Any) -> bool:
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        return any(
+            _needs_conversion(arg)
+            for arg in get_args(tp)
+            if arg is not type(None)
+        )
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        return _needs_conversion(item)
+    if origin is not None:
+        return False
+    return dataclasses.is_dataclass(tp) or tp in (date, datetime)
+
+
+# Instance attribute holding raw values of deferred fields
+_PENDING = "__garth_pending__"
+_DeferredPlan = tuple[
+    list[tuple[str, str, Any]],
+    dict[str, Callable[[Any], Any]],
+    Callable[[Any], dict[str, Any]] | None,
+]
+
+
+class _DeferredField:
+    """Builds a field left raw by `deferred()` the first time it's read.
+
+    It's a non-data descriptor, so fields already in the instance's
+    `__dict__` are read as usual.
+    """
+
+    def __init__(self, name: str, default: Any):
+        self.name = name
+        self.default = default
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            if self.default is _MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        pending = obj.__dict__.get(_PENDING, {})
+        if (entry := pending.get(self.name)) is None:
+            return obj.__dict__[self.name]
+        convert, raw = entry
+        # Threads racing here may both convert, but all see the first value
+        value = obj.__dict__.setdefault(self.name, convert(raw))
+        # Replace rather than mutate the pending values, which copies of
+        # `obj` made with `copy.copy` share
+        rest = {k: v for k, v in pending.items() if k != self.name}
+        if rest:
+            obj.__dict__[_PENDING] = rest
+        else:
+            obj.__dict__.pop(_PENDING, None)
+        return value
+
+
+def _construct_deferred(
+    cls: type[T], data: dict[str, Any], validate: bool
+) -> T:
+    plan = _deferred_plans.get((cls, validate))
+    if plan is None:
+        with _deferred_lock:
+            plan = _deferred_plans.get((cls, validate))
+            if plan is None:
+                plan = _deferred_plan(cls, validate)
+                _install_deferred_fields(cls, plan[1])
+                _deferred_plans[(cls, validate)] = plan
+    defaults, converters, validate_rest = plan
+    validated = validate_rest(data) if validate_rest else {}
+    values, pending = {}, {}
+    for name, key, default in defaults:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                return cls(**data)
+            values[name] = default() if callable(default) else default
+        elif value is not None and name in converters:
+            pending[name] = (converters[name], value)
+        else:
+            values[name] = validated.get(key, value)
+    obj = object.__new__(cls)
+    obj.__dict__.update(values)
+    if pending:
+        obj.__dict__[_PENDING] = pending
     return obj
 
 
+_deferred_plans: dict[tuple[type, bool], _DeferredPlan] = {}
+_deferred_lock = threading.Lock()
+
+
+def _install_deferred_fields(cls: type, names: Iterable[str]):
+    """Set a `_DeferredField` on `cls` for each of `names`, once per
+    class and before its first deferred instance is returned."""
+    for name in names:
+        if not isinstance(cls.__dict__.get(name), _DeferredField):
+            setattr(
+                cls, name, _DeferredField(name, getattr(cls, name, _MISSING))
+            )
+
+
+def _deferred_plan(cls: type, validate: bool) -> _DeferredPlan:
+    defaults = []
+    converters: dict[str, Callable[[Any], Any]] = {}
+    rest: dict[str, Any] = {}
+    for (name, key, convert, default), field in zip(
+        _plan(cls),
+        cls.__pydantic_fields__.values(),  # type: ignore[attr-defined]
+    ):
+        defaults.append((name, key, default))
+        tp = field.annotation
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if get_origin(tp) in (Union, types.UnionType) and len(args) == 1:
+            tp = args[0]
+        if hasattr(tp, "__pydantic_fields__"):
+            converters[name] = partial(
+                _construct_deferred, tp, validate=validate
+            )
+        elif convert is not None or get_origin(tp) is list:
+            if validate:
+                converters[name] = TypeAdapter(
+                    field.annotation
+                ).validate_python
+            elif convert is not None:
+                converters[name] = convert
+        else:
+            rest[key] = NotRequired[field.annotation]
+    validate_rest = None
+    if validate and rest:
+        # Validate every other field in one pass
+        fields = TypedDict(f"{cls.__name__}Fields", rest)  # type: ignore[misc]
+        validate_rest = TypeAdapter(fields).validate_python
+    return defaults, converters, validate_rest
+
+
 def get_localized_datetime(
     gmt_timestamp: int, local_timestamp: int
 ) -> datetime:
@@ -0,0 +1,273 @@
+"""Local SQLite storage for `Data` and `Stats` entries.
+
+Each class gets its own table, named after the class, with a column per
+scalar field for querying, the full entry as JSON, and an index on
+`(user_profile_pk, calendar_date)`. A separate table records which days
+have been fetched, so days without data aren't fetched again.
+"""
+
+import builtins
+import json
+import threading
+import types
+from datetime import date, datetime, timedelta
+from functools import cache
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+from . import http
+from .utils import (
+    _calendar_date,
+    _period_unit,
+    connect_sqlite,
+    format_end_date,
+)
+
+
+T = TypeVar("T")
+
+_COLUMN_TYPES: dict[Any, str] = {
+    bool: "INTEGER",
+    int: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    date: "TEXT",
+    datetime: "TEXT",
+}
+_RESERVED = {"user_profile_pk", "calendar_date", "data"}
+
+
+class Warehouse:
+    """Entries of every `Data` and `Stats` class, stored in SQLite.
+
+    Pass it to `list` to serve days already stored and fetch only the
+    missing ones:
+
+        warehouse = Warehouse()
+        garth.DailySteps.list("2025-07-10", 365, warehouse=warehouse)
+
+    Days within `settle_days` of the day they were fetched may still
+    change, so they're fetched again until they're older than that.
+
+    Args:
+        path: SQLite database file, or ":memory:".
+        settle_days: Days after which a day's data is considered final.
+    """
+
+    def __init__(
+        self, path: str = "~/.garth/warehouse.sqlite", settle_days: int = 3
+    ):
+        self.path, self._conn = connect_sqlite(path)
+        self.settle_days = settle_days
+        self._lock = threading.Lock()
+        self._tables: dict[type, builtins.list[str]] = {}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _fetched ("
+                "kind TEXT NOT NULL, user_profile_pk INTEGER NOT NULL, "
+                "calendar_date TEXT NOT NULL, "
+                "PRIMARY KEY (kind, user_profile_pk, calendar_date))"
+            )
+
+    def list(
+        self,
+        cls: type[T],
+        end: date | str | None = None,
+        period: int = 1,
+        *,
+        client: http.Client | None = None,
+        user_profile_pk: int | None = None,
+        **kwargs,
+    ) -> builtins.list[T]:
+        """`cls.list(end, period)`, fetching only days not yet stored.
+
+        Missing days are fetched with `cls.list` in one range, from the
+        oldest missing day to the newest, and stored. `kwargs` are passed
+        to `cls.list`.
+        """
+        client = client or http.client
+        end = format_end_date(end)
+        pk = user_profile_pk or client.user_profile["profileId"]
+        span = 7 if _period_unit(cls) == "weeks" else 1
+        start = end - timedelta(days=period * span - 1)
+        missing = self.missing(cls, start, end, pk)
+        if missing:
+            first, last = missing[0], missing[-1]
+            periods = (last - first).days // span + 1
+            items = cls.list(last, periods, client=client, **kwargs)  # type: ignore[attr-defined]
+            self.put(cls, items, first, last, pk)
+        return self.get(cls, start, end, pk)
+
+    def missing(
+        self, cls: type, start: date, end: date, user_profile_pk: int
+    ) -> builtins.list[date]:
+        """Days from `start` to `end` that haven't been fetched, or may
+        have changed since."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT calendar_date FROM _fetched WHERE kind = ? "
+                "AND user_profile_pk = ? AND calendar_date BETWEEN ? AND ?",
+                (
+                    cls.__name__,
+                    user_profile_pk,
+                    start.isoformat(),
+                    end.isoformat(),
+                ),
+            ).fetchall()
+        fetched = {row[0] for row in rows}
+        return [
+            day
+            for day in (
+                start + timedelta(days=i)
+                for i in range((end - start).days + 1)
+            )
+            if day.isoformat() not in fetched
+        ]
+
+    def put(
+        self,
+        cls: type[T],
+        items: builtins.list[T],
+        start: date,
+        end: date,
+        user_profile_pk: int,
+    ):
+        """Store `items` as every entry from `start` to `end`, replacing
+        what was stored for those days."""
+        columns = self._table(cls)
+        adapter = _adapter(cls)
+        rows = []
+        for item in items:
+            day = _calendar_date(cls, item)
+            if day is None:
+                continue
+            start = min(start, day)
+            data = adapter.dump_python(item, mode="json", by_alias=True)
+            rows.append(
+                (
+                    user_profile_pk,
+                    day.isoformat(),
+                    json.dumps(data),
+                    *(_column_value(item, name) for name in columns),
+                )
+            )
+        # Days that may still change are fetched again next time
+        settled = date.today() - timedelta(days=self.settle_days)
+        fetched = [
+            (cls.__name__, user_profile_pk, day.isoformat())
+            for day in (
+                start + timedelta(days=i)
+                for i in range((min(end, settled) - start).days + 1)
+            )
+        ]
+        table = _quote(cls.__name__)
+        names = ", ".join(
+            ["user_profile_pk", "calendar_date", "data"]
+            + [_quote(name) for name in columns]
+        )
+        placeholders = ", ".join("?" * (len(columns) + 3))
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE user_profile_pk = ? "
+                "AND calendar_date BETWEEN ? AND ?",
+                (user_profile_pk, start.isoformat(), end.isoformat()),
+            )
+            self._conn.executemany(
+                f"INSERT INTO {table} ({names}) VALUES ({placeholders})", rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO _fetched VALUES (?, ?, ?)", fetched
+            )
+
+    def get(
+        self, cls: type[T], start: date, end: date, user_profile_pk: int
+    ) -> builtins.list[T]:
+        """Stored entries from `start` to `end`, oldest first."""
+        self._table(cls)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {_quote(cls.__name__)} "
+                "WHERE user_profile_pk = ? AND calendar_date BETWEEN ? AND ? "
+                "ORDER BY calendar_date, rowid",
+                (user_profile_pk, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        adapter = _adapter(cls)
+        return [adapter.validate_json(row[0]) for row in rows]
+
+    def execute(self, sql: str, params: tuple = ()) -> builtins.list[tuple]:
+        """Run a query against the stored tables."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _table(self, cls: type) -> builtins.list[str]:
+        """Create the table for `cls` if needed and return its scalar
+        columns."""
+        if (columns := self._tables.get(cls)) is not None:
+            return columns
+        fields = {
+            name: sql_type
+            for name, field in cls.__pydantic_fields__.items()  # type: ignore[attr-defined]
+            if name not in _RESERVED
+            and (sql_type := _column_type(field.annotation)) is not None
+        }
+        table = _quote(cls.__name__)
+        definitions = ", ".join(
+            [
+                "user_profile_pk INTEGER NOT NULL",
+                "calendar_date TEXT NOT NULL",
+                "data TEXT NOT NULL",
+            ]
+            + [f"{_quote(name)} {type_}" for name, type_ in fields.items()]
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ({definitions})"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                f"{_quote(cls.__name__ + '_day')} "
+                f"ON {table} (user_profile_pk, calendar_date)"
+            )
+            existing = {
+                row[1]
+                for row in self._conn.execute(f"PRAGMA table_info({table})")
+            }
+            # Fields added to the class since the table was created
+            for name, type_ in fields.items():
+                if name not in existing:
+                    self._conn.execute(
+                        f"ALTER TABLE {table} "
+                        f"ADD COLUMN {_quote(name)} {type_}"
+                    )
+        columns = self._tables[cls] = builtins.list(fields)
+        return columns
+
+
+@cache
+def _adapter(cls: type) -> TypeAdapter:
+    return TypeAdapter(cls)
+
+
+def _column_type(tp: Any) -> str | None:
+    if get_origin(tp) in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        tp = args[0]
+    return _COLUMN_TYPES.get(tp)
+
+
+def _column_value(item: Any, name: str) -> Any:
+    value = getattr(item, name)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
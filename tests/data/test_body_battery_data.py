@@ -106,6 +106,30 @@ def test_daily_body_battery_stress_get(authed_client: Client):
                 assert change is not None
 
 
+def test_daily_body_battery_stress_series(authed_client: Client, vcr):
+    with vcr.use_cassette("test_daily_body_battery_stress_get.yaml"):
+        daily_data = DailyBodyBatteryStress.get(
+            "2023-07-20", client=authed_client
+        )
+    assert daily_data
+    bb_readings = daily_data.body_battery_readings
+    bb = daily_data.body_battery_series
+    assert list(bb.timestamps) == [r.timestamp for r in bb_readings]
+    assert list(bb.values) == [r.level for r in bb_readings]
+    assert daily_data.max_body_battery == max(r.level for r in bb_readings)
+    assert daily_data.body_battery_change == (
+        bb_readings[-1].level - bb_readings[0].level
+    )
+
+    stress = daily_data.stress_series
+    assert list(stress.values) == [
+        r.stress_level
+        for r in daily_data.stress_readings
+        if r.stress_level >= 0
+    ]
+    assert daily_data.stress_readings is daily_data.stress_readings
+
+
 @pytest.mark.vcr
 def test_daily_body_battery_stress_get_no_data(authed_client: Client):
     # Test with a date that likely has no data
@@ -342,3 +366,20 @@ def test_body_battery_data_get_unexpected_error():
     result = BodyBatteryData.get("2023-07-20", client=mock_client)
     # Should handle unexpected errors and return empty list
     assert result == []
+
+
+def test_body_battery_data_list_duck_typed_client():
+    """Clients without a worker pool get one for the call."""
+    mock_client = MagicMock(spec=["connectapi"])
+    mock_client.connectapi.return_value = [{"activityName": "Test"}]
+
+    result = BodyBatteryData.list("2023-07-20", 3, client=mock_client)
+    assert sorted(item.calendar_date for item in result) == [
+        date(2023, 7, 18),
+        date(2023, 7, 19),
+        date(2023, 7, 20),
+    ]
+    streamed = BodyBatteryData.stream("2023-07-20", 3, client=mock_client)
+    assert sorted(streamed, key=lambda item: item.calendar_date) == sorted(
+        result, key=lambda item: item.calendar_date
+    )
@@ -50,3 +50,20 @@ def test_daily_sleep_data_list(authed_client: Client):
             data_list[i].daily_sleep_dto.calendar_date
             <= data_list[i + 1].daily_sleep_dto.calendar_date
         )
+
+
+def test_daily_sleep_data_list_lazy(authed_client: Client, vcr):
+    end = date(2025, 7, 7)
+    with vcr.use_cassette("test_daily_sleep_data_list.yaml"):
+        lazy = DailySleepData.list(
+            end, 2, client=authed_client, max_workers=1, lazy=True
+        )
+    with vcr.use_cassette("test_daily_sleep_data_list.yaml"):
+        eager = DailySleepData.list(
+            end, 2, client=authed_client, max_workers=1
+        )
+    # Sorting reads each day's calendar date
+    assert "daily_sleep_dto" in vars(lazy[0])
+    assert "sleep_scores" not in vars(lazy[0].daily_sleep_dto)
+    assert lazy == eager
+    assert lazy[-1].sleep_need_minutes == eager[-1].sleep_need_minutes
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
 from garth import DailyHeartRate
-from garth.http import Client
+from garth.http import AsyncClient, Client
 
 
 @pytest.mark.vcr
@@ -26,6 +28,20 @@ def test_daily_heart_rate_readings(authed_client: Client):
     assert first_reading.heart_rate > 0
 
 
+def test_daily_heart_rate_series(authed_client: Client, vcr):
+    with vcr.use_cassette("test_daily_heart_rate_get.yaml"):
+        hr = DailyHeartRate.get("2026-01-07", client=authed_client)
+    assert hr is not None
+    series = hr.series
+    assert series is hr.series
+    assert len(series) == len(hr.readings)
+    assert [reading.heart_rate for reading in hr.readings] == list(
+        series.values
+    )
+    assert series.min() == min(r.heart_rate for r in hr.readings)
+    assert series.max() == max(r.heart_rate for r in hr.readings)
+
+
 @pytest.mark.vcr
 def test_daily_heart_rate_list(authed_client: Client):
     hr_list = DailyHeartRate.list(
@@ -35,3 +51,63 @@ def test_daily_heart_rate_list(authed_client: Client):
     # Should be sorted by date
     dates = [hr.calendar_date for hr in hr_list]
     assert dates == sorted(dates)
+
+
+def test_daily_heart_rate_alist(authed_client: Client, vcr):
+    async def alist():
+        async with AsyncClient(authed_client) as client:
+            return await DailyHeartRate.alist(
+                end="2026-01-07", days=3, client=client
+            )
+
+    with vcr.use_cassette("test_daily_heart_rate_list.yaml"):
+        hr_list = asyncio.run(alist())
+    assert len(hr_list) > 0
+    dates = [hr.calendar_date for hr in hr_list]
+    assert dates == sorted(dates)
+
+
+def test_daily_heart_rate_stream(authed_client: Client, vcr):
+    with vcr.use_cassette("test_daily_heart_rate_list.yaml"):
+        stream = DailyHeartRate.stream(
+            end="2026-01-07", days=3, client=authed_client, max_workers=1
+        )
+        hr_list = list(stream)
+    assert len(hr_list) > 0
+    dates = [hr.calendar_date for hr in hr_list]
+    assert dates == sorted(dates)
+    with vcr.use_cassette("test_daily_heart_rate_list.yaml"):
+        newest = DailyHeartRate.stream(
+            end="2026-01-07",
+            days=3,
+            client=authed_client,
+            max_workers=1,
+            newest_first=True,
+        )
+        assert [hr.calendar_date for hr in newest] == dates[::-1]
+
+
+def test_daily_heart_rate_stream_unordered(authed_client: Client, vcr):
+    with vcr.use_cassette("test_daily_heart_rate_list.yaml"):
+        stream = DailyHeartRate.stream(
+            end="2026-01-07", days=3, client=authed_client, ordered=False
+        )
+        dates = {hr.calendar_date for hr in stream}
+    assert max(dates).isoformat() == "2026-01-07"
+
+
+def test_daily_heart_rate_get_duck_typed_client(authed_client: Client, vcr):
+    class ForwardingClient:
+        # Forwards connectapi without knowing about snake_case
+        def connectapi(self, path, **kwargs):
+            assert "snake_case" not in kwargs
+            return authed_client.connectapi(path, **kwargs)
+
+    with vcr.use_cassette("test_daily_heart_rate_get.yaml"):
+        expected = DailyHeartRate.get("2026-01-07", client=authed_client)
+    with vcr.use_cassette("test_daily_heart_rate_get.yaml"):
+        hr = DailyHeartRate.get(
+            "2026-01-07",
+            client=ForwardingClient(),  # type: ignore[arg-type]
+        )
+    assert hr == expected
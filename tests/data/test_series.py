@@ -0,0 +1,116 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import garth.data._series
+from garth.data import TimeSeries
+
+
+MINUTE = 60_000
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def use_numpy(request, monkeypatch: pytest.MonkeyPatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(garth.data._series, "np", None)
+    return request.param
+
+
+def test_from_rows():
+    series = TimeSeries.from_rows(
+        [[0, 60], [MINUTE, None], [None, 70], [2 * MINUTE, 80]]
+    )
+    assert series.timestamps == array("q", [0, 2 * MINUTE])
+    assert series.values == array("h", [60, 80])
+    assert len(series) == 2
+    assert series.nbytes == 20
+    assert list(series) == [
+        (datetime(1970, 1, 1, tzinfo=timezone.utc), 60),
+        (datetime(1970, 1, 1, 0, 2, tzinfo=timezone.utc), 80),
+    ]
+
+
+def test_from_rows_options():
+    rows = [
+        [2 * MINUTE, "draining", 50, 1.0],
+        [0, "charging", 40, 1.0],
+        [MINUTE, "charging", None, 1.0],
+        [3 * MINUTE],
+    ]
+    series = TimeSeries.from_rows(rows, column=2)
+    assert series.timestamps == array("q", [0, 2 * MINUTE])
+    assert series.values == array("h", [40, 50])
+    stress = TimeSeries.from_rows([[0, -1], [MINUTE, 25], [2 * MINUTE, -2]])
+    assert len(stress) == 3
+    stress = TimeSeries.from_rows(
+        [[0, -1], [MINUTE, 25], [2 * MINUTE, -2]], min_value=0
+    )
+    assert stress.values == array("h", [25])
+
+
+def test_concat():
+    a = TimeSeries.from_rows([[0, 60]])
+    b = TimeSeries.from_rows([[MINUTE, 70]])
+    assert TimeSeries.concat([a, b]) == TimeSeries.from_rows(
+        [[0, 60], [MINUTE, 70]]
+    )
+    assert len(TimeSeries.concat([])) == 0
+
+
+def test_aggregates(use_numpy: bool):
+    series = TimeSeries.from_rows([[0, 60], [MINUTE, 70], [2 * MINUTE, 95]])
+    assert (series.min(), series.max(), series.mean()) == (60, 95, 75)
+    empty = TimeSeries.from_rows([])
+    assert (empty.min(), empty.max(), empty.mean()) == (None, None, None)
+
+
+def test_window():
+    series = TimeSeries.from_rows([[i * MINUTE, 60 + i] for i in range(10)])
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    window = series.window(
+        epoch + timedelta(minutes=2), epoch + timedelta(minutes=5)
+    )
+    assert window.timestamps == array(
+        "q", [2 * MINUTE, 3 * MINUTE, 4 * MINUTE]
+    )
+    assert window.values == array("h", [62, 63, 64])
+    assert (window.first(), window.last(), window.change()) == (62, 64, 2)
+    # Shares memory with the series it was taken from
+    assert isinstance(window.values, memoryview)
+    series.values[3] = 99
+    assert window.max() == 99
+    # Naive datetimes are UTC and either end may be open
+    assert len(series.window(datetime(1970, 1, 1, 0, 8))) == 2
+    assert len(series.window(end=epoch + timedelta(minutes=1))) == 1
+    assert len(series.window(epoch + timedelta(hours=1))) == 0
+    assert TimeSeries.concat([window]) == window
+
+
+def test_change():
+    assert TimeSeries.from_rows([[0, 60]]).change() is None
+    empty = TimeSeries.from_rows([])
+    assert (empty.first(), empty.last(), empty.change()) == (None, None, None)
+
+
+def test_resample(use_numpy: bool):
+    series = TimeSeries.from_rows(
+        [[0, 60], [MINUTE, 70], [5 * MINUTE, 90], [6 * MINUTE, 80]]
+    )
+    interval = timedelta(minutes=5)
+    mean = series.resample(interval)
+    assert mean.timestamps == array("q", [0, 5 * MINUTE])
+    assert mean.values == array("d", [65, 85])
+    assert series.resample(interval, how="min").values == array("h", [60, 80])
+    assert series.resample(interval, how="max").values == array("h", [70, 90])
+    assert len(TimeSeries.from_rows([]).resample(interval)) == 0
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    series = TimeSeries.from_rows([[0, 60]])
+    timestamps, values = series.to_numpy()
+    assert timestamps[0] == np.datetime64(0, "ms")
+    assert values.tolist() == [60]
@@ -1,9 +1,10 @@
+import asyncio
 from datetime import date
 
 import pytest
 
 from garth import SleepData
-from garth.http import Client
+from garth.http import AsyncClient, Client
 
 
 @pytest.mark.vcr
@@ -22,3 +23,39 @@ def test_sleep_data_list(authed_client: Client):
     sleep_data = SleepData.list(end, days, client=authed_client, max_workers=1)
     assert sleep_data[-1].daily_sleep_dto.calendar_date == end
     assert len(sleep_data) == days
+
+
+def test_sleep_data_alist(authed_client: Client, vcr):
+    async def alist():
+        async with AsyncClient(authed_client) as client:
+            return await SleepData.alist(date(2021, 7, 20), 20, client=client)
+
+    with vcr.use_cassette("test_sleep_data_list.yaml"):
+        sleep_data = asyncio.run(alist())
+    assert sleep_data[-1].daily_sleep_dto.calendar_date == date(2021, 7, 20)
+    assert len(sleep_data) == 20
+
+    async def alist_lazy():
+        async with AsyncClient(authed_client) as client:
+            return await SleepData.alist(
+                date(2021, 7, 20), 20, client=client, validate=False, lazy=True
+            )
+
+    with vcr.use_cassette("test_sleep_data_list.yaml"):
+        lazy = asyncio.run(alist_lazy())
+    assert "sleep_movement" not in vars(lazy[-1])
+    assert lazy == sleep_data
+
+
+def test_sleep_data_list_without_validation(authed_client: Client, vcr):
+    end = date(2021, 7, 20)
+    with vcr.use_cassette("test_sleep_data_list.yaml"):
+        validated = SleepData.list(
+            end, 20, client=authed_client, max_workers=1
+        )
+    with vcr.use_cassette("test_sleep_data_list.yaml"):
+        trusted = SleepData.list(
+            end, 20, client=authed_client, max_workers=1, validate=False
+        )
+    assert trusted == validated
+    assert isinstance(trusted[-1].daily_sleep_dto.calendar_date, date)
@@ -1,8 +1,10 @@
 from datetime import date, datetime, timedelta, timezone
+from typing import ClassVar
 
 import pytest
 
 from garth.data import WeightData
+from garth.data._base import Data
 from garth.http import Client
 
 
@@ -103,3 +105,33 @@ def test_weight_data_list_empty(authed_client: Client):
     days = 15
     weight_data = WeightData.list(end, days, client=authed_client)
     assert len(weight_data) == 0
+
+
+def test_weight_data_list_range_requests(authed_client: Client, monkeypatch):
+    paths = []
+
+    def connectapi(path, *args, **kwargs):
+        paths.append(path.split("?")[0])
+        return {"dailyWeightSummaries": []}
+
+    monkeypatch.setattr(authed_client, "connectapi", connectapi)
+    assert WeightData.list(date(2025, 6, 15), 400, client=authed_client) == []
+    # One request per 365 days rather than one per day
+    assert sorted(paths) == [
+        "/weight-service/weight/range/2024-05-12/2024-06-15",
+        "/weight-service/weight/range/2024-06-16/2025-06-15",
+    ]
+    paths.clear()
+    assert list(WeightData.stream("2025-06-15", 1, client=authed_client)) == []
+    assert paths == ["/weight-service/weight/range/2025-06-15/2025-06-15"]
+
+
+def test_range_days_requires_get_range():
+    with pytest.raises(TypeError, match="_get_range"):
+
+        class Ranged(Data):
+            _range_days: ClassVar[int | None] = 7
+
+            @classmethod
+            def get(cls, day=None, *, client=None):
+                return None
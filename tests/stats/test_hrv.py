@@ -1,9 +1,10 @@
+import asyncio
 from datetime import date
 
 import pytest
 
 from garth import DailyHRV
-from garth.http import Client
+from garth.http import AsyncClient, Client
 
 
 @pytest.mark.vcr
@@ -37,3 +38,14 @@ def test_daily_hrv_paginate_no_results(authed_client: Client):
     days = 40
     daily_hrv = DailyHRV.list(end, days, client=authed_client)
     assert daily_hrv == []
+
+
+def test_daily_hrv_alist_paginate(authed_client: Client, vcr):
+    async def alist():
+        async with AsyncClient(authed_client) as client:
+            return await DailyHRV.alist(date(2023, 7, 20), 40, client=client)
+
+    with vcr.use_cassette("test_daily_hrv_paginate.yaml"):
+        daily_hrv = asyncio.run(alist())
+    assert daily_hrv[-1].calendar_date == date(2023, 7, 20)
+    assert len(daily_hrv) == 40
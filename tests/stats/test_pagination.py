@@ -0,0 +1,44 @@
+from datetime import date
+
+from garth.stats import _pagination
+
+
+def test_plan():
+    end = date(2023, 7, 20)
+    assert _pagination.plan(end, 60, 28) == [
+        (date(2023, 7, 20), 28),
+        (date(2023, 6, 22), 28),
+        (date(2023, 5, 25), 4),
+    ]
+    assert _pagination.plan(end, 2, 52, "weeks") == [(end, 2)]
+    assert _pagination.plan(end, 0, 28) == []
+
+
+def test_fetch_stops_at_empty_page():
+    pages = _pagination.plan(date(2023, 7, 20), 28 * 6, 28)
+    fetched = []
+
+    def get_page(page):
+        fetched.append(page)
+        return [page] if page[0] > date(2023, 5, 1) else []
+
+    result = list(_pagination.fetch(get_page, pages, max_workers=1))
+    assert result == [[pages[0]], [pages[1]], [pages[2]]]
+    assert fetched == pages[:4]
+
+
+def test_fetch_empty_newest_page():
+    fetched = []
+
+    def get_page(page):
+        fetched.append(page)
+        return []
+
+    pages = _pagination.plan(date(1990, 7, 20), 100, 28)
+    assert list(_pagination.fetch(get_page, pages)) == []
+    assert fetched == pages[:1]
+
+
+def test_merge():
+    assert _pagination.merge([[5, 6], [3, 4], [1, 2]]) == [1, 2, 3, 4, 5, 6]
+    assert _pagination.merge([]) == []
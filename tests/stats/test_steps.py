@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
 import pytest
@@ -22,3 +24,42 @@ def test_weekly_steps(authed_client: Client):
     weekly_steps = WeeklySteps.list(end, weeks, client=authed_client)
     assert len(weekly_steps) == weeks
     assert weekly_steps[-1].calendar_date == end - timedelta(days=6)
+
+
+def test_daily_steps_without_validation(authed_client: Client, vcr):
+    end = date(2023, 7, 20)
+    with vcr.use_cassette("test_daily_steps.yaml"):
+        validated = DailySteps.list(end, 20, client=authed_client)
+    with vcr.use_cassette("test_daily_steps.yaml"):
+        trusted = DailySteps.list(
+            end, 20, client=authed_client, validate=False
+        )
+    assert trusted == validated
+
+
+def test_daily_steps_pages_use_client_executor():
+    threads = set()
+
+    class StubClient:
+        max_workers = 2
+
+        def __init__(self, executor):
+            self.executor = executor
+
+        def connectapi(self, path):
+            threads.add(threading.current_thread().name)
+            start, end = path.rsplit("/", 2)[-2:]
+            values = {"totalSteps": 1, "totalDistance": 1, "stepGoal": 1}
+            return [{"calendarDate": end, "values": values}]
+
+    with ThreadPoolExecutor(thread_name_prefix="client") as executor:
+        steps = DailySteps.list(
+            date(2023, 7, 20), 28 * 3, client=StubClient(executor)
+        )
+    assert len(steps) == 3
+    # The newest page is fetched on the calling thread, the rest on the
+    # client's pool
+    main = threading.current_thread().name
+    assert main in threads
+    assert all(name.startswith("client_") for name in threads - {main})
+    assert len(threads) > 1
@@ -1,9 +1,11 @@
+import asyncio
 from datetime import date, timedelta
+from unittest.mock import Mock
 
 import pytest
 
 from garth import DailyStress, WeeklyStress
-from garth.http import Client
+from garth.http import AsyncClient, Client
 
 
 @pytest.mark.vcr
@@ -47,3 +49,60 @@ def test_weekly_stress_beyond_data(authed_client: Client):
     weeks = 1000
     weekly_stress = WeeklyStress.list(end, weeks, client=authed_client)
     assert len(weekly_stress) < weeks
+
+
+def test_daily_stress_alist_pagination(authed_client: Client, vcr):
+    async def alist():
+        async with AsyncClient(authed_client) as client:
+            return await DailyStress.alist(
+                date(2023, 7, 20), 60, client=client
+            )
+
+    with vcr.use_cassette("test_daily_stress_pagination.yaml"):
+        daily_stress = asyncio.run(alist())
+    assert [stress.calendar_date for stress in daily_stress] == [
+        date(2023, 7, 20) - timedelta(days=day) for day in range(59, -1, -1)
+    ]
+
+
+def test_daily_stress_pagination_stops_at_empty_page():
+    end = date(2023, 7, 20)
+    client = Mock()
+
+    def connectapi(path):
+        # Only the two newest pages have data
+        start = date.fromisoformat(path.split("/")[-2])
+        if start < end - timedelta(days=55):
+            return []
+        return [
+            {"calendarDate": str(start), "values": {"overallStressLevel": 1}}
+        ]
+
+    client.connectapi.side_effect = connectapi
+    daily_stress = DailyStress.list(end, 28 * 5, client=client, max_workers=1)
+    assert [stress.calendar_date for stress in daily_stress] == [
+        end - timedelta(days=55),
+        end - timedelta(days=27),
+    ]
+    assert client.connectapi.call_count == 3
+
+
+def test_daily_stress_stream(authed_client: Client, vcr):
+    with vcr.use_cassette("test_daily_stress_pagination.yaml"):
+        dates = [
+            stress.calendar_date
+            for stress in DailyStress.stream(
+                date(2023, 7, 20), 60, client=authed_client
+            )
+        ]
+    assert dates == [
+        date(2023, 7, 20) - timedelta(days=day) for day in range(59, -1, -1)
+    ]
+    with vcr.use_cassette("test_daily_stress_pagination.yaml"):
+        newest = [
+            stress.calendar_date
+            for stress in DailyStress.stream(
+                date(2023, 7, 20), 60, client=authed_client, newest_first=True
+            )
+        ]
+    assert newest == dates[::-1]
@@ -0,0 +1,76 @@
+import time
+from datetime import date
+
+from garth.cache import CachePolicy, MemoryCache, SQLiteCache, request_day
+
+
+def test_request_day():
+    assert request_day("/hrv-service/hrv/2023-07-20") == date(2023, 7, 20)
+    assert request_day(
+        "/usersummary-service/stats/stress/daily/2023-07-01/2023-07-20"
+    ) == date(2023, 7, 20)
+    assert request_day(
+        "/metrics-service/metrics/hillscore",
+        {"calendarDate": "2023-07-20"},
+    ) == date(2023, 7, 20)
+    assert request_day("/userprofile-service/socialProfile") is None
+
+
+def test_cache_policy():
+    policy = CachePolicy(
+        ttls={r"^/hrv-service/": 60}, settle_days=3, settled_ttl=None
+    )
+    today = date(2023, 7, 20)
+    assert policy.ttl("/hrv-service/hrv/2023-07-19", today=today) == 60
+    assert policy.ttl("/hrv-service/hrv/2023-07-01", today=today) is None
+    assert policy.ttl("/weight-service/weight/2023-07-01", today=today) == 0
+
+
+def test_sqlite_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path)
+    assert cache.get("key") is None
+    cache.set("key", b"value")
+    cache.set("expired", b"value", ttl=-1)
+    assert cache.get("key") == b"value"
+    assert cache.get("expired") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    cache.close()
+
+    # Persisted across instances
+    cache = SQLiteCache(path)
+    assert cache.get("key") == b"value"
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_sqlite_cache_ttl(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    cache.set("key", b"value", ttl=0.05)
+    assert cache.get("key") == b"value"
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"  # "b" is now least recently used
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == cache.get("c") == b"1234"
+    assert (len(cache), cache.size, cache.evictions) == (2, 8, 1)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.set("big", b"x" * 11)
+    assert cache.get("big") is None
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
+
+
+def test_memory_cache_ttl():
+    cache = MemoryCache()
+    cache.set("key", b"value", ttl=-1)
+    assert cache.get("key") is None
+    assert (len(cache), cache.size) == (0, 0)
@@ -0,0 +1,188 @@
+from array import array
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from garth import (
+    DailyBodyBatteryStress,
+    DailyHeartRate,
+    DailyHRV,
+    DailySteps,
+    DailyStress,
+    DailyTrainingStatus,
+    HRVData,
+    SleepData,
+)
+from garth.data._series import TimeSeries
+from garth.exc import GarthException
+from garth.http import Client
+
+
+pa = pytest.importorskip("pyarrow")
+
+from garth import export  # noqa: E402
+
+
+CASSETTES = Path(__file__).parent
+
+
+def test_export_stats(authed_client: Client, vcr, tmp_path):
+    cassette = CASSETTES / "stats" / "cassettes" / "test_daily_steps.yaml"
+    with vcr.use_cassette(str(cassette)):
+        steps = DailySteps.list(date(2023, 7, 20), 20, client=authed_client)
+
+    table = export.to_arrow(steps)
+    assert table.num_rows == 20
+    assert table.schema.field("calendar_date").type == pa.date32()
+    assert table.schema.field("total_steps").type == pa.int64()
+    assert table.column("total_steps").to_pylist() == [
+        s.total_steps for s in steps
+    ]
+
+    # Streamed in batches into a directory per day
+    path = str(tmp_path / "steps")
+    export.write_parquet(
+        export.record_batches(iter(steps), batch_size=8), path
+    )
+    assert len(list((tmp_path / "steps").iterdir())) == 20
+    written = export.read_parquet(path).sort_by("calendar_date")
+    assert written.select(table.column_names).equals(table)
+
+
+def test_export_nested(authed_client: Client, vcr):
+    cassette = CASSETTES / "data" / "cassettes" / "test_sleep_data_list.yaml"
+    with vcr.use_cassette(str(cassette)):
+        sleep = SleepData.list(
+            date(2021, 7, 20), 20, client=authed_client, max_workers=1
+        )
+
+    table = export.to_arrow(sleep)
+    # The day lives on a nested object, so it gets its own column
+    assert table.column("calendar_date").to_pylist() == [
+        s.daily_sleep_dto.calendar_date for s in sleep
+    ]
+    dto = table.schema.field("daily_sleep_dto").type
+    assert pa.types.is_struct(dto)
+    assert dto.field("calendar_date").type == pa.date32()
+    movement = table.schema.field("sleep_movement").type
+    assert movement.value_type.field("start_gmt").type == pa.timestamp("us")
+    assert table.column("daily_sleep_dto").to_pylist()[-1]["id"] == (
+        sleep[-1].daily_sleep_dto.id
+    )
+    assert export.to_arrow([], SleepData).schema == table.schema
+
+
+def test_export_samples(authed_client: Client, vcr, tmp_path):
+    cassettes = CASSETTES / "data" / "cassettes"
+    with vcr.use_cassette(str(cassettes / "test_daily_heart_rate_list.yaml")):
+        heart_rate = DailyHeartRate.list(
+            "2026-01-07", 3, client=authed_client, max_workers=1
+        )
+    table = pa.Table.from_batches(
+        export.samples(heart_rate, "series", batch_size=100)
+    )
+    assert table.schema.field("value").type == pa.int16()
+    assert table.num_rows == sum(len(hr.series) for hr in heart_rate)
+    assert table.column("value").to_pylist() == [
+        value for hr in heart_rate for _, value in hr.series
+    ]
+    assert (
+        table.column("timestamp").to_pylist()[0]
+        == next(iter(heart_rate[0].series))[0]
+    )
+    # The per-sample arrays can be left out of the daily table
+    assert (
+        "heart_rate_values"
+        not in export.schema(
+            DailyHeartRate, exclude=["heart_rate_values"]
+        ).names
+    )
+
+    with vcr.use_cassette(
+        str(cassettes / "test_daily_body_battery_stress_list.yaml")
+    ):
+        stress = DailyBodyBatteryStress.list(
+            date(2023, 7, 20), 3, client=authed_client, max_workers=1
+        )
+    table = pa.Table.from_batches(export.samples(stress, "stress_series"))
+    assert table.num_rows == sum(len(s.stress_series) for s in stress)
+
+    with vcr.use_cassette(str(cassettes / "test_hrv_data_list.yaml")):
+        hrv = HRVData.list(
+            date(2023, 7, 20), 2, client=authed_client, max_workers=1
+        )
+    path = str(tmp_path / "hrv")
+    export.write_parquet(export.samples(hrv, "hrv_readings"), path)
+    table = export.read_parquet(path).sort_by("reading_time_gmt")
+    assert table.num_rows == sum(len(h.hrv_readings) for h in hrv)
+    assert set(table.column("calendar_date").to_pylist()) == {
+        date(2023, 7, 19),
+        date(2023, 7, 20),
+    }
+    assert table.column("hrv_value").to_pylist()[0] == (
+        hrv[0].hrv_readings[0].hrv_value
+    )
+
+
+@pytest.mark.parametrize(
+    "typecode, arrow_type",
+    [
+        ("b", pa.int8()),
+        ("B", pa.uint8()),
+        ("H", pa.uint16()),
+        ("Q", pa.uint64()),
+    ],
+)
+def test_export_samples_typecodes(typecode, arrow_type):
+    series = TimeSeries.from_rows([[1000, 1], [2000, 2]], typecode=typecode)
+    item = SimpleNamespace(calendar_date=date(2023, 7, 20), series=series)
+    table = pa.Table.from_batches(export.samples([item], "series"))
+    assert table.schema.field("value").type == arrow_type
+    assert table.column("value").to_pylist() == [1, 2]
+
+
+def test_export_samples_unsupported_typecode():
+    series = TimeSeries(array("q", [1000]), memoryview(b"\x01").cast("?"))
+    item = SimpleNamespace(calendar_date=date(2023, 7, 20), series=series)
+    with pytest.raises(GarthException):
+        list(export.samples([item], "series"))
+
+
+@pytest.mark.parametrize(
+    "cls, end, period, cassette",
+    [
+        (DailyStress, date(2023, 7, 20), 20, "test_daily_stress.yaml"),
+        (DailyHRV, date(2023, 7, 20), 20, "test_daily_hrv.yaml"),
+        (
+            DailyTrainingStatus,
+            date(2025, 6, 11),
+            1,
+            "test_daily_training_status.yaml",
+        ),
+    ],
+)
+def test_stats_to_arrow(
+    cls, end, period, cassette, authed_client: Client, vcr
+):
+    cassette = CASSETTES / "stats" / "cassettes" / cassette
+    with vcr.use_cassette(str(cassette)):
+        stats = cls.list(end, period, client=authed_client)
+    with vcr.use_cassette(str(cassette)):
+        table = cls.to_arrow(end, period, client=authed_client)
+    # Same table as from the instances, without building them
+    assert table.equals(export.to_arrow(stats))
+    assert table.schema.field("calendar_date").type == pa.date32()
+
+
+def test_stats_to_frame(authed_client: Client, vcr):
+    pytest.importorskip("pandas")
+    cassette = CASSETTES / "stats" / "cassettes" / "test_daily_stress.yaml"
+    with vcr.use_cassette(str(cassette)):
+        frame = DailyStress.to_frame(
+            date(2023, 7, 20), 20, client=authed_client
+        )
+    assert len(frame) == 20
+    assert str(frame["calendar_date"].dtype).startswith("datetime64")
+    assert str(frame["overall_stress_level"].dtype) == "int64"
@@ -1,13 +1,30 @@
+import asyncio
+import gc
+import shutil
+import ssl
+import subprocess
 import tempfile
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from typing import Any, cast
 
+import httpx
 import pytest
+from requests import Response
 from requests.adapters import HTTPAdapter
+from requests.exceptions import RetryError
 
 from garth.auth_tokens import OAuth1Token, OAuth2Token
+from garth.cache import SQLiteCache
 from garth.exc import GarthException, GarthHTTPError
-from garth.http import Client
+from garth.http import AsyncClient, Client
+from garth.ratelimit import RateLimiter
+from garth.utils import bounded_map
 
 
 def test_dump_and_load(authed_client: Client):
@@ -350,6 +367,189 @@ def test_refresh_oauth2_token(authed_client: Client):
     assert profile["userName"]
 
 
+def test_refresh_oauth2_once(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    import garth.sso
+
+    fresh = authed_client.oauth2_token
+    assert isinstance(fresh, OAuth2Token)
+    exchanges = []
+    barrier = threading.Barrier(5)
+
+    def exchange(*args, **kwargs):
+        exchanges.append(args)
+        time.sleep(0.2)
+        return fresh
+
+    def request(method, url, headers, **kwargs):
+        assert headers["Authorization"] == str(fresh)
+        resp = Response()
+        resp.status_code = 200
+        return resp
+
+    def get(i):
+        barrier.wait()
+        return authed_client.get("connectapi", f"/path/{i}", api=True)
+
+    monkeypatch.setattr(garth.sso, "exchange", exchange)
+    monkeypatch.setattr(authed_client.sess, "request", request)
+    authed_client.oauth2_token = None
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(get, range(5)))
+    assert len(exchanges) == 1
+    assert authed_client.oauth2_token == fresh
+
+
+def test_background_refresh(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    import garth.sso
+
+    token = authed_client.oauth2_token
+    assert isinstance(token, OAuth2Token)
+    fresh = OAuth2Token(
+        **{**asdict(token), "expires_at": int(time.time() + 3600)}
+    )
+    refreshed = threading.Event()
+
+    def exchange(*args, **kwargs):
+        refreshed.set()
+        return fresh
+
+    monkeypatch.setattr(garth.sso, "exchange", exchange)
+    # Not expired, but within the refresh margin
+    token.expires_at = int(time.time() + 60)
+    assert not token.expired
+    authed_client.configure(refresh_margin=120)
+    try:
+        assert refreshed.wait(5)
+        refresher = authed_client._refresher
+        assert refresher
+        assert refresher.is_alive()
+        # None leaves it running, False turns it off
+        authed_client.configure(refresh_margin=None)
+        assert authed_client._refresher is refresher
+        authed_client.configure(refresh_margin=False)
+        assert authed_client._refresher is None
+        assert authed_client.refresh_margin is None
+        assert not refresher.is_alive()
+    finally:
+        authed_client.close()
+    assert authed_client.oauth2_token == fresh
+    assert authed_client._refresher is None
+
+
+def test_rate_limit_retries_throttled(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    statuses = [429, 200]
+
+    def request(*args, **kwargs):
+        resp = Response()
+        resp.status_code = statuses.pop(0)
+        resp.headers["Retry-After"] = "0.1"
+        resp._content = b"{}"
+        return resp
+
+    limiter = RateLimiter(max_concurrency=4)
+    hrv = RateLimiter()
+    monkeypatch.setattr(authed_client.sess, "request", request)
+    authed_client.configure(
+        rate_limiter=limiter, rate_limits={r"^/hrv-service/": hrv}
+    )
+    assert authed_client.connectapi("/hrv-service/hrv/2023-07-20") == {}
+    assert statuses == []
+    assert (limiter.throttled, hrv.throttled) == (1, 1)
+    assert limiter.concurrency == 2 + 1 / 2
+    assert limiter.in_flight == 0
+
+    # Without a limiter, 429 is raised as before
+    statuses = [429]
+    authed_client.rate_limiter = None
+    with pytest.raises(GarthHTTPError):
+        authed_client.connectapi("/userprofile-service/socialProfile")
+
+
+@pytest.fixture
+def throttling_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Local HTTPS server that answers every request with a 429."""
+    if (openssl := shutil.which("openssl")) is None:
+        pytest.skip("openssl is required to create a certificate")
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(
+        [
+            openssl,
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(cert))
+    monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1], hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rate_limiter_owns_429_through_adapter(throttling_server):
+    port, hits = throttling_server
+    # Requests go to https://127.0.0.1:{port} through the real adapter
+    client = Client(domain=f"0.0.1:{port}")
+    client.configure(status_forcelist=(429, 500), retries=3)
+    limiter = RateLimiter()
+    client.configure(rate_limiter=limiter)
+    with pytest.raises(GarthHTTPError):
+        client.get("127", "/throttled")
+    # One HTTP call per attempt, each one seen by the limiter
+    assert len(hits) == client.retries + 1
+    assert limiter.throttled == client.retries + 1
+    assert limiter.in_flight == 0
+
+    # Without a limiter, the adapter retries 429 in status_forcelist
+    hits.clear()
+    client.rate_limiter = None
+    client.configure(retries=1, backoff_factor=0)
+    with pytest.raises(RetryError):
+        client.get("127", "/throttled")
+    assert len(hits) == 2
+
+
 @pytest.mark.vcr
 def test_download(authed_client: Client):
     downloaded = authed_client.download(
@@ -435,3 +635,227 @@ def test_resume_login(client: Client):
     assert isinstance(oauth1, OAuth1Token)
     assert oauth2
     assert isinstance(oauth2, OAuth2Token)
+
+
+def _async_client(client: Client, handler) -> AsyncClient:
+    return AsyncClient(
+        client,
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_connectapi(authed_client: Client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == str(
+            authed_client.oauth2_token
+        )
+        if request.url.path == "/empty":
+            return httpx.Response(204)
+        return httpx.Response(200, json={"userName": "mtamizi"})
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            return (
+                await client.connectapi("/userprofile-service/socialProfile"),
+                await client.connectapi("/empty"),
+            )
+
+    assert asyncio.run(main()) == ({"userName": "mtamizi"}, None)
+
+
+def test_async_retries_and_raises(authed_client: Client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    authed_client.configure(retries=2, backoff_factor=0)
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            await client.connectapi("/wellness-service/wellness/foo")
+
+    with pytest.raises(GarthHTTPError):
+        asyncio.run(main())
+    assert len(calls) == 3
+
+
+def test_async_rate_limit(authed_client: Client):
+    statuses = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            statuses.pop(0), json={}, headers={"Retry-After": "0.1"}
+        )
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            return await client.post("connectapi", "/path", api=True)
+
+    authed_client.configure(rate_limiter=(limiter := RateLimiter()))
+    assert asyncio.run(main()).status_code == 200
+    assert limiter.throttled == 1
+    assert limiter.in_flight == 0
+
+
+def test_async_refresh_once(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    import garth.sso
+
+    fresh = authed_client.oauth2_token
+    assert isinstance(fresh, OAuth2Token)
+    exchanges = []
+
+    def exchange(*args, **kwargs):
+        exchanges.append(args)
+        return fresh
+
+    monkeypatch.setattr(garth.sso, "exchange", exchange)
+    authed_client.oauth2_token = None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            await asyncio.gather(
+                *(client.connectapi(f"/path/{i}") for i in range(10))
+            )
+
+    asyncio.run(main())
+    assert len(exchanges) == 1
+    assert authed_client.oauth2_token == fresh
+
+
+def test_async_run_shares_requests(authed_client: Client):
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"userName": "mtamizi"})
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            names = await asyncio.gather(
+                *(client.run(lambda c: c.username) for _ in range(5))
+            )
+            return names, client._user_profile
+
+    names, profile = asyncio.run(main())
+    assert names == ["mtamizi"] * 5
+    assert profile == {"userName": "mtamizi"}
+    assert paths == ["/userprofile-service/socialProfile"]
+
+
+def test_async_run_unsupported_attribute(authed_client: Client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with _async_client(authed_client, handler) as client:
+            await client.run(lambda c: c.executor)
+
+    with pytest.raises(AttributeError, match="only supports connectapi"):
+        asyncio.run(main())
+
+
+def test_executor_shared_and_reconfigured(client: Client):
+    executor = client.executor
+    assert client.executor is executor
+    assert executor._max_workers == client.max_workers
+
+    client.configure(max_workers=4)
+    assert client.executor is not executor
+    assert client.executor._max_workers == 4
+
+
+def test_reconfigure_executor_while_streaming(client: Client):
+    def slow(i):
+        time.sleep(0.01)
+        return i
+
+    old = client.executor
+    results = bounded_map(old, slow, range(6), 2)
+    assert next(results) == 0
+    client.configure(max_workers=3)
+    # The running map keeps submitting to the old pool
+    assert list(results) == [1, 2, 3, 4, 5]
+    assert client.executor is not old
+    assert client.executor._max_workers == 3
+
+    # The old pool is released once nothing holds it
+    ref = weakref.ref(old)
+    del old, results
+    gc.collect()
+    assert ref() is None
+
+
+def test_close_shuts_down_executor(session):
+    with Client(session=session) as client:
+        executor = client.executor
+    assert client._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_connectapi_cache(authed_client: Client, tmp_path, vcr):
+    path = "/usersummary-service/stats/stress/daily/2023-07-21/2023-07-21"
+    authed_client.configure(cache=SQLiteCache(str(tmp_path / "cache.sqlite")))
+    with vcr.use_cassette("test_connectapi.yaml"):
+        stress = authed_client.connectapi(path)
+    # Served from cache; the cassette would reject a second request
+    assert authed_client.connectapi(path) == stress
+    assert authed_client.cache is not None
+    assert (authed_client.cache.hits, authed_client.cache.misses) == (1, 1)
+
+    # Other accounts don't share entries
+    other = Client()
+    other.configure(
+        oauth1_token=OAuth1Token(oauth_token="other", oauth_token_secret="x"),
+        cache=authed_client.cache,
+    )
+    assert other._request_key(path, {}) != authed_client._request_key(path, {})
+    assert authed_client._cache_ttl(path, {"headers": {}}) == 0
+
+
+def test_connectapi_single_flight(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def request(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.2)
+        resp = Response()
+        resp.status_code = 200
+        resp._content = b'{"userName": "mtamizi"}'
+        return resp
+
+    def get_profile():
+        barrier.wait()
+        return authed_client.user_profile
+
+    monkeypatch.setattr(authed_client, "request", request)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(get_profile) for _ in range(5)]
+        profiles = [future.result() for future in futures]
+    assert profiles == [{"userName": "mtamizi"}] * 5
+    assert len(calls) == 1
+    # Each caller gets its own parsed result
+    assert profiles[0] is not profiles[1]
+    assert authed_client._inflight == {}
+
+
+def test_connectapi_single_flight_error(
+    authed_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    def request(*args, **kwargs):
+        raise GarthException(msg="boom")
+
+    monkeypatch.setattr(authed_client, "request", request)
+    with pytest.raises(GarthException):
+        authed_client.connectapi("/path")
+    assert authed_client._inflight == {}
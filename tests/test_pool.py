@@ -0,0 +1,136 @@
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from garth import SleepData
+from garth.http import Client
+from garth.pool import ClientPool
+from garth.ratelimit import RateLimiter
+
+
+def test_add(authed_client: Client, monkeypatch: pytest.MonkeyPatch):
+    token = authed_client.dumps()
+    monkeypatch.setenv("GARTH_TOKEN", token)
+    with ClientPool(max_workers=4, timeout=30) as pool:
+        a = pool.add("a", token)
+        b = pool.add("b")
+        assert list(pool) == ["a", "b"]
+        assert "a" in pool and len(pool) == 2
+        assert pool["a"] is a
+        assert a.oauth2_token == authed_client.oauth2_token
+        # Accounts aren't resumed from the environment
+        assert b.oauth1_token is None
+        assert a.timeout == b.timeout == 30
+        assert a.sess is not b.sess
+        assert a.sess.adapters["https://"] is b.sess.adapters["https://"]
+        assert a.executor is b.executor
+        with pytest.raises(ValueError):
+            pool.add("a")
+
+
+def test_submit():
+    with ClientPool(max_workers=2) as pool:
+        client = pool.add("a")
+        future = pool.submit("a", lambda c, x: (c, x), 1)
+        assert future.result() == (client, 1)
+        assert pool.submit_all(lambda c: 1 / 0)["a"].exception()
+        with pytest.raises(KeyError):
+            pool.submit("b", print)
+    with pytest.raises(RuntimeError):
+        pool.submit("a", print)
+
+
+def test_per_account_limit():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def task(client: Client):
+        with lock:
+            running.append(client)
+            peak.append(running.count(client))
+        time.sleep(0.02)
+        with lock:
+            running.remove(client)
+
+    with ClientPool(max_workers=8, max_per_account=2) as pool:
+        pool.add("a")
+        pool.add("b")
+        futures = [pool.submit(name, task) for name in "ab" * 8]
+        for future in futures:
+            future.result()
+    assert max(peak) == 2
+
+
+def test_round_robin():
+    order = []
+    blocked = threading.Event()
+
+    def task(client: Client, name: str):
+        blocked.wait()
+        order.append(name)
+
+    with ClientPool(max_workers=1) as pool:
+        pool.add("a")
+        pool.add("b")
+        pool.submit("a", task, "a1")
+        pool.submit("a", task, "a2")
+        pool.submit("a", task, "a3")
+        pool.submit("b", task, "b1")
+        blocked.set()
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+def test_remove_cancels_queued():
+    started = threading.Event()
+    blocked = threading.Event()
+
+    def task(client: Client):
+        started.set()
+        return blocked.wait()
+
+    with ClientPool(max_workers=1) as pool:
+        pool.add("a")
+        running = pool.submit("a", task)
+        queued = pool.submit("a", print)
+        started.wait()
+        pool.remove("a")
+        blocked.set()
+    assert running.result()
+    assert queued.cancelled()
+    assert "a" not in pool
+
+
+def test_close_removed_client(authed_client: Client, vcr):
+    token = authed_client.dumps()
+    cassette = (
+        Path(__file__).parent
+        / "data"
+        / "cassettes"
+        / "test_sleep_data_list.yaml"
+    )
+    with ClientPool(max_workers=4) as pool:
+        pool.add("a", token)
+        b = pool.add("b", token)
+        pool.remove("a").close()
+        with vcr.use_cassette(str(cassette)):
+            sleep_data = SleepData.list(
+                date(2021, 7, 20), 20, client=b, max_workers=1
+            )
+        assert len(sleep_data) == 20
+
+
+def test_rate_limited_adapter():
+    with ClientPool(rate_limiter=RateLimiter()) as pool:
+        a = pool.add("a")
+        b = pool.add("b")
+        retry = a.sess.adapters["https://"].max_retries
+        assert not retry.respect_retry_after_header
+        assert 429 not in retry.status_forcelist
+        # A limiter set on one account gives it its own adapter
+        b.configure(rate_limiter=RateLimiter())
+        assert b.adapter is not a.adapter
+        assert b.rate_limiter is not a.rate_limiter
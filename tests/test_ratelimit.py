@@ -0,0 +1,74 @@
+import time
+from email.utils import formatdate
+
+from garth.ratelimit import RateLimiter, retry_after
+
+
+def test_retry_after():
+    assert retry_after(None) is None
+    assert retry_after("") is None
+    assert retry_after("3") == 3
+    assert retry_after("-1") == 0
+    assert retry_after("soon") is None
+    delay = retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert delay is not None
+    assert 28 < delay <= 30
+
+
+def test_token_bucket():
+    limiter = RateLimiter(rate=10, burst=2, max_concurrency=10)
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    # Bucket is empty until it refills at 10 per second
+    assert 0 < limiter.try_acquire() <= 0.1
+    assert limiter.in_flight == 2
+
+
+def test_concurrency_limit():
+    limiter = RateLimiter(rate=100, burst=100, max_concurrency=2)
+    limiter.acquire()
+    limiter.acquire()
+    assert limiter.try_acquire() > 0
+    limiter.release(200)
+    assert limiter.try_acquire() == 0
+
+
+def test_aimd():
+    limiter = RateLimiter(rate=100, burst=100, max_concurrency=8)
+    limiter.acquire()
+    limiter.release(429, retry_after=0)
+    assert limiter.concurrency == 4
+    assert limiter.throttled == 1
+    # About one more slot per window of successes
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(200)
+    concurrency = limiter.concurrency
+    assert 4.9 < concurrency < 5
+    # Errors other than 429 leave concurrency alone
+    limiter.acquire()
+    limiter.release(500)
+    limiter.acquire()
+    limiter.release(None)
+    assert limiter.concurrency == concurrency
+    assert limiter.in_flight == 0
+
+
+def test_backoff():
+    limiter = RateLimiter(max_backoff=10)
+    limiter.acquire()
+    limiter.release(429, retry_after=5)
+    assert 4 < limiter.backoff <= 5
+    assert limiter.try_acquire() > 4
+
+    # Without Retry-After, backoff doubles up to max_backoff
+    limiter = RateLimiter(max_backoff=3)
+    for expected in (1, 2, 3, 3):
+        limiter._blocked_until = 0
+        limiter.acquire()
+        limiter.release(429)
+        assert expected - 0.1 < limiter.backoff <= expected
+    limiter._blocked_until = 0
+    limiter.acquire()
+    limiter.release(200)
+    assert limiter._backoff == 1
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from garth import SleepData
+from garth.http import Client
+from garth.sync import Sync, SyncStore
+
+
+CASSETTES = Path(__file__).parent / "data" / "cassettes"
+
+
+@dataclass
+class Steps:
+    calendar_date: date
+    total_steps: int
+
+    # Steps per day as the API would return them
+    days: ClassVar[dict[date, int]] = {}
+    requests: ClassVar[list[tuple[date, int]]] = []
+
+    @classmethod
+    def list(cls, end, days, *, client=None):
+        cls.requests.append((end, days))
+        return [
+            cls(day, steps)
+            for day, steps in sorted(cls.days.items())
+            if end - timedelta(days=days - 1) <= day <= end
+        ]
+
+
+@pytest.fixture
+def steps():
+    Steps.days = {}
+    Steps.requests = []
+    return Steps
+
+
+@pytest.fixture
+def sync(tmp_path, authed_client: Client):
+    store = SyncStore(str(tmp_path / "sync.sqlite"))
+    yield Sync(
+        store, settle_days=2, days=5, client=authed_client, account="alice"
+    )
+    store.close()
+
+
+def test_sync_backfills_then_fetches_new_days(sync: Sync, steps):
+    steps.days = {date(2025, 7, d): 1000 * d for d in range(1, 11)}
+
+    result = sync.run(steps, "2025-07-10")
+    assert steps.requests == [(date(2025, 7, 10), 5)]
+    assert result.start == date(2025, 7, 6)
+    assert result.changed == [date(2025, 7, d) for d in range(6, 11)]
+    assert [s.total_steps for s in result.items] == [
+        1000 * d for d in range(6, 11)
+    ]
+    # The last 2 days may still change
+    assert result.watermark == date(2025, 7, 8)
+
+    # The next day fetches from after the watermark, and only reports
+    # days that are new or changed
+    steps.days[date(2025, 7, 10)] = 12000
+    steps.days[date(2025, 7, 11)] = 5000
+    del steps.days[date(2025, 7, 9)]
+    result = sync.run(steps, "2025-07-11")
+    assert steps.requests[-1] == (date(2025, 7, 11), 3)
+    assert result.changed == [date(2025, 7, d) for d in (9, 10, 11)]
+    assert [s.total_steps for s in result.items] == [12000, 5000]
+    assert result.watermark == date(2025, 7, 9)
+
+    # Nothing changed
+    result = sync.run(steps, "2025-07-11")
+    assert steps.requests[-1] == (date(2025, 7, 11), 2)
+    assert result.changed == [] and result.items == []
+
+
+def test_sync_store_is_per_account_and_class(
+    sync: Sync, steps, authed_client: Client
+):
+    steps.days = {date(2025, 7, 10): 1000}
+    sync.run(steps, "2025-07-10")
+    assert sync.store.watermark("alice", "Steps") == date(2025, 7, 8)
+    assert sync.store.watermark("bob", "Steps") is None
+    assert sync.store.hashes("alice", "Steps").keys() == {date(2025, 7, 10)}
+
+    bob = Sync(sync.store, client=authed_client, account="bob", days=5)
+    assert bob.run(steps, "2025-07-10").changed == [date(2025, 7, 10)]
+    assert steps.requests[-1] == (date(2025, 7, 10), 5)
+
+    sync.store.reset("alice")
+    assert sync.store.watermark("alice", "Steps") is None
+    assert sync.store.watermark("bob", "Steps") == date(2025, 7, 7)
+
+
+def test_sync_persists(tmp_path, steps, authed_client: Client):
+    path = str(tmp_path / "sync.sqlite")
+    steps.days = {date(2025, 7, 10): 1000}
+    store = SyncStore(path)
+    Sync(store, client=authed_client, account="alice").run(steps, "2025-07-10")
+    store.close()
+
+    store = SyncStore(path)
+    result = Sync(store, client=authed_client, account="alice").run(
+        steps, "2025-07-10"
+    )
+    assert result.changed == []
+    assert steps.requests[-1] == (date(2025, 7, 10), 3)
+    store.close()
+
+
+def test_sync_up_to_date(sync: Sync, steps):
+    sync.settle_days = 0
+    sync.run(steps, "2025-07-10")
+    result = sync.run(steps, "2025-07-10")
+    assert result.start is None
+    assert result.watermark == date(2025, 7, 10)
+    assert len(steps.requests) == 1
+
+
+def test_sync_data_class(sync: Sync, vcr):
+    sync.days = 20
+    cassette = CASSETTES / "test_sleep_data_list.yaml"
+    with vcr.use_cassette(str(cassette)):
+        result = sync.run(SleepData, "2021-07-20", max_workers=1)
+    assert result.changed[-1] == date(2021, 7, 20)
+    assert [s.daily_sleep_dto.calendar_date for s in result.items] == (
+        result.changed
+    )
+    assert result.watermark == date(2021, 7, 18)
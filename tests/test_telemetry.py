@@ -1,3 +1,6 @@
+import gc
+import threading
+import weakref
 from unittest.mock import MagicMock
 
 import pytest
@@ -39,6 +42,14 @@ def test_sanitize_oauth_tokens():
     assert "secret1" not in result
 
 
+def test_sanitize_truncated_json():
+    text = '{"access_token": "abc123", "refresh_token": "xyz7'
+    result = sanitize(text)
+    assert "abc123" not in result
+    assert "xyz7" not in result
+    assert result.count("[REDACTED]") == 2
+
+
 def test_sanitize_query_params():
     text = "password=mysecret&username=user"
     result = sanitize(text)
@@ -88,6 +99,7 @@ def test_telemetry_enabled_request(authed_client: Client, monkeypatch):
     assert profile is not None
     assert "displayName" in profile
 
+    assert authed_client.telemetry.flush(timeout=5)
     assert len(captured_data) == 1
     assert captured_data[0]["method"] == "GET"
     assert "userprofile-service" in captured_data[0]["url"]
@@ -173,9 +185,10 @@ def test_response_hook_with_string_body():
     response.request.body = '{"password": "secret"}'
     response.status_code = 200
     response.headers = {"Content-Type": "application/json"}
-    response.text = '{"access_token": "token123"}'
+    response.content = b'{"access_token": "token123"}'
 
     t._response_hook(response)
+    assert t.flush(timeout=5)
 
     assert len(captured_data) == 1
     data = captured_data[0]
@@ -202,9 +215,10 @@ def test_response_hook_with_bytes_body():
     response.request.body = b'{"password": "secret"}'
     response.status_code = 200
     response.headers = {"Content-Type": "application/json"}
-    response.text = '{"data": "ok"}'
+    response.content = b'{"data": "ok"}'
 
     t._response_hook(response)
+    assert t.flush(timeout=5)
 
     assert len(captured_data) == 1
     assert "secret" not in captured_data[0]["request_body"]
@@ -224,9 +238,10 @@ def test_response_hook_no_body():
     response.request.body = None
     response.status_code = 200
     response.headers = {"Content-Type": "application/json"}
-    response.text = '{"data": "ok"}'
+    response.content = b'{"data": "ok"}'
 
     t._response_hook(response)
+    assert t.flush(timeout=5)
 
     assert len(captured_data) == 1
     assert "request_body" not in captured_data[0]
@@ -257,10 +272,11 @@ def test_response_hook_handles_exceptions():
     response.request.body = None
     response.status_code = 200
     response.headers = {}
-    response.text = "{}"
+    response.content = b"{}"
 
-    # Should not raise
+    # Should not raise, on the request thread or the worker
     t._response_hook(response)
+    assert t.flush(timeout=5)
 
 
 def test_scrubbing_callback_bypasses_logfire_scrubbing():
@@ -414,3 +430,129 @@ def test_session_id_unique():
     t2 = Telemetry()
     assert t1.session_id != t2.session_id
     assert len(t1.session_id) == 16
+
+
+def _response():
+    response = MagicMock()
+    response.request.method = "GET"
+    response.request.url = "https://example.com/api"
+    response.request.headers = {}
+    response.request.body = None
+    response.status_code = 200
+    response.headers = {}
+    response.content = b"{}"
+    return response
+
+
+def test_response_hook_runs_in_background():
+    started, release = threading.Event(), threading.Event()
+    handled = []
+    threads = set()
+
+    def callback(data):
+        threads.add(threading.current_thread())
+        started.set()
+        release.wait(5)
+        handled.append(data)
+
+    t = Telemetry(queue_size=2)
+    t.enabled = True
+    t.callback = callback
+
+    # The hook returns while the callback is still blocked
+    t._response_hook(_response())
+    assert started.wait(5)
+    for _ in range(4):
+        t._response_hook(_response())
+    assert handled == []
+    # One response is with the worker and two are queued
+    assert t.dropped == 2
+
+    release.set()
+    assert t.flush(timeout=5)
+    assert len(handled) == 3
+    assert threading.current_thread() not in threads
+    assert t.flush() is True
+
+
+def test_flush_without_requests():
+    assert Telemetry().flush(timeout=1) is True
+
+
+def test_response_hook_caps_bodies():
+    captured_data = []
+    t = Telemetry(max_body_size=24)
+    t.enabled = True
+    t.callback = captured_data.append
+
+    response = _response()
+    response.request.body = b"x" * 100
+    response.content = b'{"access_token": "' + b"a" * 100 + b'"}'
+    t._response_hook(response)
+    # Only the captured fields are queued, not the response
+    ref = weakref.ref(response)
+    del response
+    gc.collect()
+    assert ref() is None
+    assert t.flush(timeout=5)
+
+    data = captured_data[0]
+    assert data["request_body"] == "x" * 24
+    assert data["response_body"] == '{"access_token": "[REDACTED]"'
+
+
+def test_response_hook_uncapped_by_default():
+    captured_data = []
+    t = Telemetry()
+    t.enabled = True
+    t.callback = captured_data.append
+
+    response = _response()
+    response.content = b"x" * 100_000
+    t._response_hook(response)
+    assert t.flush(timeout=5)
+    assert len(captured_data[0]["response_body"]) == 100_000
+
+
+def test_batch_callback():
+    started, release = threading.Event(), threading.Event()
+    batches = []
+
+    def batch_callback(records):
+        started.set()
+        release.wait(5)
+        batches.append(records)
+
+    t = Telemetry(batch_size=3)
+    t.enabled = True
+    t.configure(batch_callback=batch_callback)
+    assert not t._logfire_configured
+
+    t._response_hook(_response())
+    assert started.wait(5)
+    for _ in range(4):
+        t._response_hook(_response())
+    release.set()
+    assert t.flush(timeout=5)
+    # Queued responses are delivered together, up to batch_size at a time
+    assert [len(batch) for batch in batches] == [1, 3, 1]
+    assert batches[1][0]["status_code"] == 200
+
+
+def test_close_stops_worker():
+    handled = []
+    client = Client(telemetry_enabled=True, telemetry_callback=handled.append)
+    client.telemetry._response_hook(_response())
+    worker = client.telemetry._worker
+    assert worker.is_alive()
+
+    client.close()
+    assert not worker.is_alive()
+    assert len(handled) == 1
+    assert client.telemetry.close() is True
+
+    # A later response starts a new worker
+    client.telemetry._response_hook(_response())
+    assert client.telemetry.flush(timeout=5)
+    assert len(handled) == 2
+    assert client.telemetry.close(timeout=5)
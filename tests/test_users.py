@@ -1,6 +1,7 @@
 import pytest
 
 from garth import UserProfile, UserSettings
+from garth.cache import MemoryCache
 from garth.http import Client
 
 
@@ -25,3 +26,12 @@ def test_user_settings_sleep_windows(authed_client: Client):
         assert hasattr(window, "sleep_window_frequency")
         assert hasattr(window, "start_sleep_time_seconds_from_midnight")
         assert hasattr(window, "end_sleep_time_seconds_from_midnight")
+
+
+def test_user_profile_memory_cache(authed_client: Client, vcr):
+    authed_client.configure(cache=MemoryCache())
+    with vcr.use_cassette("test_user_profile.yaml"):
+        profile = UserProfile.get(client=authed_client)
+    assert UserProfile.get(client=authed_client) == profile
+    assert authed_client.cache is not None
+    assert (authed_client.cache.hits, authed_client.cache.misses) == (1, 1)
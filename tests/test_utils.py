@@ -1,13 +1,29 @@
+import copy
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from typing import Any
 
+import pytest
+
+import garth.utils
 from garth.utils import (
     asdict,
+    bounded_map,
+    build,
     camel_to_snake,
     camel_to_snake_dict,
+    connect_sqlite,
+    deferred,
+    dumps,
     format_end_date,
+    loads,
     remove_dto_suffix,
     remove_dto_suffix_from_dict,
+    trusted,
 )
 
 
@@ -19,6 +35,52 @@ def test_camel_to_snake_dict():
     assert camel_to_snake_dict({"hiThereHuman": "hi"}) == {
         "hi_there_human": "hi"
     }
+    camel = {
+        "sleepLevels": [{"startGMT": 1}, 2, [{"notConverted": 3}]],
+        "dailySleepDTO": {"sleepScores": {"totalDuration": 4}},
+        "calendarDate": "2023-07-20",
+    }
+    snake = camel_to_snake_dict(camel)
+    assert snake == {
+        "sleep_levels": [{"start_gmt": 1}, 2, [{"notConverted": 3}]],
+        "daily_sleep_dto": {"sleep_scores": {"total_duration": 4}},
+        "calendar_date": "2023-07-20",
+    }
+    assert list(snake) == ["sleep_levels", "daily_sleep_dto", "calendar_date"]
+    # The input is left untouched
+    assert camel["sleepLevels"][0] == {"startGMT": 1}
+
+    # Nesting deeper than the recursion limit
+    deep: dict = {}
+    node = deep
+    for _ in range(5000):
+        node["childNode"] = node = {}
+    node = camel_to_snake_dict(deep)
+    for _ in range(5000):
+        node = node["child_node"]
+    assert node == {}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads(monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr(garth.utils, "orjson", None)
+    content = (
+        b'{"calendarDate": "2023-07-20", "heartRateValues": [[1, 60]], '
+        b'"sleepLevels": [{"startGMT": "x", "activityLevel": 1.0}]}'
+    )
+    assert loads(content) == {
+        "calendarDate": "2023-07-20",
+        "heartRateValues": [[1, 60]],
+        "sleepLevels": [{"startGMT": "x", "activityLevel": 1.0}],
+    }
+    assert loads(content, snake_case=True) == {
+        "calendar_date": "2023-07-20",
+        "heart_rate_values": [[1, 60]],
+        "sleep_levels": [{"start_gmt": "x", "activity_level": 1.0}],
+    }
+    assert loads(b'[{"fooBar": 1}]', snake_case=True) == [{"foo_bar": 1}]
+    assert loads('"fooBar"', snake_case=True) == "fooBar"
 
 
 def test_format_end_date():
@@ -27,6 +89,37 @@ def test_format_end_date():
     assert format_end_date(date(2021, 1, 1)) == date(2021, 1, 1)
 
 
+def test_bounded_map():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(i):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return i * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(bounded_map(executor, work, range(10), 3))
+    assert results == [i * 2 for i in range(10)]
+    assert peak <= 3
+
+
+def test_bounded_map_unordered():
+    def work(i):
+        time.sleep(0.05 * (3 - i))
+        return i
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(bounded_map(executor, work, range(3), 3, ordered=False))
+    assert results == [2, 1, 0]
+
+
 @dataclass
 class AsDictTestClass:
     name: str
@@ -67,6 +160,40 @@ def test_asdict():
     assert asdict(None) is None
 
 
+@dataclass
+class AsDictNestedTestClass:
+    readings: list[list[int | None]]
+    children: list[AsDictTestClass]
+    updated: datetime | None = None
+    extra: Any = None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_asdict_nested(monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr(garth.utils, "orjson", None)
+    readings = [[1, 60], [2, None]]
+    instance = AsDictNestedTestClass(
+        readings,
+        [AsDictTestClass("Test", 20, date(2025, 7, 10))],
+        datetime(2025, 7, 10, 8, 30),
+        {"key": [1, 2]},
+    )
+    expected = {
+        "readings": [[1, 60], [2, None]],
+        "children": [{"name": "Test", "age": 20, "birth_date": "2025-07-10"}],
+        "updated": "2025-07-10T08:30:00",
+        "extra": {"key": [1, 2]},
+    }
+    result = asdict(instance)
+    assert result == expected
+    # Lists are copies
+    assert result["readings"] is not readings
+    assert result["readings"][0] is not readings[0]
+    assert json.loads(dumps(instance)) == expected
+    assert json.loads(dumps([instance])) == [expected]
+
+
 def test_remove_dto_suffix():
     # Keys ending with _dto should have suffix removed
     assert remove_dto_suffix("activity_type_dto") == "activity_type"
@@ -130,3 +257,119 @@ def test_remove_dto_suffix_from_dict():
     # Dict with no _dto keys
     input_dict = {"activity_id": 123, "name": "test"}
     assert remove_dto_suffix_from_dict(input_dict) == input_dict
+
+
+def test_build_trusted():
+    from pydantic import Field, ValidationError
+    from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+    @pydantic_dataclass
+    class Level:
+        start: datetime
+        value: float
+
+    @pydantic_dataclass
+    class Day:
+        calendar_date: date
+        values: list[list[int | None]]
+        levels: list[Level] | None
+        best: Level | None = None
+        note: str = "none"
+        timestamp: int = Field(0, alias="date")
+
+    data = {
+        "calendar_date": "2023-07-20",
+        "values": [[1, 60], [2, None]],
+        "levels": [{"start": "2023-07-20T05:30:00.0", "value": 1.0}],
+        "best": None,
+        "extra": "ignored",
+        "date": 1689831000000,
+    }
+    validated = build(Day, data)
+    with trusted():
+        day = build(Day, data)
+    assert day == validated
+    assert isinstance(day, Day)
+    assert day.levels and day.levels[0].start == datetime(2023, 7, 20, 5, 30)
+    assert day.note == "none"
+    assert day.timestamp == 1689831000000
+    # Values other than dates and data classes aren't validated
+    with trusted():
+        assert build(Day, {**data, "values": "x"}).values == "x"
+        # Fields with an alias are only read from it
+        assert build(Day, {**data, "timestamp": 1}).timestamp == data["date"]
+    with pytest.raises(ValidationError):
+        build(Day, {**data, "values": "x"})
+    # Missing fields still raise
+    with trusted(), pytest.raises(ValidationError):
+        build(Day, {"values": []})
+
+
+def test_build_deferred():
+    from pydantic import ValidationError
+    from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+    @pydantic_dataclass
+    class Level:
+        start: datetime
+        value: float
+
+    @pydantic_dataclass
+    class Summary:
+        seconds: int
+        best: Level | None = None
+
+    @pydantic_dataclass
+    class Night:
+        summary: Summary
+        levels: list[Level] | None = None
+        score: int | None = None
+
+    data = {
+        "summary": {"seconds": "60", "best": {"start": 0, "value": 1}},
+        "levels": [{"start": "2023-07-20T05:30:00.0", "value": 1.0}],
+        "score": "80",
+    }
+    validated = build(Night, data)
+    for trust in (False, True):
+        with deferred(), trusted(trust):
+            night = build(Night, data)
+        assert set(night.__dict__["__garth_pending__"]) == {
+            "summary",
+            "levels",
+        }
+        assert night.score == (80 if not trust else "80")
+        copied = copy.copy(night)
+        summary = night.summary
+        assert set(night.__dict__["__garth_pending__"]) == {"levels"}
+        assert night.summary is summary
+        # Copies keep their own pending values
+        assert copied.summary == summary
+        assert copied.levels == validated.levels
+        assert "__garth_pending__" in vars(night)
+        assert summary.seconds == (60 if not trust else "60")
+        assert summary.best == Level(
+            datetime.fromtimestamp(0, timezone.utc), 1
+        )
+        assert night.levels == validated.levels
+        assert "__garth_pending__" not in vars(night)
+    with deferred():
+        assert build(Night, data) == validated
+        # Nested values are validated when read
+        night = build(Night, {**data, "levels": [{"start": "x"}]})
+        with pytest.raises(ValidationError):
+            night.levels
+        with pytest.raises(ValidationError):
+            build(Night, {**data, "score": "x"})
+    # Class attributes still give the defaults
+    assert Night.levels is None
+
+
+def test_connect_sqlite(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    path, conn = connect_sqlite("~/nested/db.sqlite")
+    assert path == str(tmp_path / "nested" / "db.sqlite")
+    # Usable from other threads
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(conn.execute, "SELECT 1").result()
+    conn.close()
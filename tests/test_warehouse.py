@@ -0,0 +1,138 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from garth import (
+    BodyBatteryData,
+    DailySteps,
+    SleepData,
+    WeeklySteps,
+    WeightData,
+)
+from garth.http import Client
+from garth.warehouse import Warehouse
+
+
+CASSETTES = Path(__file__).parent
+
+
+@pytest.fixture
+def warehouse(tmp_path, authed_client: Client, monkeypatch):
+    # Warehouse rows are keyed on the account's profile ID
+    monkeypatch.setattr(
+        authed_client,
+        "_user_profile",
+        {"profileId": 2591602, "userName": "mtamizi"},
+    )
+    warehouse = Warehouse(str(tmp_path / "warehouse.sqlite"))
+    yield warehouse
+    warehouse.close()
+
+
+def test_warehouse_stats(warehouse: Warehouse, authed_client: Client, vcr):
+    end = date(2023, 7, 20)
+    cassette = CASSETTES / "stats" / "cassettes" / "test_daily_steps.yaml"
+    with vcr.use_cassette(str(cassette)):
+        fetched = DailySteps.list(end, 20, client=authed_client)
+    with vcr.use_cassette(str(cassette)) as cassette:
+        stored = DailySteps.list(
+            end, 20, client=authed_client, warehouse=warehouse
+        )
+        assert cassette.play_count == 1
+        # Served from the warehouse without any requests
+        assert (
+            DailySteps.list(end, 10, client=authed_client, warehouse=warehouse)
+            == stored[-10:]
+        )
+        assert cassette.play_count == 1
+    assert stored == fetched
+
+    # Scalar fields are columns, keyed by account and day
+    assert warehouse.execute(
+        'SELECT user_profile_pk, calendar_date, total_steps FROM "DailySteps" '
+        "ORDER BY calendar_date DESC LIMIT 1"
+    ) == [(2591602, "2023-07-20", stored[-1].total_steps)]
+    assert warehouse.missing(DailySteps, date(2023, 6, 30), end, 2591602) == [
+        date(2023, 6, 30)
+    ]
+
+
+def test_warehouse_weekly_stats(
+    warehouse: Warehouse, authed_client: Client, vcr
+):
+    end = date(2023, 7, 20)
+    cassette = CASSETTES / "stats" / "cassettes" / "test_weekly_steps.yaml"
+    with vcr.use_cassette(str(cassette)):
+        weekly = WeeklySteps.list(
+            end, 52, client=authed_client, warehouse=warehouse
+        )
+        assert (
+            WeeklySteps.list(
+                end, 52, client=authed_client, warehouse=warehouse
+            )
+            == weekly
+        )
+    assert len(weekly) == 52
+
+
+def test_warehouse_data(warehouse: Warehouse, authed_client: Client, vcr):
+    end = date(2021, 7, 20)
+    cassette = CASSETTES / "data" / "cassettes" / "test_sleep_data_list.yaml"
+    with vcr.use_cassette(str(cassette)):
+        fetched = SleepData.list(end, 20, client=authed_client, max_workers=1)
+    with vcr.use_cassette(str(cassette)):
+        stored = SleepData.list(
+            end, 20, client=authed_client, max_workers=1, warehouse=warehouse
+        )
+        # Nested objects round trip
+        assert (
+            SleepData.list(end, 20, client=authed_client, warehouse=warehouse)
+            == fetched
+        )
+    assert stored == fetched
+
+
+def test_warehouse_aliases(warehouse: Warehouse, authed_client: Client, vcr):
+    end = date(2025, 6, 15)
+    cassette = CASSETTES / "data" / "cassettes" / "test_weight_data_list.yaml"
+    with vcr.use_cassette(str(cassette)):
+        fetched = WeightData.list(end, 15, client=authed_client)
+    with vcr.use_cassette(str(cassette)):
+        stored = WeightData.list(
+            end, 15, client=authed_client, warehouse=warehouse
+        )
+    assert stored == fetched
+    assert [w.timestamp_local for w in stored] == [
+        w.timestamp_local for w in fetched
+    ]
+
+
+def test_warehouse_refetches_recent_days():
+    warehouse = Warehouse(":memory:", settle_days=1)
+    today = date.today()
+    start = today - timedelta(days=3)
+    warehouse.put(DailySteps, [], start, today, 1)
+    assert warehouse.missing(DailySteps, start, today, 1) == [today]
+    assert warehouse.missing(DailySteps, start, today, 2) == [
+        start + timedelta(days=i) for i in range(4)
+    ]
+    warehouse.close()
+
+
+def test_warehouse_body_battery_events(
+    warehouse: Warehouse, authed_client: Client, vcr
+):
+    cassette = (
+        CASSETTES / "data" / "cassettes" / "test_body_battery_data_get.yaml"
+    )
+    with vcr.use_cassette(str(cassette)):
+        fetched = BodyBatteryData.list("2023-07-20", 1, client=authed_client)
+    with vcr.use_cassette(str(cassette)):
+        # Sleep events start the evening before but belong to the day asked
+        stored = BodyBatteryData.list(
+            "2023-07-20", 1, client=authed_client, warehouse=warehouse
+        )
+    assert fetched
+    assert stored == fetched
+    assert {item.calendar_date for item in stored} == {date(2023, 7, 20)}